@@ -0,0 +1,49 @@
+"""add rescore_jobs table
+
+Revision ID: 14ebd3cbc77a
+Revises: f7eca12d694a
+Create Date: 2026-10-18 11:24:05.118342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '14ebd3cbc77a'
+down_revision: Union[str, None] = 'f7eca12d694a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('rescore_jobs',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('scope', sa.String(), nullable=False),
+    sa.Column('scope_id', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('processed', sa.Integer(), nullable=False),
+    sa.Column('failed', sa.Integer(), nullable=False),
+    sa.Column('processed_at_start', sa.Integer(), nullable=False),
+    sa.Column('checkpoint_id', sa.String(), nullable=True),
+    sa.Column('concurrency', sa.Integer(), nullable=False),
+    sa.Column('target_per_minute', sa.Float(), nullable=True),
+    sa.Column('model_used', sa.String(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('triggered_by_user_id', sa.String(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['triggered_by_user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('rescore_jobs')
@@ -0,0 +1,28 @@
+"""add failed_ids to rescore_jobs
+
+Revision ID: 24e220b55022
+Revises: 313e1e706487
+Create Date: 2026-10-19 09:12:37.504118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '24e220b55022'
+down_revision: Union[str, None] = '313e1e706487'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('rescore_jobs', sa.Column('failed_ids', sa.JSON(), server_default='[]', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('rescore_jobs', 'failed_ids')
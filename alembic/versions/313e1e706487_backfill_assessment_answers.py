@@ -0,0 +1,82 @@
+"""unique assessment_answers per draft question; backfill from drafts' JSON
+
+Revision ID: 313e1e706487
+Revises: 4a07368dcd45
+Create Date: 2026-10-18 16:05:41.220817
+
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '313e1e706487'
+down_revision: Union[str, None] = '4a07368dcd45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+drafts = sa.table(
+    'assessment_drafts',
+    sa.column('id', sa.String),
+    sa.column('answers', sa.JSON),
+)
+answers = sa.table(
+    'assessment_answers',
+    sa.column('id', sa.String),
+    sa.column('assessment_id', sa.String),
+    sa.column('question_id', sa.String),
+    sa.column('answer_text', sa.Text),
+)
+questions = sa.table('questions', sa.column('id', sa.String))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    # Keep one row per (draft, question) before the key becomes unique
+    keep = sa.select(sa.func.min(answers.c.id)).group_by(answers.c.assessment_id, answers.c.question_id)
+    conn.execute(answers.delete().where(answers.c.id.not_in(keep.scalar_subquery())))
+
+    op.create_index('ix_assessment_answers_draft_question', 'assessment_answers',
+                    ['assessment_id', 'question_id'], unique=True)
+    op.create_index('ix_assessment_answers_question', 'assessment_answers', ['question_id'])
+
+    # Copy the JSON answers into rows. Answers to questions that no longer exist
+    # can't satisfy the foreign key and stay in the (retained) JSON column only.
+    known = set(conn.execute(sa.select(questions.c.id)).scalars())
+    existing = set(conn.execute(sa.select(answers.c.assessment_id, answers.c.question_id)).tuples())
+    batch = []
+    for draft_id, blob in conn.execute(sa.select(drafts.c.id, drafts.c.answers).where(drafts.c.answers.is_not(None))).all():
+        for question_id, text in (blob or {}).items():
+            if question_id in known and (draft_id, question_id) not in existing:
+                batch.append({'id': str(uuid.uuid4()), 'assessment_id': draft_id,
+                              'question_id': question_id, 'answer_text': text})
+        if len(batch) >= BATCH_SIZE:
+            op.bulk_insert(answers, batch)
+            batch = []
+    if batch:
+        op.bulk_insert(answers, batch)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Write the rows back into the JSON column the previous code reads
+    conn = op.get_bind()
+    by_draft = defaultdict(dict)
+    for draft_id, question_id, text in conn.execute(
+        sa.select(answers.c.assessment_id, answers.c.question_id, answers.c.answer_text)
+    ).all():
+        by_draft[draft_id][question_id] = text
+    for draft_id, blob in conn.execute(sa.select(drafts.c.id, drafts.c.answers)).all():
+        if draft_id in by_draft:
+            merged = {**(blob or {}), **by_draft[draft_id]}
+            conn.execute(drafts.update().where(drafts.c.id == draft_id).values(answers=merged))
+
+    op.drop_index('ix_assessment_answers_question', table_name='assessment_answers')
+    op.drop_index('ix_assessment_answers_draft_question', table_name='assessment_answers')
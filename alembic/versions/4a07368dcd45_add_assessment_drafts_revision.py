@@ -0,0 +1,28 @@
+"""add assessment_drafts.revision
+
+Revision ID: 4a07368dcd45
+Revises: 639d38bd2669
+Create Date: 2026-10-18 14:52:17.903561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a07368dcd45'
+down_revision: Union[str, None] = '639d38bd2669'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assessment_drafts', sa.Column('revision', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('assessment_drafts', 'revision')
@@ -0,0 +1,44 @@
+"""backfill created_at and make it NOT NULL on paginated tables
+
+Revision ID: 4bf045df9831
+Revises: 24e220b55022
+Create Date: 2026-10-19 10:03:51.662940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4bf045df9831'
+down_revision: Union[str, None] = '24e220b55022'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keyset cursors seek on (created_at, id); NULLs would be skipped or repeated
+TABLES = {
+    'assessments': True,
+    'assessment_drafts': True,
+    'assessment_templates': True,
+    'mentor_notes': False,
+    'users': False,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, has_updated_at in TABLES.items():
+        # Rows from before timestamps were tracked sort with the oldest ones
+        fallback = f"(SELECT MIN(created_at) FROM {table}), CURRENT_TIMESTAMP"
+        if has_updated_at:
+            fallback = f"updated_at, {fallback}"
+        op.execute(f"UPDATE {table} SET created_at = COALESCE({fallback}) WHERE created_at IS NULL")
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(), nullable=True)
@@ -0,0 +1,40 @@
+"""add template_bundles and template versions
+
+Revision ID: 639d38bd2669
+Revises: e2fb1605ae98
+Create Date: 2026-10-18 14:24:51.380617
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '639d38bd2669'
+down_revision: Union[str, None] = 'e2fb1605ae98'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('template_bundles',
+    sa.Column('template_id', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('etag', sa.String(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['template_id'], ['assessment_templates.id'], ),
+    sa.PrimaryKeyConstraint('template_id', 'version')
+    )
+    op.add_column('assessment_templates', sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('assessment_drafts', sa.Column('template_version', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('assessment_drafts', 'template_version')
+    op.drop_column('assessment_templates', 'version')
+    op.drop_table('template_bundles')
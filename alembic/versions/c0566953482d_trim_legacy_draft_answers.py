@@ -0,0 +1,50 @@
+"""drop answers to deleted questions from drafts; keep them in the legacy JSON only
+
+Revision ID: c0566953482d
+Revises: d11c6727904f
+Create Date: 2026-10-19 14:02:37.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0566953482d'
+down_revision: Union[str, None] = 'd11c6727904f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+drafts = sa.table(
+    'assessment_drafts',
+    sa.column('id', sa.String),
+    sa.column('answers', sa.JSON),
+)
+answers = sa.table(
+    'assessment_answers',
+    sa.column('assessment_id', sa.String),
+    sa.column('question_id', sa.String),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 313e1e706487 copied every answer whose question still exists into
+    # assessment_answers and left the whole blob behind. Drafts are read from
+    # the rows only, so the answers to deleted questions are dropped from the
+    # drafts here on purpose: they can't be stored as rows, aren't part of any
+    # template version and would be rejected on the next save. The JSON column
+    # keeps just those answers as an archive; everything else is cleared.
+    conn = op.get_bind()
+    stored = set(conn.execute(sa.select(answers.c.assessment_id, answers.c.question_id)).tuples())
+    for draft_id, blob in conn.execute(sa.select(drafts.c.id, drafts.c.answers).where(drafts.c.answers.is_not(None))).all():
+        dropped = {q: text for q, text in (blob or {}).items() if (draft_id, q) not in stored}
+        conn.execute(drafts.update().where(drafts.c.id == draft_id).values(answers=dropped or None))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The copied answers are still in assessment_answers; 313e1e706487's
+    # downgrade merges them back over what is left here.
@@ -0,0 +1,109 @@
+"""snapshot bundles for templates published before template_bundles
+
+Revision ID: d11c6727904f
+Revises: 4bf045df9831
+Create Date: 2026-10-19 10:41:08.215734
+
+"""
+import hashlib
+import json
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd11c6727904f'
+down_revision: Union[str, None] = '4bf045df9831'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+templates = sa.table(
+    'assessment_templates',
+    sa.column('id', sa.String),
+    sa.column('name', sa.String),
+    sa.column('description', sa.String),
+    sa.column('is_published', sa.Boolean),
+    sa.column('version', sa.Integer),
+)
+template_questions = sa.table(
+    'assessment_template_questions',
+    sa.column('template_id', sa.String),
+    sa.column('question_id', sa.String),
+    sa.column('order', sa.Integer),
+)
+questions = sa.table(
+    'questions',
+    sa.column('id', sa.String),
+    sa.column('text', sa.String),
+    sa.column('category_id', sa.String),
+)
+categories = sa.table('categories', sa.column('id', sa.String), sa.column('name', sa.String))
+bundles = sa.table(
+    'template_bundles',
+    sa.column('template_id', sa.String),
+    sa.column('version', sa.Integer),
+    sa.column('etag', sa.String),
+    sa.column('payload', sa.JSON),
+    sa.column('created_at', sa.DateTime),
+)
+
+
+def _payload(conn, template) -> dict:
+    # Same shape as template_bundles.build_bundle at version 1
+    rows = conn.execute(
+        sa.select(
+            template_questions.c.order,
+            questions.c.id, questions.c.text, questions.c.category_id,
+            categories.c.name.label('category'),
+        )
+        .join(questions, template_questions.c.question_id == questions.c.id)
+        .outerjoin(categories, questions.c.category_id == categories.c.id)
+        .where(template_questions.c.template_id == template.id)
+        .order_by(template_questions.c.order, questions.c.id)
+    ).all()
+    seen = {}
+    for row in rows:
+        if row.category_id and row.category_id not in seen:
+            seen[row.category_id] = {'id': row.category_id, 'name': row.category}
+    return {
+        'template_id': template.id,
+        'version': 1,
+        'name': template.name,
+        'description': template.description,
+        'categories': list(seen.values()),
+        'questions': [
+            {'id': row.id, 'text': row.text, 'category_id': row.category_id, 'category': row.category, 'order': row.order}
+            for row in rows
+        ],
+    }
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Otherwise the first read of each template would snapshot it, and
+    # concurrent first reads race to insert (template_id, 1)
+    conn = op.get_bind()
+    published = conn.execute(
+        sa.select(templates.c.id, templates.c.name, templates.c.description)
+        .where(templates.c.is_published == True, templates.c.version == 0)
+    ).all()
+    for template in published:
+        payload = _payload(conn, template)
+        body = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        conn.execute(bundles.insert().values(
+            template_id=template.id,
+            version=1,
+            etag='"%s"' % hashlib.sha256(body).hexdigest()[:32],
+            payload=payload,
+            created_at=datetime.utcnow(),
+        ))
+        conn.execute(templates.update().where(templates.c.id == template.id).values(version=1))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Data only: the snapshots stay valid version-1 bundles
+    pass
@@ -0,0 +1,35 @@
+"""add updated_at to assessments, templates and questions
+
+Revision ID: e2fb1605ae98
+Revises: ec4c99245581
+Create Date: 2026-10-18 13:58:40.120933
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2fb1605ae98'
+down_revision: Union[str, None] = 'ec4c99245581'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assessments', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.add_column('assessment_templates', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.add_column('questions', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE assessments SET updated_at = created_at")
+    op.execute("UPDATE assessment_templates SET updated_at = created_at")
+    op.execute("UPDATE questions SET updated_at = CURRENT_TIMESTAMP")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('questions', 'updated_at')
+    op.drop_column('assessment_templates', 'updated_at')
+    op.drop_column('assessments', 'updated_at')
@@ -0,0 +1,58 @@
+"""add scoring_jobs queue and assessment scoring status
+
+Revision ID: e5a5059b6158
+Revises: a345d98395e5
+Create Date: 2026-10-18 09:12:41.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a5059b6158'
+down_revision: Union[str, None] = 'a345d98395e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('assessments', sa.Column('template_id', sa.String(), nullable=True))
+    op.create_foreign_key(None, 'assessments', 'assessment_templates', ['template_id'], ['id'])
+    # Rows that predate the queue were scored inline
+    op.add_column('assessments', sa.Column('scoring_status', sa.String(), nullable=False, server_default='scored'))
+    op.add_column('assessment_drafts', sa.Column('answers', sa.JSON(), nullable=True))
+    op.create_table('scoring_jobs',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('assessment_id', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('run_after', sa.DateTime(), nullable=False),
+    sa.Column('locked_by', sa.String(), nullable=True),
+    sa.Column('locked_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('triggered_by', sa.String(), nullable=False),
+    sa.Column('triggered_by_user_id', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['assessment_id'], ['assessments.id'], ),
+    sa.ForeignKeyConstraint(['triggered_by_user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_scoring_jobs_claim', 'scoring_jobs', ['status', 'run_after'], unique=False)
+    op.create_index('ix_scoring_jobs_assessment_id', 'scoring_jobs', ['assessment_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_scoring_jobs_assessment_id', table_name='scoring_jobs')
+    op.drop_index('ix_scoring_jobs_claim', table_name='scoring_jobs')
+    op.drop_table('scoring_jobs')
+    op.drop_column('assessment_drafts', 'answers')
+    op.drop_column('assessments', 'scoring_status')
+    op.drop_constraint(None, 'assessments', type_='foreignkey')
+    op.drop_column('assessments', 'template_id')
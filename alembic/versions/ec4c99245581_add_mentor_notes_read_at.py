@@ -0,0 +1,28 @@
+"""add mentor_notes.read_at
+
+Revision ID: ec4c99245581
+Revises: ee796190db27
+Create Date: 2026-10-18 13:31:08.446215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ec4c99245581'
+down_revision: Union[str, None] = 'ee796190db27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('mentor_notes', sa.Column('read_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('mentor_notes', 'read_at')
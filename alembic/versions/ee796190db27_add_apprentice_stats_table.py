@@ -0,0 +1,39 @@
+"""add apprentice_stats table
+
+Revision ID: ee796190db27
+Revises: fadb6df6c790
+Create Date: 2026-10-18 13:05:22.617340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ee796190db27'
+down_revision: Union[str, None] = 'fadb6df6c790'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('apprentice_stats',
+    sa.Column('apprentice_id', sa.String(), nullable=False),
+    sa.Column('submission_count', sa.Integer(), nullable=False),
+    sa.Column('last_submission_at', sa.DateTime(), nullable=True),
+    sa.Column('scored_count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.Column('category_scores', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['apprentice_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('apprentice_id')
+    )
+    # Populate from existing data with: python -m app.services.apprentice_stats
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('apprentice_stats')
@@ -0,0 +1,52 @@
+"""add composite and partial indexes for hot query paths
+
+Revision ID: fadb6df6c790
+Revises: ca8fccdf77a0
+Create Date: 2026-10-18 12:47:13.284511
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fadb6df6c790'
+down_revision: Union[str, None] = 'ca8fccdf77a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_assessment_drafts_apprentice_submitted', 'assessment_drafts', ['apprentice_id', 'is_submitted'], unique=False)
+    op.create_index(
+        'ix_assessment_drafts_submitted_created', 'assessment_drafts', ['apprentice_id', 'created_at', 'id'], unique=False,
+        postgresql_where=sa.text('is_submitted = true'),
+        sqlite_where=sa.text('is_submitted = 1'),
+    )
+    op.create_index('ix_assessments_apprentice_created', 'assessments', ['apprentice_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_score_history_assessment_scored', 'assessment_score_history', ['assessment_id', 'scored_at', 'id'], unique=False)
+    op.create_index('ix_score_history_apprentice_scored', 'assessment_score_history', ['apprentice_id', 'scored_at', 'id'], unique=False)
+    op.create_index(op.f('ix_mentor_apprentice_mentor_id'), 'mentor_apprentice', ['mentor_id'], unique=False)
+    op.create_index('ix_mentor_notes_assessment_created', 'mentor_notes', ['assessment_id', 'created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_apprentice_invitations_pending', 'apprentice_invitations', ['apprentice_email', 'mentor_id', 'expires_at'], unique=False,
+        postgresql_where=sa.text('accepted = false'),
+        sqlite_where=sa.text('accepted = 0'),
+    )
+    op.create_index('ix_template_questions_template_order', 'assessment_template_questions', ['template_id', 'order'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_template_questions_template_order', table_name='assessment_template_questions')
+    op.drop_index('ix_apprentice_invitations_pending', table_name='apprentice_invitations')
+    op.drop_index('ix_mentor_notes_assessment_created', table_name='mentor_notes')
+    op.drop_index(op.f('ix_mentor_apprentice_mentor_id'), table_name='mentor_apprentice')
+    op.drop_index('ix_score_history_apprentice_scored', table_name='assessment_score_history')
+    op.drop_index('ix_score_history_assessment_scored', table_name='assessment_score_history')
+    op.drop_index('ix_assessments_apprentice_created', table_name='assessments')
+    op.drop_index('ix_assessment_drafts_submitted_created', table_name='assessment_drafts')
+    op.drop_index('ix_assessment_drafts_apprentice_submitted', table_name='assessment_drafts')
@@ -15,3 +15,7 @@ class NotFoundException(HTTPException):
 class ValidationException(HTTPException):
     def __init__(self, detail="Invalid input"):
         super().__init__(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail)
+
+class ConflictException(HTTPException):
+    def __init__(self, detail="Conflict"):
+        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
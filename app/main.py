@@ -2,17 +2,33 @@ from fastapi import FastAPI
 from app.routes import user, assessment
 from app.config import init_firebase
 from app.routes import mentor, assessment_draft, invite, question
-from app.exceptions import UnauthorizedException, ForbiddenException, NotFoundException, ValidationException
+from app.exceptions import UnauthorizedException, ForbiddenException, NotFoundException, ValidationException, ConflictException
 from app.routes import admin_template
 from dotenv import load_dotenv
 import os
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from app.services.fast_json import FastJSONResponse
+from app.services.compression import CompressionMiddleware
+from app.services.metrics import MetricsMiddleware, mark_worker_dead, metrics_response, observe_route
 from app.routes import admin_template
 import logging
 from app.routes import assessment_score_history
 from app.routes import apprentices
 from app.routes import mentor_notes
+from app.routes import admin_rescore
+from app.routes import admin_analytics
+from app.routes import templates
+from app.db import all_pool_stats
+from app.services.scoring_queue import ScoringWorkerPool
+from app.services.scoring_cache import scoring_cache_stats
+from app.services import ai_scoring
+from app.services.openai_client import openai_client_stats
+from app.services.email_outbox import EmailDispatcher, outbox_stats
+from app.db import get_db
+from app.services.auth import require_admin
+from sqlalchemy.orm import Session
+from fastapi import Depends
+from contextlib import asynccontextmanager
 
 
 load_dotenv()  # Automatically loads from `.env`
@@ -20,7 +36,31 @@ load_dotenv()  # Automatically loads from `.env`
 # Optional: Confirm loading works
 print("Loaded DB URL:", os.getenv("DATABASE_URL"))
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Scoring workers run in-process; set SCORING_WORKERS=0 to run them elsewhere
+    scoring_pool = None
+    if os.getenv("ENV") != "test" and int(os.getenv("SCORING_WORKERS", "2")) > 0:
+        scoring_pool = ScoringWorkerPool()
+        scoring_pool.start()
+    # Likewise the email outbox dispatcher; EMAIL_DISPATCHER=0 disables it here
+    email_dispatcher = None
+    if os.getenv("ENV") != "test" and os.getenv("EMAIL_DISPATCHER", "1") != "0":
+        email_dispatcher = EmailDispatcher()
+        email_dispatcher.start()
+    yield
+    if scoring_pool:
+        scoring_pool.stop()
+    if email_dispatcher:
+        email_dispatcher.stop()
+    ai_scoring.client.close()
+    mark_worker_dead()
+
+app = FastAPI(lifespan=lifespan, dependencies=[Depends(observe_route)])
+# gzip/brotli/zstd by Accept-Encoding; see app/services/compression.py for per-route levels
+app.add_middleware(CompressionMiddleware)
+# Outermost, so latency includes compression and streamed bodies
+app.add_middleware(MetricsMiddleware)
 
 if os.getenv("ENV") != "test":
     init_firebase()
@@ -38,6 +78,9 @@ app.include_router(mentor.router)
 app.include_router(assessment_score_history.router)
 app.include_router(apprentices.router)
 app.include_router(mentor_notes.router)
+app.include_router(admin_rescore.router)
+app.include_router(admin_analytics.router)
+app.include_router(templates.router)
 
 
 logging.basicConfig(
@@ -49,13 +92,35 @@ logging.basicConfig(
 @app.exception_handler(ForbiddenException)
 @app.exception_handler(NotFoundException)
 @app.exception_handler(ValidationException)
+@app.exception_handler(ConflictException)
 
 async def handle_custom_exceptions(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
 
 @app.get("/")
 def root():
-    return {"message": "T[root]H Assessment API"}
\ No newline at end of file
+    return {"message": "T[root]H Assessment API"}
+
+@app.get("/health/db-pool", dependencies=[Depends(require_admin)])
+def db_pool_health():
+    # Pool internals are operational detail; admins only
+    return all_pool_stats()
+
+@app.get("/health/scoring-cache")
+def scoring_cache_health():
+    return scoring_cache_stats()
+
+@app.get("/health/openai")
+def openai_health():
+    return openai_client_stats(ai_scoring.client)
+
+@app.get("/health/email-outbox")
+def email_outbox_health(db: Session = Depends(get_db)):
+    return outbox_stats(db)
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return metrics_response()
@@ -6,3 +6,14 @@ from .assessment_template import AssessmentTemplate
 from .assessment_answer import AssessmentAnswer
 from .category import Category
 from .question import Question
+from .assessment import Assessment
+from .assessment_score_history import AssessmentScoreHistory
+from .assessment_template_question import AssessmentTemplateQuestion
+from .mentor_note import MentorNote
+from .notification import Notification
+from .scoring_job import ScoringJob
+from .scoring_cache import ScoringCacheEntry
+from .rescore_job import RescoreJob
+from .email_outbox import EmailOutbox
+from .apprentice_stats import ApprenticeStats
+from .template_bundle import TemplateBundle
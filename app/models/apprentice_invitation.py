@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index
 from datetime import datetime, timedelta
 from app.db import Base
 import uuid
@@ -12,4 +12,14 @@ class ApprenticeInvitation(Base):
     apprentice_name = Column(String, nullable=False)
     token = Column(String, unique=True, nullable=False)
     expires_at = Column(DateTime, default=lambda: datetime.utcnow() + timedelta(days=7))
-    accepted = Column(Boolean, default=False)
\ No newline at end of file
+    accepted = Column(Boolean, default=False)
+
+    # Pending-invitation check in invite_apprentice; accepted invitations never match it
+    __table_args__ = (
+        Index(
+            "ix_apprentice_invitations_pending",
+            "apprentice_email", "mentor_id", "expires_at",
+            postgresql_where=accepted == False,
+            sqlite_where=accepted == False,
+        ),
+    )
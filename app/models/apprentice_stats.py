@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Float, JSON
+from datetime import datetime
+from app.db import Base
+
+class ApprenticeStats(Base):
+    """Per-apprentice rollup kept current on submit and (re)score; see app.services.apprentice_stats."""
+    __tablename__ = "apprentice_stats"
+
+    apprentice_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    submission_count = Column(Integer, nullable=False, default=0)
+    last_submission_at = Column(DateTime, nullable=True)
+    # Running sum of each scored assessment's overall score; rescoring swaps the old value out
+    scored_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)
+    # category -> {"score": float, "assessment_id": str, "submitted_at": iso timestamp}
+    category_scores = Column(JSON, nullable=False, default=dict)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @property
+    def average_score(self):
+        if not self.scored_count:
+            return None
+        return round(self.score_sum / self.scored_count, 2)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, JSON, DateTime, ForeignKey
+from sqlalchemy import Column, String, JSON, DateTime, ForeignKey, Index
 from app.db import Base
 from datetime import datetime
 import uuid
@@ -10,20 +10,25 @@ class Assessment(Base):
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     apprentice_id = Column(String, ForeignKey("users.id"), nullable=False)
+    template_id = Column(String, ForeignKey("assessment_templates.id"), nullable=True)
     answers = Column(JSON, nullable=False)
     scores = Column(JSON, nullable=True)
     recommendation = Column(String, nullable=True)
     category = Column(String, nullable=True)
+    scoring_status = Column(String, nullable=False, default="pending")  # pending, scored, failed
     mentor_notes = relationship("MentorNote", back_populates="assessment", cascade="all, delete-orphan")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-score_history = relationship(
-    "AssessmentScoreHistory",
-    back_populates="assessment",
-    order_by="desc(AssessmentScoreHistory.scored_at)",
-    cascade="all, delete-orphan"
-)
+    score_history = relationship(
+        "AssessmentScoreHistory",
+        back_populates="assessment",
+        order_by="desc(AssessmentScoreHistory.scored_at)",
+        cascade="all, delete-orphan"
+    )
 
-@hybrid_property
-def latest_score(self):
-    return self.score_history[0] if self.score_history else None
\ No newline at end of file
+    __table_args__ = (Index("ix_assessments_apprentice_created", "apprentice_id", "created_at", "id"),)
+
+    @hybrid_property
+    def latest_score(self):
+        return self.score_history[0] if self.score_history else None
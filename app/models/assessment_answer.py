@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, Text
+from sqlalchemy import Column, String, ForeignKey, Text, Index
 from app.db import Base
 import uuid
 
@@ -9,3 +9,10 @@ class AssessmentAnswer(Base):
     assessment_id = Column(String, ForeignKey("assessment_drafts.id"), nullable=False)
     question_id = Column(String, ForeignKey("questions.id"), nullable=False)
     answer_text = Column(Text, nullable=True)
+
+    __table_args__ = (
+        # One answer per question per draft; the upsert target for autosaves
+        Index("ix_assessment_answers_draft_question", "assessment_id", "question_id", unique=True),
+        # "Every answer to question X" across apprentices
+        Index("ix_assessment_answers_question", "question_id"),
+    )
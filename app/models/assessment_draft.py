@@ -1,6 +1,8 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, Float, JSON
+from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, Float, JSON, Index, Integer
+from sqlalchemy import inspect
 from sqlalchemy.orm import relationship
 from app.db import Base
+from app.models.assessment_answer import AssessmentAnswer
 from datetime import datetime
 import uuid
 
@@ -9,10 +11,53 @@ class AssessmentDraft(Base):
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     apprentice_id = Column(String, ForeignKey("users.id"), nullable=False)
+    # Pre-normalization answer blob; answers now live in assessment_answers.
+    # Only answers to deleted questions remain here (archived, never served).
+    legacy_answers = Column("answers", JSON, nullable=True)
     last_question_id = Column(String, ForeignKey("questions.id"), nullable=True)
     is_submitted = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     score = Column(Float, nullable=True)
+    # Optimistic-lock counter: every ORM UPDATE bumps it and matches on the old value
+    revision = Column(Integer, nullable=False, default=0)
     template_id = Column(String, ForeignKey("assessment_templates.id"), nullable=False)
+    # Template bundle version the draft was started on
+    template_version = Column(Integer, nullable=True)
     answers_rel = relationship("AssessmentAnswer", cascade="all, delete-orphan", backref="draft")
+
+    @property
+    def answers(self) -> dict:
+        """The answers as ``{question_id: answer_text}``, built from the answer rows on access."""
+        return {answer.question_id: answer.answer_text for answer in self.answers_rel}
+
+    @answers.setter
+    def answers(self, answers: dict):
+        # ORM path (new drafts, scripts); the draft routes bulk-upsert via app.services.draft_answers
+        answers = answers or {}
+        current = {answer.question_id: answer for answer in self.answers_rel}
+        for question_id, text in answers.items():
+            if question_id in current:
+                current[question_id].answer_text = text
+            else:
+                self.answers_rel.append(AssessmentAnswer(question_id=question_id, answer_text=text))
+        for question_id, answer in current.items():
+            if question_id not in answers:
+                self.answers_rel.remove(answer)
+        if inspect(self).persistent:
+            # Row changes alone don't UPDATE the draft; touch it so the revision moves
+            self.updated_at = datetime.utcnow()
+
+    __mapper_args__ = {"version_id_col": revision}
+
+    __table_args__ = (
+        # The apprentice's in-progress draft lookup
+        Index("ix_assessment_drafts_apprentice_submitted", "apprentice_id", "is_submitted"),
+        # Submitted-draft listings page by (created_at, id); partial so open drafts don't bloat it
+        Index(
+            "ix_assessment_drafts_submitted_created",
+            "apprentice_id", "created_at", "id",
+            postgresql_where=is_submitted == True,
+            sqlite_where=is_submitted == True,
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db import Base
@@ -19,3 +19,8 @@ class AssessmentScoreHistory(Base):
     notes = Column(Text, nullable=True)
 
     assessment = relationship("Assessment", back_populates="score_history")
+
+    __table_args__ = (
+        Index("ix_score_history_assessment_scored", "assessment_id", "scored_at", "id"),
+        Index("ix_score_history_apprentice_scored", "apprentice_id", "scored_at", "id"),
+    )
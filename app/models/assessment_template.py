@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, Float
+from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, Float, Integer
 from sqlalchemy.orm import relationship
 from app.db import Base
 from datetime import datetime
@@ -12,4 +12,8 @@ class AssessmentTemplate(Base):
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
     is_published = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Latest published bundle (template_bundles.version); 0 until first published
+    version = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Bumped on edits and when questions are added, for conditional GETs
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
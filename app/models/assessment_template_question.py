@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, Float, Integer
+from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, Float, Integer, Index
 from sqlalchemy.orm import relationship
 from app.db import Base
 from datetime import datetime
@@ -13,3 +13,5 @@ class AssessmentTemplateQuestion(Base):
     template_id = Column(String, ForeignKey("assessment_templates.id"))
     question_id = Column(String, ForeignKey("questions.id"))
     order = Column(Integer, nullable=False)
+
+    __table_args__ = (Index("ix_template_questions_template_order", "template_id", "order"),)
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text, Index
+from datetime import datetime
+from app.db import Base
+import uuid
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    kind = Column(String, nullable=False)  # assessment_results, invitation
+    dedupe_key = Column(String, unique=True, nullable=True)
+    to_email = Column(String, nullable=False)
+    from_email = Column(String, nullable=True)
+    subject = Column(String, nullable=False)
+    html_content = Column(Text, nullable=True)
+    text_content = Column(Text, nullable=True)
+    status = Column(String, nullable=False, default="pending")  # pending, sending, sent, dead
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=8)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (Index("ix_email_outbox_due", "status", "next_attempt_at"),)
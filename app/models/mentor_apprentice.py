@@ -4,4 +4,4 @@ from app.db import Base
 class MentorApprentice(Base):
     __tablename__ = "mentor_apprentice"
     apprentice_id = Column(String, ForeignKey("users.id"), primary_key=True)
-    mentor_id = Column(String, ForeignKey("users.id"), nullable=False)
\ No newline at end of file
+    mentor_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
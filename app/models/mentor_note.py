@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, String, Text, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db import Base
@@ -7,13 +7,17 @@ import uuid
 class MentorNote(Base):
     __tablename__ = "mentor_notes"
 
-    id = Column(String, primary_key=True, default=str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     assessment_id = Column(String, ForeignKey("assessments.id"), nullable=False)
     mentor_id = Column(String, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     follow_up_plan = Column(Text, nullable=True)
     is_private = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Set when the apprentice first views a shared (non-private) note
+    read_at = Column(DateTime, nullable=True)
 
     assessment = relationship("Assessment", back_populates="mentor_notes")
     mentor = relationship("User")
+
+    __table_args__ = (Index("ix_mentor_notes_assessment_created", "assessment_id", "created_at", "id"),)
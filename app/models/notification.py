@@ -7,7 +7,7 @@ import uuid
 class Notification(Base):
     __tablename__ = "notifications"
 
-    id = Column(String, primary_key=True, default=str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     message = Column(Text, nullable=False)
     link = Column(String, nullable=True)  # URL or route path
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, DateTime
+from datetime import datetime
 from app.db import Base
 import uuid
 
@@ -7,4 +8,5 @@ class Question(Base):
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     text = Column(String, nullable=False)
-    category_id = Column(ForeignKey("categories.id"))
\ No newline at end of file
+    category_id = Column(ForeignKey("categories.id"))
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
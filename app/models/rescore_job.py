@@ -0,0 +1,52 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Float, Text, JSON
+from datetime import datetime
+from app.db import Base
+import uuid
+
+class RescoreJob(Base):
+    __tablename__ = "rescore_jobs"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    scope = Column(String, nullable=False)  # apprentice, template, all
+    scope_id = Column(String, nullable=True)
+    status = Column(String, nullable=False, default="queued")  # queued, running, paused, succeeded, failed
+    total = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    processed_at_start = Column(Integer, nullable=False, default=0)  # for the current run's rate
+    # Assessments are visited in id order; everything up to checkpoint_id is done
+    checkpoint_id = Column(String, nullable=True)
+    # Assessments before the checkpoint whose rescoring failed; retried when the job resumes
+    failed_ids = Column(JSON, nullable=False, default=list)
+    concurrency = Column(Integer, nullable=False, default=4)
+    target_per_minute = Column(Float, nullable=True)
+    model_used = Column(String, nullable=False)
+    last_error = Column(Text, nullable=True)
+    triggered_by_user_id = Column(String, ForeignKey("users.id"), nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @property
+    def percent_complete(self) -> float:
+        if not self.total:
+            return 100.0 if self.status == "succeeded" else 0.0
+        return round(min(self.processed / self.total, 1.0) * 100, 1)
+
+    @property
+    def rate_per_minute(self):
+        if not self.started_at:
+            return None
+        end = self.finished_at or datetime.utcnow()
+        elapsed = (end - self.started_at).total_seconds()
+        if elapsed <= 0:
+            return None
+        return round((self.processed - self.processed_at_start) * 60 / elapsed, 2)
+
+    @property
+    def eta_seconds(self):
+        rate = self.rate_per_minute
+        if self.status != "running" or not rate:
+            return None
+        return round(max(self.total - self.processed, 0) * 60 / rate, 1)
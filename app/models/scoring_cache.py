@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, DateTime, Integer, JSON
+from datetime import datetime
+from app.db import Base
+
+class ScoringCacheEntry(Base):
+    __tablename__ = "scoring_cache"
+
+    key = Column(String(64), primary_key=True)  # sha256 of normalized input + model settings
+    model = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    result = Column(JSON, nullable=False)
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_used_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.db import Base
+import uuid
+
+class ScoringJob(Base):
+    __tablename__ = "scoring_jobs"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    assessment_id = Column(String, ForeignKey("assessments.id"), nullable=False, index=True)
+    status = Column(String, nullable=False, default="queued")  # queued, running, succeeded, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_by = Column(String, nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    triggered_by = Column(String, nullable=False, default="system")
+    triggered_by_user_id = Column(String, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    assessment = relationship("Assessment")
+
+    __table_args__ = (Index("ix_scoring_jobs_claim", "status", "run_after"),)
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, JSON
+from datetime import datetime
+from app.db import Base
+
+class TemplateBundle(Base):
+    """Immutable snapshot of a published template version: ordered questions, categories and texts."""
+    __tablename__ = "template_bundles"
+
+    template_id = Column(String, ForeignKey("assessment_templates.id"), primary_key=True)
+    version = Column(Integer, primary_key=True)
+    etag = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
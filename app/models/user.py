@@ -5,7 +5,7 @@ from app.db import Base
 import uuid
 from sqlalchemy.orm import relationship
 
-class UserRole(enum.Enum):
+class UserRole(str, enum.Enum):
     apprentice = "apprentice"
     mentor = "mentor"
     admin = "admin"
@@ -16,5 +16,5 @@ class User(Base):
     name = Column(String, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
     role = Column(Enum(UserRole), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     notifications = relationship("Notification", back_populates="user", cascade="all, delete-orphan")
\ No newline at end of file
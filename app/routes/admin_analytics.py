@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from app.db import get_db
+from app.services import analytics_export
+from app.services.auth import require_admin
+
+router = APIRouter(prefix="/admin/analytics", tags=["Admin Analytics"])
+
+
+@router.get("/scores", dependencies=[Depends(require_admin)])
+def export_scores(
+    format: str = Query(default="parquet", enum=list(analytics_export.FORMATS)),
+    source: str = Query(default="history", enum=list(analytics_export.SOURCES)),
+    template_id: str = Query(default=None),
+    apprentice_id: str = Query(default=None),
+    db: Session = Depends(get_db)
+):
+    """Per-question scores as a columnar file, streamed one row group at a time."""
+    try:
+        analytics_export.score_schema()
+    except RuntimeError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    chunks = analytics_export.stream_export(
+        db, format=format, source=source, template_id=template_id, apprentice_id=apprentice_id
+    )
+    extension = "parquet" if format == "parquet" else "arrows"
+    return StreamingResponse(chunks, media_type=analytics_export.MEDIA_TYPES[format], headers={
+        "Content-Disposition": f"attachment; filename=scores_{source}.{extension}"
+    })
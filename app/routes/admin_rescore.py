@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.db import get_db
+from app.exceptions import NotFoundException, ValidationException
+from app.models.rescore_job import RescoreJob
+from app.schemas.rescore_job import RescoreJobCreate, RescoreJobOut
+from app.schemas.user import UserSchema
+from app.services import rescoring
+from app.services.auth import require_admin
+
+router = APIRouter(prefix="/admin/rescore", tags=["Admin Rescoring"])
+
+
+def _get_job(db: Session, job_id: str) -> RescoreJob:
+    job = db.get(RescoreJob, job_id)
+    if not job:
+        raise NotFoundException("Rescore job not found")
+    return job
+
+
+@router.post("", response_model=RescoreJobOut, status_code=202)
+def start_rescore(
+    data: RescoreJobCreate,
+    db: Session = Depends(get_db),
+    current_user: UserSchema = Depends(require_admin)
+):
+    try:
+        job = rescoring.create_rescore_job(
+            db,
+            scope=data.scope,
+            scope_id=data.scope_id,
+            concurrency=data.concurrency,
+            target_per_minute=data.target_per_minute,
+            triggered_by_user_id=current_user.id,
+        )
+    except ValueError as e:
+        raise ValidationException(str(e))
+    rescoring.start_in_background(job.id)
+    return job
+
+
+@router.get("/{job_id}", response_model=RescoreJobOut, dependencies=[Depends(require_admin)])
+def get_rescore_status(job_id: str, db: Session = Depends(get_db)):
+    return _get_job(db, job_id)
+
+
+@router.post("/{job_id}/pause", response_model=RescoreJobOut, dependencies=[Depends(require_admin)])
+def pause_rescore(job_id: str, db: Session = Depends(get_db)):
+    job = _get_job(db, job_id)
+    if job.status not in (rescoring.QUEUED, rescoring.RUNNING):
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    job.status = rescoring.PAUSED
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+@router.post("/{job_id}/resume", response_model=RescoreJobOut, status_code=202, dependencies=[Depends(require_admin)])
+def resume_rescore(job_id: str, db: Session = Depends(get_db)):
+    job = _get_job(db, job_id)
+    if not rescoring.can_resume(job):
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    job.status = rescoring.QUEUED
+    db.commit()
+    db.refresh(job)
+    rescoring.start_in_background(job.id)
+    return job
@@ -1,4 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from app.db import get_db
 from app.services.auth import require_admin, get_current_user
@@ -11,6 +14,9 @@ from app.schemas.assessment_template import (
 )
 from uuid import uuid4
 from app.schemas.user import UserCreate, UserOut
+from app.services.pagination import Page
+from app.services.conditional import Conditional
+from app.services.template_bundles import publish_template
 
 router = APIRouter(prefix="/admin/templates", tags=["Admin Templates"])
 
@@ -29,7 +35,8 @@ def add_question_to_template(
     db: Session = Depends(get_db)
 ):
     # Confirm template and question exist
-    if not db.query(AssessmentTemplate).filter_by(id=template_id).first():
+    template = db.query(AssessmentTemplate).filter_by(id=template_id).first()
+    if not template:
         raise HTTPException(status_code=404, detail="Template not found")
     if not db.query(Question).filter_by(id=item.question_id).first():
         raise HTTPException(status_code=404, detail="Question not found")
@@ -47,18 +54,44 @@ def add_question_to_template(
         order=item.order
     )
     db.add(link)
+    # Published versions (and the required-question sets cached with them) are
+    # immutable; drafts pick up the new membership once the template is republished.
+    # Invalidates cached copies of the template view
+    template.updated_at = datetime.utcnow()
     db.commit()
     return {"message": "Question added"}
 
+@router.post("/{template_id}/publish", dependencies=[Depends(require_admin)])
+def publish(template_id: str, db: Session = Depends(get_db)):
+    """Snapshot the template's questions as a new immutable version served at /templates."""
+    template = db.query(AssessmentTemplate).filter_by(id=template_id).first()
+    if not template:
+        raise HTTPException(status_code=404, detail="Template not found")
+    if not db.query(AssessmentTemplateQuestion).filter_by(template_id=template_id).first():
+        raise HTTPException(status_code=400, detail="Cannot publish a template without questions")
+
+    bundle = publish_template(db, template)
+    return {"template_id": template_id, "version": bundle.version, "etag": bundle.etag}
+
 @router.get("", response_model=list[AssessmentTemplateOut], dependencies=[Depends(require_admin)])
-def list_templates(db: Session = Depends(get_db)):
-    return db.query(AssessmentTemplate).all()
+def list_templates(page: Page = Depends(), db: Session = Depends(get_db)):
+    query = page.apply(db.query(AssessmentTemplate), AssessmentTemplate.created_at, AssessmentTemplate.id)
+    return page.finish(query.all())
 
 @router.get("/{template_id}", response_model=FullTemplateView, dependencies=[Depends(require_admin)])
-def get_template(template_id: str, db: Session = Depends(get_db)):
-    template = db.query(AssessmentTemplate).filter_by(id=template_id).first()
-    if not template:
+def get_template(template_id: str, cond: Conditional = Depends(), db: Session = Depends(get_db)):
+    version = db.execute(
+        select(
+            AssessmentTemplate.updated_at,
+            select(func.count()).where(AssessmentTemplateQuestion.template_id == template_id).scalar_subquery(),
+        ).where(AssessmentTemplate.id == template_id)
+    ).first()
+    if not version:
         raise HTTPException(status_code=404, detail="Template not found")
+    if cond.check(*version, last_modified=version[0]):
+        return cond.not_modified()
+
+    template = db.query(AssessmentTemplate).filter_by(id=template_id).first()
 
     links = db.query(AssessmentTemplateQuestion).filter_by(template_id=template_id).order_by(
         AssessmentTemplateQuestion.order
@@ -1,11 +1,20 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
-from app.db import get_db
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+from app.db import get_db, get_async_db
 from app.models.user import User
 from app.models.assessment import Assessment
+from app.models.mentor_note import MentorNote
 from app.schemas.assessment import AssessmentOut
-from app.services.auth import require_apprentice
+from app.schemas.mentor_note import MentorNoteOut
+from app.services.auth import require_apprentice, require_apprentice_async
 from app.schemas.user import UserSchema
+from app.services import queries
+from app.services.pagination import Page
+from app.services.conditional import Conditional
 
 router = APIRouter(prefix="/apprentice", tags=["Apprentice"])
 
@@ -16,18 +25,24 @@ def get_my_profile(current_user: User = Depends(require_apprentice)):
 
 
 @router.get("/my-submitted-assessments", response_model=list[AssessmentOut])
-def get_my_assessments(
-    current_user: User = Depends(require_apprentice),
-    db: Session = Depends(get_db)
+async def get_my_assessments(
+    current_user: User = Depends(require_apprentice_async),
+    page: Page = Depends(),
+    cond: Conditional = Depends(),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    assessments = (
-        db.query(Assessment)
-        .filter(Assessment.apprentice_id == current_user.id)
-        .options(joinedload(Assessment.score_history))
-        .order_by(Assessment.created_at.desc())
-        .all()
-    )
-    return assessments
+    count, last_updated = (await db.execute(
+        select(func.count(), func.max(Assessment.updated_at))
+        .where(Assessment.apprentice_id == current_user.id)
+    )).one()
+    if cond.check(current_user.id, count, last_updated, last_modified=last_updated):
+        return cond.not_modified()
+
+    result = await db.execute(page.apply(
+        queries.apprentice_assessments(current_user.id).options(selectinload(Assessment.score_history)),
+        Assessment.created_at, Assessment.id
+    ))
+    return page.finish(result.scalars().all())
 
 
 @router.get("/my-assessment/{assessment_id}", response_model=AssessmentOut)
@@ -47,3 +62,34 @@ def get_my_assessment_detail(
         raise HTTPException(status_code=404, detail="Assessment not found")
 
     return assessment
+
+
+@router.get("/my-assessment/{assessment_id}/notes", response_model=list[MentorNoteOut])
+def get_my_assessment_notes(
+    assessment_id: str,
+    page: Page = Depends(),
+    current_user: User = Depends(require_apprentice),
+    db: Session = Depends(get_db)
+):
+    """Shared mentor notes on one of my assessments; viewing marks them read.
+
+    ``read_at`` in the response is as it was before this request, so notes
+    with ``read_at: null`` are the ones new to the apprentice.
+    """
+    assessment = db.query(Assessment).filter_by(id=assessment_id, apprentice_id=current_user.id).first()
+    if not assessment:
+        raise HTTPException(status_code=404, detail="Assessment not found")
+
+    stmt = queries.assessment_notes(assessment_id, shared_only=True)
+    notes = page.finish(db.scalars(page.apply(stmt, MentorNote.created_at, MentorNote.id)).all())
+
+    response = [MentorNoteOut.model_validate(note) for note in notes]
+    unread = [note.id for note in notes if note.read_at is None]
+    if unread:
+        db.execute(
+            update(MentorNote)
+            .where(MentorNote.id.in_(unread), MentorNote.read_at.is_(None))
+            .values(read_at=datetime.utcnow())
+        )
+        db.commit()
+    return response
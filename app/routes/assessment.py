@@ -3,15 +3,23 @@ from sqlalchemy.orm import Session
 from app.schemas import assessment as assessment_schema
 from app.models import assessment as assessment_model, user as user_model, mentor_apprentice as mentor_model
 from app.db import get_db
-from app.services.auth import verify_token
-from app.services import ai_scoring
-from app.services.email import send_assessment_email
+from app.services.auth import verify_token, get_current_user
+from app.services.mentorship import ensure_mentor_of
+from app.services.scoring_queue import enqueue_scoring
+from app.services.apprentice_stats import record_submission
+from app.models.scoring_job import ScoringJob
+from app.schemas.scoring_job import ScoringJobOut, ScoringStatusOut
 from app.exceptions import ForbiddenException, NotFoundException
 import uuid
 from sqlalchemy.orm import joinedload
 
 router = APIRouter()
 
+SCORING_ERROR_MESSAGES = {
+    "queued": "Scoring failed and will be retried shortly",
+    None: "Scoring could not be completed",
+}
+
 @router.post("/", response_model=assessment_schema.AssessmentOut)
 def create_assessment(
     assessment_input: assessment_schema.AssessmentCreate,
@@ -35,29 +43,51 @@ def create_assessment(
         if not mentor:
             raise NotFoundException("Mentor not found.")
 
-        ai_result = ai_scoring.score_assessment(assessment_input.answers)
-
         db_assessment = assessment_model.Assessment(
             id=str(uuid.uuid4()),
-            title=assessment_input.title,
-            user_id=user_id,
-            score=ai_result.get("overall_score"),
-            feedback=ai_result.get("summary_feedback")
+            apprentice_id=user_id,
+            answers=assessment_input.answers,
+            scoring_status="pending"
         )
         db.add(db_assessment)
+        record_submission(db, db_assessment)
+        # AI scoring and the mentor email run in the scoring workers
+        enqueue_scoring(db, db_assessment.id)
         db.commit()
         db.refresh(db_assessment)
 
-        send_assessment_email(
-            to_email=mentor.email,
-            apprentice_name=apprentice.name,
-            assessment_title=assessment_input.title,
-            score=ai_result.get("overall_score"),
-            feedback_summary=ai_result.get("summary_feedback"),
-            details=ai_result.get("details")
-        )
-
         return db_assessment
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{assessment_id}/scoring-status", response_model=ScoringStatusOut)
+def get_scoring_status(
+    assessment_id: str,
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    assessment = db.query(assessment_model.Assessment).filter_by(id=assessment_id).first()
+    if not assessment:
+        raise NotFoundException("Assessment not found")
+    if assessment.apprentice_id != current_user.id:
+        ensure_mentor_of(db, current_user.id, assessment.apprentice_id, "Not authorized to view this assessment")
+
+    job = (
+        db.query(ScoringJob)
+        .filter_by(assessment_id=assessment_id)
+        .order_by(ScoringJob.created_at.desc())
+        .first()
+    )
+    job_out = ScoringJobOut.model_validate(job, from_attributes=True) if job else None
+    if job_out and job_out.last_error:
+        # The stored error is raw OpenAI/database exception text; keep it server-side
+        job_out.last_error = SCORING_ERROR_MESSAGES.get(job_out.status, SCORING_ERROR_MESSAGES[None])
+    return ScoringStatusOut(
+        assessment_id=assessment.id,
+        scoring_status=assessment.scoring_status,
+        job=job_out
+    )
@@ -9,24 +9,30 @@ from app.services.auth import get_current_user, require_apprentice, require_ment
 from app.models.user import User
 from app.models.question import Question
 import uuid
-from app.services.ai_scoring import score_assessment
-from app.services.email import send_assessment_email
 from sqlalchemy.orm import selectinload
+from app.services import queries
 from app.models.assessment_answer import AssessmentAnswer
 import logging
-from app.exceptions import ForbiddenException, NotFoundException
+from app.exceptions import ConflictException, ForbiddenException, NotFoundException, ValidationException
 from app.models.mentor_apprentice import MentorApprentice
 from app.models.assessment_template import AssessmentTemplate
 from app.models.question import Question
 from app.models.category import Category
 from app.schemas.assessment_draft import QuestionItem
-from app.schemas.assessment_draft import AssessmentDraftUpdate
+from app.services.pagination import Page
+from app.services.template_bundles import get_bundle, is_complete, unknown_questions
+from app.schemas.assessment_draft import AssessmentDraftUpdate, AssessmentDraftPatch, AssessmentDraftPatchOut
+from app.services.draft_patch import apply_patch
+from app.services.draft_answers import save_answers
+from app.services.compression import compression
+from sqlalchemy.orm.exc import StaleDataError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 @router.post("/assessment-drafts", response_model=AssessmentDraftOut)
+@compression("fast")
 def save_draft(
     data: AssessmentDraftCreate,
     db: Session = Depends(get_db),
@@ -35,51 +41,38 @@ def save_draft(
     if current_user.role != "apprentice":
         raise HTTPException(status_code=403, detail="Only apprentices can save drafts")
 
-    total_questions = db.query(Question).count()
-    is_complete = data.answers and len(data.answers) >= total_questions
+    draft = db.scalars(queries.in_progress_draft(current_user.id)).first()
 
-    draft = db.query(AssessmentDraft).filter_by(
-        apprentice_id=current_user.id,
-        is_submitted=False
-    ).first()
+    # Questions come from the template bundle the draft was started on (cached per version)
+    version = draft.template_version if draft and draft.template_id == data.template_id else None
+    bundle = get_bundle(db, data.template_id, version)
+    if not bundle:
+        raise HTTPException(status_code=404, detail="Assessment template not found")
+    questions = bundle["payload"]["questions"]
+    _check_questions(bundle, data.answers)
+    complete = is_complete(bundle, data.answers)
 
     if draft:
-        draft.answers = data.answers
         draft.last_question_id = data.last_question_id
-        draft.is_submitted = is_complete
     else:
         draft = AssessmentDraft(
             id=str(uuid.uuid4()),
             apprentice_id=current_user.id,
-            answers=data.answers,
             last_question_id=data.last_question_id,
             template_id=data.template_id,
-            is_submitted=is_complete
+            template_version=bundle["payload"]["version"],
+            is_submitted=False
         )
         db.add(draft)
+    save_answers(db, draft, data.answers, replace=True)
 
-    db.commit()
+    _commit_revision(db)
     db.refresh(draft)
 
-    # Fetch questions from all categories linked to this template
-    template = db.query(AssessmentTemplate).filter_by(id=data.template_id).first()
-    if not template:
-        raise HTTPException(status_code=404, detail="Assessment template not found")
-
-    questions = (
-        db.query(Question)
-        .join(Category, Question.category_id == Category.id)
-        .filter(Category.id.in_([c.id for c in template.categories]))
-        .all()
-    )
-    questions_out = [QuestionItem.from_orm(q) for q in questions]
-
-    draft_response = AssessmentDraftOut.from_orm(draft)
-    draft_response.questions = questions_out
-
-    if is_complete:
-        # AI scoring + email logic already present
-        pass
+    draft_response = AssessmentDraftOut.model_validate(draft, from_attributes=True)
+    draft_response.questions = [QuestionItem(**q) for q in questions]
+    # The draft stays open until the apprentice submits it; scoring starts there
+    draft_response.is_complete = complete
 
     return draft_response
 
@@ -106,10 +99,7 @@ def resume_draft(
     if current_user.role != "apprentice":
         raise ForbiddenException("Only apprentices can resume drafts")
     
-    draft = db.query(AssessmentDraft).filter_by(
-        apprentice_id=current_user.id,
-        is_submitted=False
-    ).first()
+    draft = db.scalars(queries.in_progress_draft(current_user.id)).first()
 
     if not draft:
         raise NotFoundException("No draft found")
@@ -132,6 +122,7 @@ def resume_draft(
     }
 
 @router.patch("/assessment-drafts", response_model=AssessmentDraftOut)
+@compression("fast")
 def update_draft(
     data: AssessmentDraftUpdate,
     db: Session = Depends(get_db),
@@ -140,26 +131,98 @@ def update_draft(
     if current_user.role != "apprentice":
         raise ForbiddenException("Only apprentices can update drafts")
 
-    draft = db.query(AssessmentDraft).filter_by(
-        apprentice_id=current_user.id,
-        is_submitted=False
-    ).first()
+    draft = db.scalars(queries.in_progress_draft(current_user.id)).first()
 
     if not draft:
         raise NotFoundException("No draft found")
+    if data.revision is not None and data.revision != draft.revision:
+        raise _revision_conflict(draft.revision)
 
     if data.answers is not None:
-        draft.answers = data.answers
+        _check_questions(get_bundle(db, draft.template_id, draft.template_version), data.answers)
+        save_answers(db, draft, data.answers, replace=True)
     if data.last_question_id:
         draft.last_question_id = data.last_question_id
 
-    db.commit()
+    _commit_revision(db)
     db.refresh(draft)
     return draft
 
+
+def _check_questions(bundle: dict, answers: dict):
+    """422 for answers to questions outside the draft's template version.
+
+    Drafts on a template that was never published have no bundle; the
+    foreign key in ``save_answers`` still rejects ids that don't exist.
+    """
+    unknown = unknown_questions(bundle, answers) if bundle else []
+    if unknown:
+        raise ValidationException({"message": "Answers reference unknown questions", "question_ids": unknown})
+
+
+def _revision_conflict(current_revision: int) -> ConflictException:
+    return ConflictException({"message": "Draft was changed by another session", "revision": current_revision})
+
+
+def _commit_revision(db: Session):
+    """Commit a draft write; the UPDATE only matches the revision that was loaded."""
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        raise ConflictException({"message": "Draft was changed by another session"})
+
+
+@router.patch("/assessment-drafts/{draft_id}", response_model=AssessmentDraftPatchOut)
+@compression("off")
+def patch_draft(
+    draft_id: str,
+    data: AssessmentDraftPatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Apply per-question deltas (JSON Patch) to an open draft at a known revision.
+
+    Only the changed answers travel over the wire. A stale ``revision`` (the
+    draft was saved from another device in between) gets a 409 with the
+    current revision, so the client can refetch and replay its edits.
+    """
+    if current_user.role != "apprentice":
+        raise ForbiddenException("Only apprentices can update drafts")
+
+    draft = db.query(AssessmentDraft).filter_by(
+        id=draft_id,
+        apprentice_id=current_user.id,
+        is_submitted=False
+    ).first()
+    if not draft:
+        raise NotFoundException("No draft found")
+    if data.revision != draft.revision:
+        raise _revision_conflict(draft.revision)
+
+    current = draft.answers
+    answers, last_question_id = apply_patch(current, draft.last_question_id, data.patch)
+    changed = {q: text for q, text in answers.items() if current.get(q) != text}
+    removed = [q for q in current if q not in answers]
+    if changed:
+        _check_questions(get_bundle(db, draft.template_id, draft.template_version), changed)
+    if changed or removed:
+        save_answers(db, draft, changed, removed=removed)
+    if last_question_id != draft.last_question_id:
+        draft.last_question_id = last_question_id
+    _commit_revision(db)
+
+    return AssessmentDraftPatchOut(
+        id=draft.id,
+        revision=draft.revision,
+        answered_count=len(answers),
+        last_question_id=draft.last_question_id,
+        updated_at=draft.updated_at,
+    )
+
 from app.models.assessment import Assessment
-from app.services.ai_scoring import score_assessment
-from app.services.email import send_assessment_email
+from app.services.scoring_queue import enqueue_scoring
+from app.services.apprentice_stats import record_submission
 import uuid
 
 @router.post("/assessment-drafts/submit", response_model=assessment_schema.AssessmentOut)
@@ -170,10 +233,7 @@ def submit_draft(
     if current_user.role != "apprentice":
         raise ForbiddenException("Only apprentices can submit assessments")
 
-    draft = db.query(AssessmentDraft).filter_by(
-        apprentice_id=current_user.id,
-        is_submitted=False
-    ).first()
+    draft = db.scalars(queries.in_progress_draft(current_user.id)).first()
 
     if not draft:
         raise NotFoundException("No draft to submit")
@@ -181,45 +241,37 @@ def submit_draft(
     if not draft.answers:
         raise HTTPException(status_code=400, detail="Cannot submit an empty assessment")
 
-    # Score via AI
-    score, recommendation = score_assessment(draft.answers)
-
-    # Save as new Assessment
+    # Save as new Assessment; AI scoring and the mentor email run in the scoring workers
     assessment = Assessment(
         id=str(uuid.uuid4()),
         apprentice_id=current_user.id,
+        template_id=draft.template_id,
         answers=draft.answers,
-        score=score,
-        recommendation=recommendation
+        scoring_status="pending"
     )
     db.add(assessment)
+    record_submission(db, assessment)
+    enqueue_scoring(db, assessment.id)
 
     # Mark draft as submitted
     draft.is_submitted = True
-    db.commit()
-
-    # Send email to mentor
-    send_assessment_email(
-        db=db,
-        apprentice_id=current_user.id,
-        assessment=assessment
-    )
+    _commit_revision(db)
+    db.refresh(assessment)
 
     return assessment
 
 @router.get("/submitted-assessments/{apprentice_id}", response_model=list[AssessmentDraftOut])
 def get_submitted_by_apprentice(
     apprentice_id: str,
+    page: Page = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     # Mentor authorization logic assumed to be in place already
 
-    submissions = db.query(AssessmentDraft)\
-        .options(selectinload(AssessmentDraft.answers_rel))\
-        .filter_by(apprentice_id=apprentice_id, is_submitted=True).all()
+    stmt = queries.submitted_drafts(apprentice_id).options(selectinload(AssessmentDraft.answers_rel))
 
-    return submissions
+    return page.finish(db.scalars(page.apply(stmt, AssessmentDraft.created_at, AssessmentDraft.id)).all())
 
 @router.post("/assessment-drafts/start", response_model=AssessmentDraftOut)
 def start_draft(
@@ -239,9 +291,9 @@ def start_draft(
     if existing:
         return existing
 
-    # Ensure template exists and is published
-    template = db.query(AssessmentTemplate).filter_by(id=template_id, published=True).first()
-    if not template:
+    # Ensure template exists and is published; the draft is pinned to its current version
+    bundle = get_bundle(db, template_id)
+    if not bundle:
         raise HTTPException(status_code=404, detail="Template not found or not published")
 
     # Create draft
@@ -249,10 +301,13 @@ def start_draft(
         id=str(uuid.uuid4()),
         apprentice_id=current_user.id,
         template_id=template_id,
-        answers={},
+        template_version=bundle["payload"]["version"],
         last_question_id=None
     )
     db.add(draft)
     db.commit()
     db.refresh(draft)
-    return draft
+
+    draft_response = AssessmentDraftOut.model_validate(draft, from_attributes=True)
+    draft_response.questions = [QuestionItem(**q) for q in bundle["payload"]["questions"]]
+    return draft_response
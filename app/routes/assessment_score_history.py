@@ -1,48 +1,64 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.db import get_db
+from app.db import get_async_db
 from app.models.assessment_score_history import AssessmentScoreHistory
 from app.schemas.assessment_score_history import AssessmentScoreHistoryOut
-from app.services.auth import get_current_user, require_mentor
+from app.services.auth import get_current_user_async, require_mentor_or_admin_async
 from app.schemas.user import UserSchema
-from app.services.auth import require_mentor_or_admin
+from app.services import queries
+from app.services.pagination import Page
+from app.services.conditional import Conditional
+from app.services.fast_json import trusted_response
 
 router = APIRouter()
 
 
 @router.get("/assessments/{assessment_id}/history", response_model=List[AssessmentScoreHistoryOut])
-def get_assessment_score_history(
+async def get_assessment_score_history(
     assessment_id: str,
-    db: Session = Depends(get_db),
-    current_user: UserSchema = Depends(get_current_user)
+    page: Page = Depends(),
+    cond: Conditional = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserSchema = Depends(get_current_user_async)
 ):
-    history = (
-        db.query(AssessmentScoreHistory)
-        .filter(AssessmentScoreHistory.assessment_id == assessment_id)
-        .order_by(AssessmentScoreHistory.scored_at.desc())
-        .all()
-    )
-
-    if not history:
+    count, last_scored = (await db.execute(
+        select(func.count(), func.max(AssessmentScoreHistory.scored_at))
+        .where(AssessmentScoreHistory.assessment_id == assessment_id)
+    )).one()
+    if not count and not page.cursor:
         raise HTTPException(status_code=404, detail="No score history found")
+    if cond.check(count, last_scored, last_modified=last_scored):
+        return cond.not_modified()
 
-    return history
+    result = await db.execute(page.apply(
+        queries.assessment_score_history(assessment_id),
+        AssessmentScoreHistory.scored_at, AssessmentScoreHistory.id
+    ))
+    # Rows straight from the table match the schema; skip re-validating large score_data blobs
+    return trusted_response(AssessmentScoreHistoryOut, page.finish(result.scalars().all()), page.response)
 
 @router.get("/users/{apprentice_id}/score-history", response_model=List[AssessmentScoreHistoryOut])
-def get_score_history_for_apprentice(
+async def get_score_history_for_apprentice(
     apprentice_id: str,
-    db: Session = Depends(get_db),
-    current_user: UserSchema = Depends(require_mentor_or_admin)
+    page: Page = Depends(),
+    cond: Conditional = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserSchema = Depends(require_mentor_or_admin_async)
 ):
-    history = (
-        db.query(AssessmentScoreHistory)
-        .filter(AssessmentScoreHistory.apprentice_id == apprentice_id)
-        .order_by(AssessmentScoreHistory.scored_at.desc())
-        .all()
-    )
-
-    if not history:
+    count, last_scored = (await db.execute(
+        select(func.count(), func.max(AssessmentScoreHistory.scored_at))
+        .where(AssessmentScoreHistory.apprentice_id == apprentice_id)
+    )).one()
+    if not count and not page.cursor:
         raise HTTPException(status_code=404, detail="No score history found for this apprentice.")
+    if cond.check(count, last_scored, last_modified=last_scored):
+        return cond.not_modified()
 
-    return history
+    result = await db.execute(page.apply(
+        queries.apprentice_score_history(apprentice_id),
+        AssessmentScoreHistory.scored_at, AssessmentScoreHistory.id
+    ))
+    # Rows straight from the table match the schema; skip re-validating large score_data blobs
+    return trusted_response(AssessmentScoreHistoryOut, page.finish(result.scalars().all()), page.response)
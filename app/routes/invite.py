@@ -8,9 +8,11 @@ from app.models.user import User
 from app.models.mentor_apprentice import MentorApprentice
 from app.models.apprentice_invitation import ApprenticeInvitation
 from app.schemas.invite import InviteCreate, InviteAccept
-from app.services.email import send_invitation_email
+from app.services.email import queue_invitation_email
 from app.exceptions import NotFoundException
 from app.exceptions import ValidationException
+from app.services import queries
+from app.services.mentorship import invalidate_mentor
 
 
 router = APIRouter()
@@ -21,11 +23,8 @@ def invite_apprentice(invite: InviteCreate, db: Session = Depends(get_db)):
     if not mentor:
         raise NotFoundException("Mentor not found")
 
-    existing = db.query(ApprenticeInvitation).filter(
-        ApprenticeInvitation.apprentice_email == invite.apprentice_email,
-        ApprenticeInvitation.mentor_id == invite.mentor_id,
-        ApprenticeInvitation.accepted == False,
-        ApprenticeInvitation.expires_at > datetime.utcnow()
+    existing = db.scalars(
+        queries.pending_invitation(invite.apprentice_email, invite.mentor_id, datetime.utcnow())
     ).first()
     if existing:
         raise HTTPException(status_code=400, detail="An invitation is already pending for this apprentice")
@@ -38,9 +37,10 @@ def invite_apprentice(invite: InviteCreate, db: Session = Depends(get_db)):
         token=token
     )
     db.add(invitation)
+    # Delivered by the email dispatcher; the outbox row commits with the invitation
+    queue_invitation_email(db, to_email=invite.apprentice_email, apprentice_name=invite.apprentice_name, token=token)
     db.commit()
 
-    send_invitation_email(to_email=invite.apprentice_email, apprentice_name=invite.apprentice_name, token=token)
     return {"message": "Invitation sent"}
 
 
@@ -67,5 +67,6 @@ def accept_invite(data: InviteAccept, db: Session = Depends(get_db)):
     )
     db.add(relationship)
     db.commit()
+    invalidate_mentor(invitation.mentor_id)
 
     return {"message": "Invitation accepted, relationship created"}
\ No newline at end of file
@@ -1,58 +1,71 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.auth import require_mentor
-from app.db import get_db
+from app.db import get_db, get_async_db
 from app.models.user import User
 from app.models.mentor_apprentice import MentorApprentice
 from app.models.assessment_draft import AssessmentDraft
+from app.models.apprentice_stats import ApprenticeStats
 from app.schemas.assessment_draft import AssessmentDraftOut
 from app.models.user import User as UserModel
 from app.schemas.apprentice_profile import ApprenticeProfileOut
+from app.schemas.mentor_dashboard import MentorDashboardOut
 from fastapi import Query
 from datetime import datetime
 from app.services.auth import get_current_user
 from app.exceptions import ForbiddenException, NotFoundException
+from app.services.mentorship import (
+    ensure_mentor_of, filter_authorized, get_mentor_apprentice_ids, require_mentor_of_apprentice,
+    require_mentor_of_apprentice_async,
+)
 from sqlalchemy.orm import joinedload
+from fastapi.responses import StreamingResponse
+from app.services import export, queries
+from app.services.pagination import Page
+from app.services.conditional import json_with_etag
+from app.services.mentor_dashboard import build_dashboard
+from app.services.draft_answers import answers_for_drafts
+from app.services.compression import compression
+import json
 
 router = APIRouter()
 
 @router.get("/my-apprentices", response_model=list[dict])
-def list_apprentices(
-    current_user: User = Depends(require_mentor),
-    db: Session = Depends(get_db)
+async def list_apprentices(
+    apprentice_ids: frozenset = Depends(get_mentor_apprentice_ids),
+    page: Page = Depends(),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    apprentices = (
-        db.query(MentorApprentice)
-        .filter(MentorApprentice.mentor_id == current_user.id)
-        .all()
-    )
-
-    apprentice_ids = [a.apprentice_id for a in apprentices]
-    apprentice_users = (
-        db.query(UserModel)
-        .filter(UserModel.id.in_(apprentice_ids))
-        .all()
-    )
+    result = await db.execute(page.apply(
+        select(UserModel).where(UserModel.id.in_(apprentice_ids)),
+        UserModel.created_at, UserModel.id
+    ))
+    apprentice_users = page.finish(result.scalars().all())
 
     return [
         {"id": u.id, "name": u.name, "email": u.email}
         for u in apprentice_users
     ]
 
+@router.get("/dashboard", response_model=MentorDashboardOut)
+def get_mentor_dashboard(
+    request: Request,
+    current_user: User = Depends(require_mentor),
+    db: Session = Depends(get_db)
+):
+    """All apprentices' summaries in one response; revalidate with If-None-Match."""
+    apprentices = build_dashboard(db, current_user.id, filter_authorized(db, current_user.id))
+    body = MentorDashboardOut(apprentices=apprentices).model_dump_json().encode()
+    return json_with_etag(request, body)
+
 @router.get("/apprentice/{apprentice_id}/draft", response_model=AssessmentDraftOut)
 def get_apprentice_draft(
     apprentice_id: str,
-    current_user: User = Depends(require_mentor),
+    current_user: User = Depends(require_mentor_of_apprentice),
     db: Session = Depends(get_db)
 ):
-    # Check if this apprentice belongs to the current mentor
-    mapping = db.query(MentorApprentice).filter_by(
-        mentor_id=current_user.id, apprentice_id=apprentice_id
-    ).first()
-    if not mapping:
-        raise ForbiddenException("Not authorized to view this apprentice")
-
     draft = (
         db.query(AssessmentDraft)
         .filter_by(apprentice_id=apprentice_id, is_submitted=False)
@@ -99,39 +112,21 @@ from app.schemas.assessment import AssessmentOut
 #     return assessments
 
 @router.get("/apprentice/{apprentice_id}/submitted-assessments", response_model=list[AssessmentOut])
-def get_submitted_assessments_for_apprentice(
+async def get_submitted_assessments_for_apprentice(
     apprentice_id: str,
     category: str = Query(None),
     start_date: datetime = Query(None),
     end_date: datetime = Query(None),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(10, ge=1),
-    current_user: User = Depends(require_mentor),
-    db: Session = Depends(get_db)
+    page: Page = Depends(),
+    current_user: User = Depends(require_mentor_of_apprentice_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Verify mentor-apprentice relationship
-    mapping = db.query(MentorApprentice).filter_by(
-        mentor_id=current_user.id,
-        apprentice_id=apprentice_id
-    ).first()
-    if not mapping:
-        raise ForbiddenException("Not authorized to view this apprentice")
-
-    query = (
-        db.query(Assessment)
-        .options(joinedload(Assessment.score_history))  # 👈 include related scores
-        .filter(Assessment.apprentice_id == apprentice_id)
+    query = queries.apprentice_assessments(apprentice_id, category, start_date, end_date).options(
+        selectinload(Assessment.score_history)  # 👈 include related scores
     )
 
-    if category:
-        query = query.filter(Assessment.category == category)
-    if start_date:
-        query = query.filter(Assessment.created_at >= start_date)
-    if end_date:
-        query = query.filter(Assessment.created_at <= end_date)
-
-    assessments = query.order_by(Assessment.created_at.desc()).offset(skip).limit(limit).all()
-    return assessments
+    result = await db.execute(page.apply(query, Assessment.created_at, Assessment.id))
+    return page.finish(result.scalars().all())
 
 @router.get("/assessment/{assessment_id}", response_model=AssessmentOut)
 def get_assessment_detail(
@@ -143,13 +138,7 @@ def get_assessment_detail(
     if not assessment:
         raise NotFoundException("Assessment not found")
 
-    # Check mentor-apprentice relationship
-    mapping = db.query(MentorApprentice).filter_by(
-        mentor_id=current_user.id,
-        apprentice_id=assessment.apprentice_id
-    ).first()
-    if not mapping:
-        raise ForbiddenException("Not authorized to view this assessment")
+    ensure_mentor_of(db, current_user.id, assessment.apprentice_id, "Not authorized to view this assessment")
 
     return assessment
 
@@ -164,115 +153,104 @@ def get_submitted_drafts(
     apprentice_id: str = Query(default=None),
     start_date: datetime = Query(default=None),
     end_date: datetime = Query(default=None),
+    page: Page = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_mentor)
 ):
-    query = db.query(AssessmentDraft).join(
-        MentorApprentice,
-        MentorApprentice.apprentice_id == AssessmentDraft.apprentice_id
-    ).filter(
-        MentorApprentice.mentor_id == current_user.id,
-        AssessmentDraft.is_submitted.is_(True)
-    )
-
+    apprentice_ids = filter_authorized(db, current_user.id, [apprentice_id] if apprentice_id else None)
     if apprentice_id:
-        query = query.filter(AssessmentDraft.apprentice_id == apprentice_id)
-    if start_date:
-        query = query.filter(AssessmentDraft.updated_at >= start_date)
-    if end_date:
-        query = query.filter(AssessmentDraft.updated_at <= end_date)
-
-    return query.all()
-
-@router.get("/submitted-drafts/{draft_id}", response_model=AssessmentDraftOut)
-def get_single_submitted_draft(
-    draft_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_mentor)
-):
-    draft = db.query(AssessmentDraft).filter_by(id=draft_id, is_submitted=True).first()
-    if not draft:
-        raise NotFoundException("Submitted draft not found")
-
-    # Make sure this mentor is linked to the apprentice
-    mapping = db.query(MentorApprentice).filter_by(
-        mentor_id=current_user.id,
-        apprentice_id=draft.apprentice_id
-    ).first()
-
-    if not mapping:
-        raise ForbiddenException("Not authorized to view this draft")
-
-    return draft
+        # One apprentice: an equality seek on the partial index instead of an IN list
+        apprentice_ids = apprentice_id if apprentice_ids else ()
+    stmt = queries.submitted_drafts(apprentice_ids, start_date, end_date).options(
+        selectinload(AssessmentDraft.answers_rel)
+    )
 
-from fastapi.responses import StreamingResponse
-import io
-import csv
-import json
+    return page.finish(db.scalars(page.apply(stmt, AssessmentDraft.created_at, AssessmentDraft.id)).all())
 
 @router.get("/submitted-drafts/export")
+@compression("fast")
 def export_submitted_drafts(
-    format: str = Query(default="csv", enum=["csv", "json"]),
+    format: str = Query(default="csv", enum=["csv", "json", "ndjson"]),
+    gzip: bool = Query(default=False),
     apprentice_id: str = Query(default=None),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_mentor)
 ):
-    query = db.query(
-        AssessmentDraft,
+    # Declared before /submitted-drafts/{draft_id} so "export" is not read as a draft id.
+    # Rows stream from a server-side cursor and are encoded batch by batch.
+    stmt = select(
+        AssessmentDraft.id,
+        AssessmentDraft.apprentice_id,
         User.name,
-        User.email
+        User.email,
+        AssessmentDraft.last_question_id,
+        AssessmentDraft.updated_at,
     ).join(
         User, AssessmentDraft.apprentice_id == User.id
-    ).join(
-        MentorApprentice,
-        MentorApprentice.apprentice_id == AssessmentDraft.apprentice_id
-    ).filter(
-        MentorApprentice.mentor_id == current_user.id,
-        AssessmentDraft.is_submitted.is_(True)
+    ).where(
+        AssessmentDraft.apprentice_id.in_(
+            filter_authorized(db, current_user.id, [apprentice_id] if apprentice_id else None)
+        ),
+        AssessmentDraft.is_submitted == True
+    ).order_by(AssessmentDraft.updated_at, AssessmentDraft.id)
+
+    def with_answers(batches):
+        # One answer query per batch of drafts
+        for batch in batches:
+            answers = answers_for_drafts(db, [row.id for row in batch])
+            yield [(row, answers[row.id]) for row in batch]
+
+    def to_dict(item):
+        row, answers = item
+        return {
+            "id": row.id,
+            "apprentice_id": row.apprentice_id,
+            "apprentice_name": row.name,
+            "apprentice_email": row.email,
+            "answers": answers,
+            "last_question_id": row.last_question_id,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None
+        }
+
+    def to_row(item):
+        row, answers = item
+        return [
+            row.id,
+            row.apprentice_id,
+            row.name,
+            row.email,
+            row.last_question_id,
+            row.updated_at.isoformat() if row.updated_at else None,
+            json.dumps(answers)
+        ]
+
+    chunks = export.encode_rows(
+        with_answers(export.stream_rows(db, stmt)),
+        format,
+        header=[
+            "id", "apprentice_id", "apprentice_name", "apprentice_email",
+            "last_question_id", "updated_at", "answers"
+        ],
+        to_row=to_row,
+        to_dict=to_dict,
+        gzip=gzip,
     )
+    media_type, headers = export.download_headers("submitted_drafts", format, gzip)
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
 
-    if apprentice_id:
-        query = query.filter(AssessmentDraft.apprentice_id == apprentice_id)
-
-    results = query.all()
-
-    if format == "json":
-        content = json.dumps([{
-            "id": d.id,
-            "apprentice_id": d.apprentice_id,
-            "apprentice_name": name,
-            "apprentice_email": email,
-            "answers": d.answers,
-            "last_question_id": d.last_question_id,
-            "updated_at": d.updated_at.isoformat()
-        } for d, name, email in results], indent=2)
-        return StreamingResponse(io.StringIO(content), media_type="application/json", headers={
-            "Content-Disposition": "attachment; filename=submitted_drafts.json"
-        })
-
-    # CSV export
-    csv_buffer = io.StringIO()
-    writer = csv.writer(csv_buffer)
-    writer.writerow([
-        "id", "apprentice_id", "apprentice_name", "apprentice_email",
-        "last_question_id", "updated_at", "answers"
-    ])
+@router.get("/submitted-drafts/{draft_id}", response_model=AssessmentDraftOut)
+def get_single_submitted_draft(
+    draft_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_mentor)
+):
+    draft = db.query(AssessmentDraft).filter_by(id=draft_id, is_submitted=True).first()
+    if not draft:
+        raise NotFoundException("Submitted draft not found")
 
-    for d, name, email in results:
-        writer.writerow([
-            d.id,
-            d.apprentice_id,
-            name,
-            email,
-            d.last_question_id,
-            d.updated_at.isoformat(),
-            json.dumps(d.answers)
-        ])
+    ensure_mentor_of(db, current_user.id, draft.apprentice_id, "Not authorized to view this draft")
 
-    csv_buffer.seek(0)
-    return StreamingResponse(csv_buffer, media_type="text/csv", headers={
-        "Content-Disposition": "attachment; filename=submitted_drafts.csv"
-    })
+    return draft
 
 @router.get("/my-apprentices/{apprentice_id}", response_model=ApprenticeProfileOut)
 def get_apprentice_profile(
@@ -280,41 +258,27 @@ def get_apprentice_profile(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    # Check mentorship relationship
-    link = db.query(MentorApprentice).filter_by(
-        mentor_id=current_user.id,
-        apprentice_id=apprentice_id
-    ).first()
-
-    if not link:
-        raise ForbiddenException("Not authorized to access this apprentice")
+    ensure_mentor_of(db, current_user.id, apprentice_id, "Not authorized to access this apprentice")
 
-    apprentice = db.query(User).filter_by(id=apprentice_id, role="apprentice").first()
-    if not apprentice:
+    # One indexed lookup: the user plus their maintained rollup (app.services.apprentice_stats)
+    row = db.execute(
+        select(User, ApprenticeStats)
+        .outerjoin(ApprenticeStats, ApprenticeStats.apprentice_id == User.id)
+        .where(User.id == apprentice_id, User.role == "apprentice")
+    ).first()
+    if not row:
         raise NotFoundException("Apprentice not found")
-
-    # Fetch stats
-    total_assessments = db.query(AssessmentDraft).filter_by(
-        apprentice_id=apprentice_id,
-        is_submitted=True
-    ).count()
-
-    average_score = db.query(func.avg(AssessmentDraft.score)).filter_by(
-        apprentice_id=apprentice_id,
-        is_submitted=True
-    ).scalar()
-
-    last_submission = db.query(func.max(AssessmentDraft.updated_at)).filter_by(
-        apprentice_id=apprentice_id,
-        is_submitted=True
-    ).scalar()
+    apprentice, stats = row
 
     return ApprenticeProfileOut(
         id=apprentice.id,
         name=apprentice.name,
         email=apprentice.email,
         join_date=apprentice.created_at if hasattr(apprentice, "created_at") else None,
-        total_assessments=total_assessments,
-        average_score=round(average_score, 2) if average_score else None,
-        last_submission=last_submission
-    )
\ No newline at end of file
+        total_assessments=stats.submission_count if stats else 0,
+        average_score=stats.average_score if stats else None,
+        last_submission=stats.last_submission_at if stats else None,
+        category_scores={
+            category: entry["score"] for category, entry in stats.category_scores.items()
+        } if stats else {},
+    )
@@ -3,10 +3,12 @@ from sqlalchemy.orm import Session
 from app.db import get_db
 from app.models.mentor_note import MentorNote
 from app.models.assessment import Assessment
-from app.models.mentor_apprentice import MentorApprentice
 from app.schemas.mentor_note import MentorNoteCreate, MentorNoteOut
 from app.services.auth import require_mentor
+from app.services.mentorship import ensure_mentor_of
 from app.models.user import User
+from app.services import queries
+from app.services.pagination import Page
 
 router = APIRouter(prefix="/mentor-notes", tags=["Mentor Notes"])
 
@@ -22,12 +24,7 @@ def create_mentor_note(
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
 
-    mapping = db.query(MentorApprentice).filter_by(
-        mentor_id=current_user.id,
-        apprentice_id=assessment.apprentice_id
-    ).first()
-    if not mapping:
-        raise HTTPException(status_code=403, detail="Not authorized to comment on this assessment")
+    ensure_mentor_of(db, current_user.id, assessment.apprentice_id, "Not authorized to comment on this assessment")
 
     note = MentorNote(
         assessment_id=note_data.assessment_id,
@@ -46,6 +43,7 @@ def create_mentor_note(
 @router.get("/assessment/{assessment_id}", response_model=list[MentorNoteOut])
 def list_mentor_notes_for_assessment(
     assessment_id: str,
+    page: Page = Depends(),
     current_user: User = Depends(require_mentor),
     db: Session = Depends(get_db)
 ):
@@ -54,15 +52,10 @@ def list_mentor_notes_for_assessment(
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
 
-    mapping = db.query(MentorApprentice).filter_by(
-        mentor_id=current_user.id,
-        apprentice_id=assessment.apprentice_id
-    ).first()
-    if not mapping:
-        raise HTTPException(status_code=403, detail="Not authorized")
+    ensure_mentor_of(db, current_user.id, assessment.apprentice_id, "Not authorized")
 
-    notes = db.query(MentorNote).filter_by(assessment_id=assessment_id).order_by(MentorNote.created_at.desc()).all()
-    return notes
+    stmt = page.apply(queries.assessment_notes(assessment_id), MentorNote.created_at, MentorNote.id)
+    return page.finish(db.scalars(stmt).all())
 
 
 @router.delete("/{note_id}", status_code=204)
@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from app.db import get_db
 from app.models.category import Category
 from app.models.question import Question
 from app.schemas.question import CategoryCreate, QuestionCreate, CategoryOut, QuestionOut
+from app.services.pagination import Page
+from app.services.conditional import Conditional
 
 router = APIRouter()
 
@@ -16,8 +19,9 @@ def create_category(category: CategoryCreate, db: Session = Depends(get_db)):
     return db_category
 
 @router.get("/categories", response_model=list[CategoryOut])
-def list_categories(db: Session = Depends(get_db)):
-    return db.query(Category).all()
+def list_categories(page: Page = Depends(), db: Session = Depends(get_db)):
+    # Catalog tables have no timestamps; page through them by id
+    return page.finish(page.apply(db.query(Category), Category.id, descending=False).all())
 
 @router.post("/questions", response_model=QuestionOut)
 def create_question(question: QuestionCreate, db: Session = Depends(get_db)):
@@ -28,5 +32,8 @@ def create_question(question: QuestionCreate, db: Session = Depends(get_db)):
     return db_question
 
 @router.get("/questions", response_model=list[QuestionOut])
-def list_questions(db: Session = Depends(get_db)):
-    return db.query(Question).all()
\ No newline at end of file
+def list_questions(page: Page = Depends(), cond: Conditional = Depends(), db: Session = Depends(get_db)):
+    count, last_updated = db.execute(select(func.count(), func.max(Question.updated_at))).one()
+    if cond.check(count, last_updated, last_modified=last_updated):
+        return cond.not_modified()
+    return page.finish(page.apply(db.query(Question), Question.id, descending=False).all())
\ No newline at end of file
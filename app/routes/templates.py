@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.orm import Session
+from app.db import get_db
+from app.exceptions import NotFoundException
+from app.models.user import User
+from app.services.auth import get_current_user
+from app.services.compression import compression
+from app.services.conditional import etag_matches
+from app.services.template_bundles import get_bundle
+
+router = APIRouter(prefix="/templates", tags=["Templates"])
+
+# A (template, version) bundle never changes once published
+IMMUTABLE = "private, max-age=31536000, immutable"
+REVALIDATE = "private, no-cache"
+
+
+def _bundle_response(request: Request, entry: dict, cache_control: str) -> Response:
+    headers = {
+        "ETag": entry["etag"],
+        "Cache-Control": cache_control,
+        "X-Template-Version": str(entry["payload"]["version"]),
+    }
+    if etag_matches(request, entry["etag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry["body"], media_type="application/json", headers=headers)
+
+
+@router.get("/{template_id}")
+def get_current_template(
+    template_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """The current published bundle; clients should switch to the versioned URL it names."""
+    entry = get_bundle(db, template_id)
+    if entry is None:
+        raise NotFoundException("Template not found or not published")
+    response = _bundle_response(request, entry, REVALIDATE)
+    response.headers["Content-Location"] = f"/templates/{template_id}/versions/{entry['payload']['version']}"
+    return response
+
+
+@router.get("/{template_id}/versions/{version}")
+# Clients keep a version for a year, so spend more CPU once on a smaller body
+@compression("best")
+def get_template_version(
+    template_id: str,
+    version: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    entry = get_bundle(db, template_id, version)
+    if entry is None:
+        raise NotFoundException("Template version not found")
+    return _bundle_response(request, entry, IMMUTABLE)
@@ -3,11 +3,12 @@ from sqlalchemy.orm import Session
 from app.schemas import user as user_schema
 from app.models import user as user_model
 from app.db import get_db
-from app.services.auth import verify_token, require_roles
+from app.services.auth import verify_token, require_roles, require_admin, invalidate_user
 from firebase_admin import auth
 from app.models.mentor_apprentice import MentorApprentice
 from app.models.user import User
 from app.exceptions import NotFoundException
+from app.services.mentorship import invalidate_mentor
 
 router = APIRouter()
 
@@ -24,6 +25,7 @@ def assign_apprentice(mentor_id: str, apprentice_id: str, db: Session = Depends(
     relationship = MentorApprentice(mentor_id=mentor_id, apprentice_id=apprentice_id)
     db.add(relationship)
     db.commit()
+    invalidate_mentor(mentor_id)
     return {"message": "Apprentice assigned successfully"}
 
 @router.post("/", response_model=user_schema.UserOut)
@@ -36,6 +38,7 @@ def create_user(user: user_schema.UserCreate, db: Session = Depends(get_db), dec
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
+    invalidate_user(db_user.id)
 
     try:
         auth.set_custom_user_claims(user.id, {"role": user.role})
@@ -44,6 +47,24 @@ def create_user(user: user_schema.UserCreate, db: Session = Depends(get_db), dec
 
     return db_user
 
+@router.patch("/{user_id}/role", response_model=user_schema.UserOut, dependencies=[Depends(require_admin)])
+def change_user_role(user_id: str, role: user_schema.RoleEnum, db: Session = Depends(get_db)):
+    db_user = db.query(User).filter_by(id=user_id).first()
+    if not db_user:
+        raise NotFoundException("User not found")
+
+    db_user.role = role.value
+    db.commit()
+    db.refresh(db_user)
+    invalidate_user(user_id)
+
+    try:
+        auth.set_custom_user_claims(user_id, {"role": role.value})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error assigning Firebase role: {str(e)}")
+
+    return db_user
+
 @router.get("/admin-only")
 def test_admin_only(decoded_token=Depends(require_roles(["admin"]))):
     return {"message": f"Access granted for admin: {decoded_token.get('email')}"}
\ No newline at end of file
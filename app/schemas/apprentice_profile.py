@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 
 class ApprenticeProfileOut(BaseModel):
@@ -10,6 +10,8 @@ class ApprenticeProfileOut(BaseModel):
     total_assessments: int
     average_score: Optional[float]
     last_submission: Optional[datetime]
+    # Latest score per category, from each category's most recent submission
+    category_scores: Dict[str, float] = {}
 
     class Config:
         from_attributes = True
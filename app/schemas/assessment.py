@@ -15,6 +15,7 @@ class AssessmentOut(BaseModel):
     answers: Dict[str, str]
     scores: Optional[Dict[str, int]]
     recommendation: Optional[str]
+    scoring_status: Optional[str] = None
     created_at: datetime
     latest_score: Optional[AssessmentScoreHistoryOut] = None
 
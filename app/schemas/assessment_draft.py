@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional, Dict, List
+from typing import Literal, Optional, Dict, List
+from datetime import datetime
 
 class QuestionItem(BaseModel):
     id: str
@@ -17,15 +18,38 @@ class AssessmentDraftCreate(BaseModel):
 class AssessmentDraftUpdate(BaseModel):
     last_question_id: Optional[str]
     answers: Optional[Dict[str, str]]
+    # When given, the update is rejected with 409 if the draft has moved on
+    revision: Optional[int] = None
+
+class DraftPatchOp(BaseModel):
+    """One JSON Patch (RFC 6902) operation on ``/answers/<question_id>`` or ``/last_question_id``."""
+    op: Literal["add", "replace", "remove"]
+    path: str
+    value: Optional[str] = None
+
+class AssessmentDraftPatch(BaseModel):
+    revision: int
+    patch: List[DraftPatchOp]
+
+class AssessmentDraftPatchOut(BaseModel):
+    id: str
+    revision: int
+    answered_count: int
+    last_question_id: Optional[str]
+    updated_at: Optional[datetime]
 
 class AssessmentDraftOut(BaseModel):
     id: str
     apprentice_id: str
     template_id: str
+    template_version: Optional[int] = None
+    revision: int = 0
     answers: Optional[Dict[str, str]]
     last_question_id: Optional[str]
     is_submitted: bool
-    questions: List[QuestionItem]
+    # Every question of the draft's template version is answered (autosave only)
+    is_complete: Optional[bool] = None
+    questions: List[QuestionItem] = []
 
     class Config:
         from_attributes = True
@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from datetime import datetime
+
+
+class DashboardAssessment(BaseModel):
+    id: str
+    template_id: Optional[str]
+    scoring_status: Optional[str]
+    overall_score: Optional[float]
+    recommendation: Optional[str]
+    created_at: Optional[datetime]
+
+
+class DashboardDraft(BaseModel):
+    id: str
+    template_id: str
+    answered_count: int
+    updated_at: Optional[datetime]
+
+
+class DashboardApprentice(BaseModel):
+    id: str
+    name: str
+    email: str
+    total_assessments: int
+    average_score: Optional[float]
+    last_submission: Optional[datetime]
+    category_scores: Dict[str, float] = {}
+    latest_assessment: Optional[DashboardAssessment] = None
+    # Most recently edited in-progress draft, and how many are open
+    open_draft: Optional[DashboardDraft] = None
+    open_draft_count: int = 0
+    # Shared notes on this apprentice's assessments they have not viewed yet
+    unread_notes: int = 0
+
+
+class MentorDashboardOut(BaseModel):
+    apprentices: List[DashboardApprentice]
@@ -16,6 +16,7 @@ class MentorNoteOut(MentorNoteBase):
     id: str
     mentor_id: str
     created_at: datetime
+    read_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
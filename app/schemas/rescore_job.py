@@ -0,0 +1,36 @@
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from datetime import datetime
+
+
+class RescoreJobCreate(BaseModel):
+    scope: Literal["apprentice", "template", "all"]
+    scope_id: Optional[str] = None
+    concurrency: int = Field(4, ge=1, le=32)
+    target_per_minute: Optional[float] = Field(None, gt=0)
+
+
+class RescoreJobOut(BaseModel):
+    id: str
+    scope: str
+    scope_id: Optional[str] = None
+    status: str
+    total: int
+    processed: int
+    failed: int
+    failed_ids: List[str] = []
+    checkpoint_id: Optional[str] = None
+    concurrency: int
+    target_per_minute: Optional[float] = None
+    model_used: str
+    last_error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    percent_complete: float = 0.0
+    rate_per_minute: Optional[float] = None
+    eta_seconds: Optional[float] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class ScoringJobOut(BaseModel):
+    id: str
+    assessment_id: str
+    status: str
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ScoringStatusOut(BaseModel):
+    assessment_id: str
+    scoring_status: str
+    job: Optional[ScoringJobOut] = None
@@ -1,11 +1,59 @@
-from openai import OpenAI
-import os
+from sqlalchemy.orm import Session
+import json
+from app.services import scoring_cache
+from app.services.openai_client import client_from_env
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+client = client_from_env()
 
-def score_assessment(answers: dict) -> dict:
-    """Send answers to GPT and receive scored feedback."""
+MODEL = "gpt-4"
+TEMPERATURE = 0.7
+# Bump whenever the system prompt below changes so cached results are not reused.
+PROMPT_VERSION = "2025-06-v1"
 
+
+class IncompleteScoresError(RuntimeError):
+    """The model returned no usable score for some answers; the ones it did score are cached."""
+
+    def __init__(self, missing):
+        self.missing = list(missing)
+        super().__init__(f"No score returned for questions: {', '.join(self.missing)}")
+
+
+def score_assessment(answers: dict, db: Session = None, use_cache: bool = True) -> dict:
+    """Send answers to GPT and receive scored feedback.
+
+    Each answer is cached on its own by (question id, answer hash, model,
+    prompt version, temperature), so only answers that changed since they
+    were last scored are sent to the model; pass ``db`` to share the cache
+    across workers.
+
+    Raises ``IncompleteScoresError`` if any answer comes back without a
+    score, so callers retry rather than record a partial result.
+    """
+    results = {}
+    pending = {}
+    for question_id, answer in answers.items():
+        key = scoring_cache.answer_key(question_id, answer, MODEL, PROMPT_VERSION, TEMPERATURE)
+        cached = scoring_cache.get_cached(db, key) if use_cache else None
+        if cached is not None:
+            results[question_id] = cached
+        else:
+            pending[question_id] = key
+
+    if pending:
+        fresh = _request_scores({q: answers[q] for q in pending})
+        for question_id, key in pending.items():
+            result = fresh.get(question_id)
+            if isinstance(result, dict) and "score" in result:
+                scoring_cache.store(db, key, result, MODEL, PROMPT_VERSION)
+                results[question_id] = result
+
+    missing = [q for q in answers if q not in results]
+    if missing:
+        raise IncompleteScoresError(missing)
+    return {q: results[q] for q in answers}
+
+def _request_scores(answers: dict) -> dict:
     messages = [
         {
             "role": "system",
@@ -26,10 +74,17 @@ def score_assessment(answers: dict) -> dict:
         }
     ]
 
-    response = client.chat.completions.create(
-        model="gpt-4",
-        messages=messages,
-        temperature=0.7
-    )
+    content = client.complete_sync(messages, model=MODEL, temperature=TEMPERATURE)
+    return json.loads(content)
+
+def summarize_scores(score_data: dict):
+    """Reduce per-question results to ``(scores, overall_score, recommendation)``.
 
-    return response.choices[0].message.content
+    The recommendation surfaced on the assessment is the one for the weakest area.
+    """
+    scores = {q: int(d["score"]) for q, d in score_data.items() if isinstance(d, dict) and "score" in d}
+    if not scores:
+        return {}, None, None
+    overall = round(sum(scores.values()) / len(scores), 2)
+    weakest = min(scores, key=scores.get)
+    return scores, overall, score_data[weakest].get("recommendation")
@@ -0,0 +1,253 @@
+"""Columnar export of per-question scores for analytics.
+
+Flattens ``AssessmentScoreHistory.score_data`` (or the current
+``Assessment.scores``) into one typed row per (assessment, question) and
+writes Parquet or Arrow IPC, one row group / record batch per database
+batch, so memory stays bounded by ``batch_size``.
+
+CLI: ``python -m app.services.analytics_export --out scores.parquet``
+"""
+import argparse
+import io
+from functools import lru_cache
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.assessment import Assessment
+from app.models.assessment_score_history import AssessmentScoreHistory
+from app.models.category import Category
+from app.models.question import Question
+from app.models.user import User
+
+FORMATS = ("parquet", "arrow")
+SOURCES = ("history", "assessments")
+BATCH_SIZE = 5000
+
+MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise RuntimeError("pyarrow is required for columnar exports (pip install pyarrow)") from e
+    return pa
+
+
+@lru_cache(maxsize=1)
+def score_schema():
+    pa = _pyarrow()
+    return pa.schema([
+        ("source", pa.dictionary(pa.int8(), pa.string())),
+        ("history_id", pa.string()),
+        ("assessment_id", pa.string()),
+        ("apprentice_id", pa.string()),
+        ("apprentice_name", pa.string()),
+        ("template_id", pa.string()),
+        ("question_id", pa.string()),
+        ("question_text", pa.string()),
+        ("category", pa.dictionary(pa.int32(), pa.string())),
+        ("score", pa.int16()),
+        ("model_used", pa.dictionary(pa.int8(), pa.string())),
+        ("triggered_by", pa.dictionary(pa.int8(), pa.string())),
+        ("scored_at", pa.timestamp("us")),
+    ])
+
+
+def question_lookup(db: Session) -> dict:
+    """question_id -> (text, category name); the question bank is small enough to hold."""
+    rows = db.execute(
+        select(Question.id, Question.text, Category.name)
+        .outerjoin(Category, Question.category_id == Category.id)
+    ).all()
+    return {qid: (text, category) for qid, text, category in rows}
+
+
+def _statement(source: str, template_id: str = None, apprentice_id: str = None):
+    if source == "history":
+        stmt = (
+            select(
+                AssessmentScoreHistory.id.label("history_id"),
+                AssessmentScoreHistory.assessment_id,
+                AssessmentScoreHistory.apprentice_id,
+                User.name.label("apprentice_name"),
+                Assessment.template_id,
+                Assessment.category,
+                AssessmentScoreHistory.score_data.label("scores"),
+                AssessmentScoreHistory.model_used,
+                AssessmentScoreHistory.triggered_by,
+                AssessmentScoreHistory.scored_at,
+            )
+            .join(Assessment, AssessmentScoreHistory.assessment_id == Assessment.id)
+            .join(User, AssessmentScoreHistory.apprentice_id == User.id)
+            .order_by(AssessmentScoreHistory.scored_at, AssessmentScoreHistory.id)
+        )
+    elif source == "assessments":
+        stmt = (
+            select(
+                Assessment.id.label("assessment_id"),
+                Assessment.apprentice_id,
+                User.name.label("apprentice_name"),
+                Assessment.template_id,
+                Assessment.category,
+                Assessment.scores,
+                Assessment.created_at.label("scored_at"),
+            )
+            .join(User, Assessment.apprentice_id == User.id)
+            .where(Assessment.scores.is_not(None))
+            .order_by(Assessment.created_at, Assessment.id)
+        )
+    else:
+        raise ValueError(f"Unknown source: {source}")
+    if template_id:
+        stmt = stmt.where(Assessment.template_id == template_id)
+    if apprentice_id:
+        stmt = stmt.where(Assessment.apprentice_id == apprentice_id)
+    return stmt
+
+
+def _score_value(value):
+    # History rows hold {"score": n, ...}; Assessment.scores holds bare ints
+    if isinstance(value, dict):
+        value = value.get("score")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def flatten_batch(rows, source: str, questions: dict) -> dict:
+    columns = {name: [] for name in score_schema().names}
+    for row in rows:
+        mapping = row._mapping
+        for question_id, value in (row.scores or {}).items():
+            text, category = questions.get(question_id, (None, None))
+            columns["source"].append(source)
+            columns["history_id"].append(mapping.get("history_id"))
+            columns["assessment_id"].append(row.assessment_id)
+            columns["apprentice_id"].append(row.apprentice_id)
+            columns["apprentice_name"].append(row.apprentice_name)
+            columns["template_id"].append(row.template_id)
+            columns["question_id"].append(question_id)
+            columns["question_text"].append(text)
+            columns["category"].append(category or row.category)
+            columns["score"].append(_score_value(value))
+            columns["model_used"].append(mapping.get("model_used"))
+            columns["triggered_by"].append(mapping.get("triggered_by"))
+            columns["scored_at"].append(row.scored_at)
+    return columns
+
+
+def record_batches(db: Session, source: str = "history", template_id: str = None,
+                   apprentice_id: str = None, batch_size: int = BATCH_SIZE):
+    """Yield one ``pyarrow.RecordBatch`` per database batch."""
+    pa = _pyarrow()
+    schema = score_schema()
+    questions = question_lookup(db)
+    stmt = _statement(source, template_id, apprentice_id).execution_options(yield_per=batch_size)
+    result = db.execute(stmt)
+    try:
+        for rows in result.partitions():
+            columns = flatten_batch(rows, source, questions)
+            if columns["question_id"]:
+                yield pa.RecordBatch.from_pydict(columns, schema=schema)
+    finally:
+        result.close()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose buffered bytes are drained between batches."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer.extend(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def _writer(format: str, sink, schema):
+    pa = _pyarrow()
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(sink, schema, compression="zstd")
+    if format == "arrow":
+        return pa.ipc.new_stream(sink, schema)
+    raise ValueError(f"Unknown format: {format}")
+
+
+def write_batches(batches, format: str, sink):
+    """Write record batches to ``sink``, one row group (Parquet) or message (Arrow) each."""
+    writer = _writer(format, sink, score_schema())
+    rows = 0
+    try:
+        for batch in batches:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        writer.close()
+    return rows
+
+
+def stream_export(db: Session, format: str = "parquet", source: str = "history",
+                  template_id: str = None, apprentice_id: str = None, batch_size: int = BATCH_SIZE):
+    """Yield the encoded file chunk by chunk, as each row group is written."""
+    sink = _ChunkSink()
+    writer = _writer(format, sink, score_schema())
+    try:
+        for batch in record_batches(db, source, template_id, apprentice_id, batch_size):
+            writer.write_batch(batch)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def main(argv=None):
+    from app.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Export per-question scores as Parquet or Arrow IPC.")
+    parser.add_argument("--out", required=True, help="output file path")
+    parser.add_argument("--format", choices=FORMATS, help="defaults to the --out extension, else parquet")
+    parser.add_argument("--source", choices=SOURCES, default="history")
+    parser.add_argument("--template-id")
+    parser.add_argument("--apprentice-id")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+    format = args.format or ("arrow" if args.out.endswith((".arrow", ".arrows")) else "parquet")
+
+    db = SessionLocal()
+    try:
+        with open(args.out, "wb") as out:
+            rows = write_batches(
+                record_batches(db, args.source, args.template_id, args.apprentice_id, args.batch_size),
+                format,
+                out,
+            )
+    finally:
+        db.close()
+    print(f"Wrote {rows} rows to {args.out}")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Incrementally maintained per-apprentice rollups behind the mentor profile.
+
+``record_submission`` runs in the submit transaction and ``record_scores`` in
+the scoring / rescoring transaction, so the stats commit or roll back with
+the data they summarise. ``rebuild_stats`` recomputes them from the raw
+assessments when they drift (or after the table is first created):
+
+    python -m app.services.apprentice_stats [--apprentice-id ID]
+"""
+import argparse
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.apprentice_stats import ApprenticeStats
+from app.models.assessment import Assessment
+from app.models.category import Category
+from app.models.question import Question
+
+def overall_score(scores: dict):
+    """Mean of the per-question scores, as ``ai_scoring.summarize_scores`` reports it."""
+    values = [v for v in (scores or {}).values() if isinstance(v, (int, float))]
+    return sum(values) / len(values) if values else None
+
+
+def _stats_for_update(db: Session, apprentice_id: str) -> ApprenticeStats:
+    stmt = select(ApprenticeStats).where(ApprenticeStats.apprentice_id == apprentice_id).with_for_update()
+    stats = db.execute(stmt).scalar_one_or_none()
+    if stats is not None:
+        return stats
+    stats = ApprenticeStats(
+        apprentice_id=apprentice_id, submission_count=0, scored_count=0, score_sum=0.0, category_scores={}
+    )
+    try:
+        with db.begin_nested():
+            db.add(stats)
+    except IntegrityError:
+        # Another transaction created the row first; lock theirs instead
+        stats = db.execute(stmt).scalar_one()
+    return stats
+
+
+def _category_averages(scores: dict, categories: dict) -> dict:
+    grouped = {}
+    for question_id, score in (scores or {}).items():
+        category = categories.get(question_id)
+        if category and isinstance(score, (int, float)):
+            grouped.setdefault(category, []).append(score)
+    return {category: round(sum(values) / len(values), 2) for category, values in grouped.items()}
+
+
+def _merge_latest(current: dict, assessment, category_scores: dict) -> dict:
+    """Keep each category's score from the most recently submitted assessment."""
+    merged = dict(current or {})
+    submitted_at = (assessment.created_at or datetime.utcnow()).isoformat()
+    for category, score in category_scores.items():
+        existing = merged.get(category)
+        if existing and (existing["submitted_at"], existing["assessment_id"]) > (submitted_at, assessment.id):
+            continue
+        merged[category] = {"score": score, "assessment_id": assessment.id, "submitted_at": submitted_at}
+    return merged
+
+
+def question_categories(db: Session, question_ids) -> dict:
+    question_ids = set(question_ids)
+    if not question_ids:
+        return {}
+    rows = db.execute(
+        select(Question.id, Category.name)
+        .join(Category, Question.category_id == Category.id)
+        .where(Question.id.in_(question_ids))
+    ).all()
+    return dict(rows)
+
+
+def record_submission(db: Session, assessment: Assessment):
+    """Count a new submission; the caller commits."""
+    stats = _stats_for_update(db, assessment.apprentice_id)
+    submitted_at = assessment.created_at or datetime.utcnow()
+    stats.submission_count += 1
+    if stats.last_submission_at is None or submitted_at > stats.last_submission_at:
+        stats.last_submission_at = submitted_at
+
+
+def record_scores(db: Session, changes: list):
+    """Fold new scores into the rollups; the caller commits.
+
+    ``changes`` holds ``(assessment, old_scores, new_scores)`` tuples, where
+    ``assessment`` has ``id``, ``apprentice_id`` and ``created_at`` and
+    ``old_scores`` is ``None`` the first time an assessment is scored. Each
+    apprentice's row is locked once per call.
+    """
+    if not changes:
+        return
+    categories = question_categories(db, (q for _, _, new in changes for q in (new or {})))
+    by_apprentice = {}
+    for change in changes:
+        by_apprentice.setdefault(change[0].apprentice_id, []).append(change)
+
+    for apprentice_id in sorted(by_apprentice):
+        stats = _stats_for_update(db, apprentice_id)
+        category_scores = stats.category_scores
+        for assessment, old_scores, new_scores in by_apprentice[apprentice_id]:
+            old, new = overall_score(old_scores), overall_score(new_scores)
+            if old is not None:
+                stats.scored_count -= 1
+                stats.score_sum -= old
+            if new is not None:
+                stats.scored_count += 1
+                stats.score_sum += new
+            category_scores = _merge_latest(category_scores, assessment, _category_averages(new_scores, categories))
+        # JSON columns only notice reassignment
+        stats.category_scores = category_scores
+
+
+def rebuild_stats(db: Session, apprentice_id: str = None, batch_size: int = 1000) -> int:
+    """Recompute the rollups from ``assessments`` and replace what is stored.
+
+    Returns the number of apprentices written.
+    """
+    stmt = (
+        select(Assessment.id, Assessment.apprentice_id, Assessment.created_at, Assessment.scores)
+        .order_by(Assessment.apprentice_id, Assessment.created_at, Assessment.id)
+        .execution_options(yield_per=batch_size)
+    )
+    if apprentice_id:
+        stmt = stmt.where(Assessment.apprentice_id == apprentice_id)
+
+    fresh = {}
+    for batch in db.execute(stmt).partitions():
+        categories = question_categories(db, (q for row in batch for q in (row.scores or {})))
+        for row in batch:
+            stats = fresh.setdefault(row.apprentice_id, {
+                "submission_count": 0, "last_submission_at": None,
+                "scored_count": 0, "score_sum": 0.0, "category_scores": {},
+            })
+            stats["submission_count"] += 1
+            stats["last_submission_at"] = row.created_at
+            score = overall_score(row.scores)
+            if score is not None:
+                stats["scored_count"] += 1
+                stats["score_sum"] += score
+            stats["category_scores"] = _merge_latest(
+                stats["category_scores"], row, _category_averages(row.scores, categories)
+            )
+
+    written = len(fresh)
+    existing = select(ApprenticeStats)
+    if apprentice_id:
+        existing = existing.where(ApprenticeStats.apprentice_id == apprentice_id)
+    for stats in db.execute(existing.with_for_update()).scalars():
+        values = fresh.pop(stats.apprentice_id, None)
+        if values is None:
+            db.delete(stats)
+        else:
+            for key, value in values.items():
+                setattr(stats, key, value)
+    db.add_all(ApprenticeStats(apprentice_id=key, **values) for key, values in fresh.items())
+    db.commit()
+    return written
+
+
+def main(argv=None):
+    from app.db import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Rebuild apprentice_stats from raw assessments.")
+    parser.add_argument("--apprentice-id", help="only rebuild this apprentice")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        count = rebuild_stats(db, args.apprentice_id)
+    finally:
+        db.close()
+    print(f"Rebuilt stats for {count} apprentices")
+    return count
+
+
+if __name__ == "__main__":
+    main()
@@ -2,21 +2,85 @@ from firebase_admin import auth
 from fastapi import Request, HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from firebase_admin import auth as firebase_auth
-from app.db import get_db
+from app.db import get_db, get_async_db
 from app.models.user import User
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import datetime
+import os
 from app.schemas.user import UserSchema
+from app.services.cache import TTLCache
+from app.services.token_verifier import verify_id_token
 
 security = HTTPBearer()
 
+# uid -> column snapshot of the User row; writes to users call invalidate_user().
+# The cache is per process: invalidate_user() only clears the worker that made the
+# change, so other workers can serve a stale role for up to USER_CACHE_TTL seconds.
+# Admin checks therefore re-read the role from the database (see _current_role).
+_user_cache = TTLCache(
+    maxsize=int(os.getenv("USER_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("USER_CACHE_TTL", "60")),
+)
+
+def invalidate_user(user_id: str):
+    _user_cache.pop(user_id)
+
+def _snapshot(user: User) -> dict:
+    return {c.key: getattr(user, c.key) for c in User.__table__.columns}
+
+def load_user(db: Session, user_id: str):
+    """Return a detached User for ``user_id``, hitting the DB only on a cache miss."""
+    snapshot = _user_cache.get(user_id)
+    if snapshot is None:
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            return None
+        snapshot = _snapshot(user)
+        _user_cache.set(user_id, snapshot)
+    return User(**snapshot)
+
+async def load_user_async(db: AsyncSession, user_id: str):
+    """``load_user`` for async routes; shares the same cache."""
+    snapshot = _user_cache.get(user_id)
+    if snapshot is None:
+        user = (await db.execute(select(User).where(User.id == user_id))).scalar_one_or_none()
+        if not user:
+            return None
+        snapshot = _snapshot(user)
+        _user_cache.set(user_id, snapshot)
+    return User(**snapshot)
+
+def _current_role(db: Session, user: User) -> str:
+    """The role stored for ``user`` now; drops a stale cache entry when it changed."""
+    role = db.scalar(select(User.role).where(User.id == user.id))
+    if role != user.role:
+        invalidate_user(user.id)
+    return role
+
+async def _current_role_async(db: AsyncSession, user: User) -> str:
+    role = (await db.execute(select(User.role).where(User.id == user.id))).scalar_one_or_none()
+    if role != user.role:
+        invalidate_user(user.id)
+    return role
+
+def _decode_request_token(request: Request, token: str) -> dict:
+    # verify_token and get_current_user can both run for one request; decode once.
+    cached = getattr(request.state, "decoded_token", None)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+    decoded_token = verify_id_token(token)
+    request.state.decoded_token = (token, decoded_token)
+    return decoded_token
+
 def verify_token(request: Request):
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authorization header missing or invalid")
     id_token = auth_header.split(" ")[1]
     try:
-        decoded_token = auth.verify_id_token(id_token)
+        decoded_token = _decode_request_token(request, id_token)
         return decoded_token
     except Exception:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
@@ -35,18 +99,19 @@ def require_roles(roles: list):
         return decoded_token
     return role_checker
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
-    
+def _resolve_token(request: Request, credentials: HTTPAuthorizationCredentials):
+    """Return ``(user, None)`` when the request is already resolved, else ``(None, uid)``."""
+    current_user = getattr(request.state, "current_user", None)
+    if current_user is not None:
+        return current_user, None
+
     token = credentials.credentials
     if token == "mock-mentor-token":
-        return User(id="mentor-1", name="Mentor One", email="mentor@example.com", role="mentor", created_at=datetime.utcnow())
+        return User(id="mentor-1", name="Mentor One", email="mentor@example.com", role="mentor", created_at=datetime.utcnow()), None
     elif token == "mock-apprentice-token":
-        return User(id="apprentice-1", name="Apprentice One", email="apprentice@example.com", role="apprentice", created_at=datetime.utcnow())
+        return User(id="apprentice-1", name="Apprentice One", email="apprentice@example.com", role="apprentice", created_at=datetime.utcnow()), None
     try:
-        decoded_token = firebase_auth.verify_id_token(token)
+        decoded_token = _decode_request_token(request, token)
         user_id = decoded_token["uid"]
         email = decoded_token["email"]
     except Exception:
@@ -54,15 +119,38 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired Firebase token",
         )
+    return None, user_id
 
-    user = db.query(User).filter(User.id == user_id).first()
+def _remember_user(request: Request, user) -> User:
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found in database",
         )
+    request.state.current_user = user
     return user
 
+def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> User:
+    user, user_id = _resolve_token(request, credentials)
+    if user is not None:
+        return user
+    return _remember_user(request, load_user(db, user_id))
+
+async def get_current_user_async(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """``get_current_user`` for async routes: no sync session, no threadpool hop."""
+    user, user_id = _resolve_token(request, credentials)
+    if user is not None:
+        return user
+    return _remember_user(request, await load_user_async(db, user_id))
+
 def require_mentor(user: User = Depends(get_current_user)) -> User:
     if user.role != "mentor":
         raise HTTPException(
@@ -87,12 +175,33 @@ def require_apprentice(user: User = Depends(get_current_user)) -> User:
 #         )
 #     return current_user
 
-def require_admin(current_user: UserSchema = Depends(get_current_user)) -> UserSchema:
-    if current_user.role != "admin":
+def require_admin(current_user: UserSchema = Depends(get_current_user), db: Session = Depends(get_db)) -> UserSchema:
+    # A cached admin role may predate a demotion on another worker
+    if current_user.role != "admin" or _current_role(db, current_user) != "admin":
         raise HTTPException(status_code=403, detail="Admins only")
     return current_user
 
-def require_mentor_or_admin(current_user: UserSchema = Depends(get_current_user)) -> UserSchema:
-    if current_user.role not in {"mentor", "admin"}:
+def _check_mentor_or_admin(role: str):
+    if role not in {"mentor", "admin"}:
         raise HTTPException(status_code=403, detail="Mentors or admins only.")
-    return current_user
\ No newline at end of file
+
+def require_mentor_or_admin(current_user: UserSchema = Depends(get_current_user), db: Session = Depends(get_db)) -> UserSchema:
+    _check_mentor_or_admin(current_user.role)
+    if current_user.role == "admin":
+        _check_mentor_or_admin(_current_role(db, current_user))
+    return current_user
+
+async def require_mentor_async(user: User = Depends(get_current_user_async)) -> User:
+    return require_mentor(user)
+
+async def require_apprentice_async(user: User = Depends(get_current_user_async)) -> User:
+    return require_apprentice(user)
+
+async def require_mentor_or_admin_async(
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    _check_mentor_or_admin(current_user.role)
+    if current_user.role == "admin":
+        _check_mentor_or_admin(await _current_role_async(db, current_user))
+    return current_user
@@ -0,0 +1,174 @@
+"""Negotiated response compression (zstd, brotli, gzip).
+
+``CompressionMiddleware`` picks the best encoding the client accepts and the
+server can produce. ``brotli`` and ``zstandard`` are in requirements.txt;
+an environment without them falls back to gzip. Bodies under COMPRESSION_MINIMUM_SIZE
+bytes, bodies that already carry a Content-Encoding and already-compressed
+media types pass through untouched. Streaming responses are compressed chunk
+by chunk (each chunk is flushed), so exports are never buffered.
+
+Routes can pick a level with the ``compression`` decorator::
+
+    @router.get("/hot")
+    @compression("off")
+    def hot(): ...
+"""
+import os
+import zlib
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES, IdentityResponder
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+DEFAULT_LEVEL = os.getenv("COMPRESSION_LEVEL", "default")
+# Chunks this large are compressed in a worker thread instead of on the event loop
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+# Level names map to each codec's own scale
+LEVELS = {
+    "fast": {"zstd": 1, "br": 1, "gzip": 1},
+    "default": {"zstd": 3, "br": 4, "gzip": 6},
+    "best": {"zstd": 19, "br": 9, "gzip": 9},
+}
+
+EXCLUDED_CONTENT_TYPES = DEFAULT_EXCLUDED_CONTENT_TYPES + (
+    "application/vnd.apache.parquet",
+)
+
+
+def compression(level: str = None, minimum_size: int = None):
+    """Per-route override: ``level`` is "fast", "default", "best" or "off"."""
+    if level is not None and level != "off" and level not in LEVELS:
+        raise ValueError(f"Unknown compression level: {level}")
+
+    def decorate(endpoint):
+        endpoint.compression = {"level": level, "minimum_size": minimum_size}
+        return endpoint
+    return decorate
+
+
+def available_encodings() -> list:
+    """Encodings this process can produce, most preferred first."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+def negotiate(accept_encoding: str, encodings: list = None):
+    """The first of ``encodings`` the Accept-Encoding header allows (q > 0), or None."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+    for encoding in encodings or available_encodings():
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > 0:
+            return encoding
+    return None
+
+
+class _Compressor:
+    """Streaming compressor with sync-flush for partial chunks."""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+        elif encoding == "br":
+            self._obj = brotli.Compressor(quality=level)
+        else:
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, body: bytes, final: bool) -> bytes:
+        if self.encoding == "zstd":
+            flush = zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            return self._obj.compress(body) + self._obj.flush(flush)
+        if self.encoding == "br":
+            return self._obj.process(body) + (self._obj.finish() if final else self._obj.flush())
+        return self._obj.compress(body) + self._obj.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class _Responder(IdentityResponder):
+    """Starlette's responder (threshold, pass-through, streaming) with a pluggable codec.
+
+    It overrides Starlette internals (``send_with_compression``,
+    ``apply_compression``); tests/test_compression.py checks they still exist.
+
+    The level is read from the matched endpoint, which routing has put in
+    the scope by the time the response starts.
+    """
+
+    def __init__(self, app, encoding: str, level: str, minimum_size: int):
+        super().__init__(app, minimum_size, exclude_content_types=EXCLUDED_CONTENT_TYPES)
+        self.content_encoding = encoding
+        self.level = level
+        self.scope = None
+        self._compressor = None
+
+    async def __call__(self, scope, receive, send):
+        self.scope = scope
+        await super().__call__(scope, receive, send)
+
+    async def send_with_compression(self, message):
+        if message["type"] == "http.response.start":
+            override = getattr(self.scope.get("endpoint"), "compression", None) or {}
+            if override.get("minimum_size") is not None:
+                self.minimum_size = override["minimum_size"]
+            self.level = override.get("level") or self.level
+            if self.level == "off":
+                # Treated like an already-encoded body: sent as is
+                self.content_encoding_set = True
+                await self.send(message)
+                return
+        await super().send_with_compression(message)
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = _Compressor(self.content_encoding, LEVELS[self.level][self.content_encoding])
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            return await anyio.to_thread.run_sync(self._compressor.compress, body, not more_body)
+        return self._compressor.compress(body, not more_body)
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size: int = MINIMUM_SIZE, level: str = DEFAULT_LEVEL, encodings: list = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.encodings = encodings or available_encodings()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            responder = IdentityResponder(self.app, self.minimum_size, exclude_content_types=EXCLUDED_CONTENT_TYPES)
+        else:
+            responder = _Responder(self.app, encoding, self.level, self.minimum_size)
+        await responder(scope, receive, send)
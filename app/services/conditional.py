@@ -0,0 +1,98 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag_for(body: bytes) -> str:
+    return '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """``If-None-Match`` check using the weak comparison RFC 9110 requires for GET."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in header.split(","))
+
+
+def json_with_etag(request: Request, body: bytes, cache_control: str = CACHE_CONTROL) -> Response:
+    """Serve pre-encoded JSON, or an empty 304 when the client already has this body."""
+    etag = etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _http_date(value: datetime) -> str:
+    # Stored timestamps are naive UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _modified_since(request: Request, last_modified: datetime) -> bool:
+    header = request.headers.get("if-modified-since")
+    if not header or last_modified is None:
+        return True
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return True
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP dates have whole-second precision
+    return last_modified.replace(microsecond=0) > since
+
+
+class Conditional:
+    """Route dependency for revalidating reads: ``cond: Conditional = Depends()``.
+
+    Call ``check()`` with a cheap version of the data (row counts,
+    ``updated_at`` maxima) *before* loading it. The weak ETag is derived
+    from that version plus the request path and query string (so each page
+    of a listing validates separately). When the client's copy is current,
+    return ``cond.not_modified()`` and skip the query and serialization.
+    """
+
+    def __init__(self, request: Request, response: Response):
+        self.request = request
+        self.response = response
+        self.etag = None
+        self.last_modified = None
+
+    def check(self, *version, last_modified: datetime = None) -> bool:
+        """Set the validators on the response; True when the client can reuse its copy."""
+        key = "|".join(
+            [self.request.url.path, self.request.url.query]
+            + [v.isoformat() if isinstance(v, datetime) else str(v) for v in version]
+        )
+        self.etag = 'W/"%s"' % hashlib.sha256(key.encode()).hexdigest()[:32]
+        self.last_modified = last_modified
+        for name, value in self._headers().items():
+            self.response.headers[name] = value
+
+        # If-None-Match wins; If-Modified-Since is only consulted without it
+        if "if-none-match" in self.request.headers:
+            return etag_matches(self.request, self.etag)
+        if "if-modified-since" in self.request.headers and last_modified is not None:
+            return not _modified_since(self.request, last_modified)
+        return False
+
+    def _headers(self) -> dict:
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = _http_date(self.last_modified)
+        return headers
+
+    def not_modified(self) -> Response:
+        return Response(status_code=304, headers=self._headers())
@@ -0,0 +1,114 @@
+"""Draft answers stored one row per (draft, question) in ``assessment_answers``.
+
+Autosaves bulk-upsert the answers they carry (``INSERT .. ON CONFLICT DO
+UPDATE`` on the unique (draft, question) key) instead of rewriting a JSON
+blob, and per-question reads go through the ``question_id`` index. The
+``{question_id: answer}`` view is only built when a response needs it.
+"""
+from datetime import datetime
+
+from sqlalchemy import delete, inspect, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.exceptions import ValidationException
+from app.models.assessment_answer import AssessmentAnswer
+from app.models.assessment_draft import AssessmentDraft
+
+_answers = AssessmentAnswer.__table__
+
+
+def _upsert_statement(db: Session):
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    stmt = insert(_answers)
+    return stmt.on_conflict_do_update(
+        index_elements=[_answers.c.assessment_id, _answers.c.question_id],
+        set_={"answer_text": stmt.excluded.answer_text},
+    )
+
+
+def upsert_answers(db: Session, draft: AssessmentDraft, answers: dict):
+    """Insert or update ``answers`` for ``draft`` in one executemany round trip.
+
+    An answer to a question that doesn't exist fails the foreign key; that is
+    the client's mistake, so it's a 422 rather than a 500.
+    """
+    if not answers:
+        return
+    rows = [
+        {"assessment_id": draft.id, "question_id": question_id, "answer_text": text}
+        for question_id, text in answers.items()
+    ]
+    stmt = _upsert_statement(db)
+    if stmt is None:
+        delete_answers(db, draft, list(answers))
+        stmt = _answers.insert()
+    try:
+        db.execute(stmt, rows)
+    except IntegrityError:
+        db.rollback()
+        raise ValidationException("Answers reference unknown questions")
+
+
+def delete_answers(db: Session, draft: AssessmentDraft, question_ids):
+    if question_ids:
+        db.execute(delete(_answers).where(
+            _answers.c.assessment_id == draft.id, _answers.c.question_id.in_(list(question_ids))
+        ))
+
+
+def save_answers(db: Session, draft: AssessmentDraft, answers: dict = None, removed=(), replace: bool = False):
+    """Write answer changes for ``draft`` without loading its answer rows.
+
+    ``answers`` are upserted and ``removed`` question ids deleted; with
+    ``replace`` every answer not in ``answers`` is deleted. The draft row is
+    touched so the change bumps its revision when the session commits.
+    """
+    created = inspect(draft).pending
+    if created:
+        # The answer rows reference the draft
+        db.flush()
+    answers = answers or {}
+    if replace:
+        stmt = delete(_answers).where(_answers.c.assessment_id == draft.id)
+        if answers:
+            stmt = stmt.where(_answers.c.question_id.not_in(list(answers)))
+        db.execute(stmt)
+    else:
+        delete_answers(db, draft, removed)
+    upsert_answers(db, draft, answers)
+    db.expire(draft, ["answers_rel"])
+    if not created:
+        draft.updated_at = datetime.utcnow()
+
+
+def answers_for_drafts(db: Session, draft_ids) -> dict:
+    """``{draft_id: {question_id: answer}}`` for many drafts in one query."""
+    result = {draft_id: {} for draft_id in draft_ids}
+    if not result:
+        return result
+    rows = db.execute(
+        select(_answers.c.assessment_id, _answers.c.question_id, _answers.c.answer_text)
+        .where(_answers.c.assessment_id.in_(list(result)))
+    )
+    for row in rows:
+        result[row.assessment_id][row.question_id] = row.answer_text
+    return result
+
+
+def answers_for_question(db: Session, question_id: str, submitted: bool = None) -> list:
+    """``(draft_id, apprentice_id, answer)`` for every draft that answered ``question_id``."""
+    stmt = (
+        select(AssessmentDraft.id, AssessmentDraft.apprentice_id, _answers.c.answer_text)
+        .join(AssessmentDraft, AssessmentDraft.id == _answers.c.assessment_id)
+        .where(_answers.c.question_id == question_id)
+    )
+    if submitted is not None:
+        stmt = stmt.where(AssessmentDraft.is_submitted == submitted)
+    return db.execute(stmt).all()
@@ -0,0 +1,39 @@
+"""Apply per-question JSON Patch deltas to a draft's answers."""
+from app.exceptions import ValidationException
+
+ANSWERS_PREFIX = "/answers/"
+LAST_QUESTION_PATH = "/last_question_id"
+
+
+def _unescape(token: str) -> str:
+    # RFC 6901 pointer escaping
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def apply_patch(answers: dict, last_question_id: str, ops) -> tuple:
+    """Return ``(answers, last_question_id)`` with ``ops`` applied; the inputs are not modified.
+
+    ``add`` sets an answer whether or not it exists; ``replace`` and
+    ``remove`` require it to exist, as in RFC 6902.
+    """
+    answers = dict(answers or {})
+    for op in ops:
+        if op.path == LAST_QUESTION_PATH:
+            if op.op == "remove":
+                last_question_id = None
+            else:
+                last_question_id = op.value
+            continue
+
+        if not op.path.startswith(ANSWERS_PREFIX) or len(op.path) == len(ANSWERS_PREFIX):
+            raise ValidationException(f"Unsupported patch path: {op.path}")
+        question_id = _unescape(op.path[len(ANSWERS_PREFIX):])
+        if op.op in ("replace", "remove") and question_id not in answers:
+            raise ValidationException(f"No answer to {op.op} at {op.path}")
+        if op.op == "remove":
+            del answers[question_id]
+        else:
+            if op.value is None:
+                raise ValidationException(f"'{op.op}' at {op.path} needs a value")
+            answers[question_id] = op.value
+    return answers, last_question_id
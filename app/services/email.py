@@ -1,11 +1,13 @@
 import os
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+from sqlalchemy.orm import Session
+from app.models.email_outbox import EmailOutbox
 
-def send_assessment_email(to_email: str, apprentice_name: str, assessment_title: str, score: int, feedback_summary: str, details: dict):
+def render_assessment_email(apprentice_name: str, assessment_title: str, score, feedback_summary: str, details: dict):
+    """Return ``(subject, html_content)`` for the mentor's assessment results email."""
     subject = f"Assessment Results for {apprentice_name}: {assessment_title}"
     feedback_html = "".join([
-        f"<h4>{section}</h4><p><strong>Score:</strong> {data['score']}<br><strong>Feedback:</strong> {data['feedback']}<br><strong>Recommendation:</strong> {data['recommendation']}</p>"
+        # The model may leave out a field; a scored assessment must still notify
+        f"<h4>{section}</h4><p><strong>Score:</strong> {data.get('score', '')}<br><strong>Feedback:</strong> {data.get('feedback', '')}<br><strong>Recommendation:</strong> {data.get('recommendation', '')}</p>"
         for section, data in details.items()
     ])
 
@@ -18,23 +20,10 @@ def send_assessment_email(to_email: str, apprentice_name: str, assessment_title:
         {feedback_html}
         <p>Keep guiding them forward in their discipleship journey.</p>
     """
+    return subject, html_content
 
-    message = Mail(
-        from_email=os.getenv("EMAIL_FROM_ADDRESS"),
-        to_emails=to_email,
-        subject=subject,
-        html_content=html_content
-    )
-
-    try:
-        sg = SendGridAPIClient(os.getenv("SENDGRID_API_KEY"))
-        response = sg.send(message)
-        return response.status_code
-    except Exception as e:
-        print("SendGrid error:", e)
-        return None
-
-def send_invitation_email(to_email: str, apprentice_name: str, token: str):
+def render_invitation_email(apprentice_name: str, token: str):
+    """Return ``(subject, plain_text_content)`` for an apprentice invitation."""
     link = f"https://trooth-app.com/accept-invite/{token}"
     subject = "You're invited to join T[root]H as an apprentice"
     body = f"""
@@ -50,16 +39,30 @@ def send_invitation_email(to_email: str, apprentice_name: str, token: str):
     Grace and peace,  
     The T[root]H Team
     """
+    return subject, body
 
-    message = Mail(
-        from_email="your-email@example.com",  # Set your verified sender
-        to_emails=to_email,
+def _queue(db: Session, kind: str, to_email: str, subject: str, dedupe_key: str = None, **content) -> EmailOutbox:
+    if dedupe_key:
+        existing = db.query(EmailOutbox).filter_by(dedupe_key=dedupe_key).first()
+        if existing:
+            return existing
+    message = EmailOutbox(
+        kind=kind,
+        dedupe_key=dedupe_key,
+        to_email=to_email,
+        from_email=os.getenv("EMAIL_FROM_ADDRESS"),
         subject=subject,
-        plain_text_content=body,
+        **content,
     )
+    db.add(message)
+    return message
+
+def queue_assessment_email(db: Session, to_email: str, apprentice_name: str, assessment_title: str, score, feedback_summary: str, details: dict, dedupe_key: str = None) -> EmailOutbox:
+    """Add the results email to the outbox; it is committed with the caller's transaction."""
+    subject, html_content = render_assessment_email(apprentice_name, assessment_title, score, feedback_summary, details)
+    return _queue(db, "assessment_results", to_email, subject, dedupe_key, html_content=html_content)
 
-    try:
-        sg = SendGridAPIClient(os.getenv("SENDGRID_API_KEY"))
-        sg.send(message)
-    except Exception as e:
-        print(f"Failed to send invite email: {e}")
\ No newline at end of file
+def queue_invitation_email(db: Session, to_email: str, apprentice_name: str, token: str) -> EmailOutbox:
+    """Add the invitation email to the outbox; it is committed with the caller's transaction."""
+    subject, body = render_invitation_email(apprentice_name, token)
+    return _queue(db, "invitation", to_email, subject, f"invitation:{token}", text_content=body)
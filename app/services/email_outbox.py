@@ -0,0 +1,212 @@
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+import httpx
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.db import SessionLocal
+from app.models.email_outbox import EmailOutbox
+from app.services.metrics import EMAIL_SEND_SECONDS
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+DEAD = "dead"
+
+SENDGRID_API_URL = os.getenv("SENDGRID_API_URL", "https://api.sendgrid.com")
+BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "50"))
+BACKOFF_BASE_SECONDS = float(os.getenv("EMAIL_BACKOFF_BASE", "30"))
+BACKOFF_MAX_SECONDS = float(os.getenv("EMAIL_BACKOFF_MAX", "3600"))
+STALE_SECONDS = float(os.getenv("EMAIL_STALE_SECONDS", "600"))
+
+
+class PermanentDeliveryError(Exception):
+    """SendGrid rejected the message itself; retrying will not help."""
+
+
+def backoff_delay(attempt: int) -> float:
+    delay = min(BACKOFF_BASE_SECONDS * (2 ** max(attempt - 1, 0)), BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def sendgrid_payload(message: EmailOutbox, default_from: str = None) -> dict:
+    content = []
+    if message.text_content:
+        content.append({"type": "text/plain", "value": message.text_content})
+    if message.html_content:
+        content.append({"type": "text/html", "value": message.html_content})
+    return {
+        "personalizations": [{"to": [{"email": message.to_email}]}],
+        "from": {"email": message.from_email or default_from},
+        "subject": message.subject,
+        "content": content,
+        "custom_args": {"outbox_id": message.id},
+    }
+
+
+def claim_batch(db: Session, limit: int = BATCH_SIZE) -> list:
+    """Lock up to ``limit`` due messages for this dispatcher.
+
+    Same pattern as the scoring queue: SKIP LOCKED on Postgres, and a
+    conditional UPDATE so only rows still pending are claimed.
+    """
+    now = datetime.utcnow()
+    ids = db.execute(
+        select(EmailOutbox.id)
+        .where(EmailOutbox.status == PENDING, EmailOutbox.next_attempt_at <= now)
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    ).scalars().all()
+    if not ids:
+        db.rollback()
+        return []
+
+    db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(ids), EmailOutbox.status == PENDING)
+        .values(status=SENDING, locked_at=now, attempts=EmailOutbox.attempts + 1)
+    )
+    db.commit()
+    return db.query(EmailOutbox).filter(
+        EmailOutbox.id.in_(ids), EmailOutbox.status == SENDING, EmailOutbox.locked_at == now
+    ).all()
+
+
+def requeue_stale(db: Session, older_than_seconds: float = STALE_SECONDS) -> int:
+    """Return messages stuck in ``sending`` (dispatcher died mid-batch) to the queue."""
+    cutoff = datetime.utcnow() - timedelta(seconds=older_than_seconds)
+    count = db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.status == SENDING, EmailOutbox.locked_at < cutoff)
+        .values(status=PENDING, locked_at=None)
+    ).rowcount
+    db.commit()
+    return count
+
+
+def outbox_stats(db: Session) -> dict:
+    rows = db.execute(
+        select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)
+    ).all()
+    stats = {status: 0 for status in (PENDING, SENDING, SENT, DEAD)}
+    stats.update({status: count for status, count in rows})
+    return stats
+
+
+class EmailDispatcher:
+    """Drains the outbox in batches over one keep-alive HTTP client to SendGrid."""
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        api_key: str = None,
+        base_url: str = SENDGRID_API_URL,
+        batch_size: int = BATCH_SIZE,
+        poll_interval: float = 2.0,
+        timeout: float = 10.0,
+        http_client: httpx.Client = None,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.default_from = os.getenv("EMAIL_FROM_ADDRESS")
+        self.http = http_client or httpx.Client(
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {api_key or os.getenv('SENDGRID_API_KEY')}"},
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+        )
+        self._stop = threading.Event()
+        self._thread = None
+
+    def deliver(self, message: EmailOutbox):
+        start = time.perf_counter()
+        try:
+            response = self.http.post("/v3/mail/send", json=sendgrid_payload(message, self.default_from))
+        except httpx.HTTPError as e:
+            EMAIL_SEND_SECONDS.labels("error").observe(time.perf_counter() - start)
+            raise RuntimeError(f"SendGrid request failed: {e}") from e
+        outcome = "sent" if response.status_code < 400 else "retry" if response.status_code == 429 or response.status_code >= 500 else "rejected"
+        EMAIL_SEND_SECONDS.labels(outcome).observe(time.perf_counter() - start)
+        if outcome == "retry":
+            raise RuntimeError(f"SendGrid returned {response.status_code}")
+        if outcome == "rejected":
+            raise PermanentDeliveryError(f"SendGrid returned {response.status_code}: {response.text[:500]}")
+
+    def dispatch_once(self) -> int:
+        """Send one batch; returns how many messages were claimed."""
+        db = self.session_factory()
+        try:
+            batch = claim_batch(db, self.batch_size)
+            for message in batch:
+                try:
+                    self.deliver(message)
+                except PermanentDeliveryError as e:
+                    self._dead_letter(message, e)
+                except Exception as e:
+                    if message.attempts >= message.max_attempts:
+                        self._dead_letter(message, e)
+                    else:
+                        logger.info("Email %s attempt %s failed: %s", message.id, message.attempts, e)
+                        message.status = PENDING
+                        message.last_error = str(e)
+                        message.next_attempt_at = datetime.utcnow() + timedelta(seconds=backoff_delay(message.attempts))
+                else:
+                    message.status = SENT
+                    message.sent_at = datetime.utcnow()
+                    message.last_error = None
+                message.locked_at = None
+                db.commit()
+            return len(batch)
+        finally:
+            db.close()
+
+    def _dead_letter(self, message: EmailOutbox, error: Exception):
+        logger.error("Email %s to %s dead-lettered after %s attempts: %s", message.id, message.to_email, message.attempts, error)
+        message.status = DEAD
+        message.last_error = str(error)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                if self.dispatch_once():
+                    continue
+            except Exception:
+                logger.exception("Email dispatcher crashed on a batch")
+            self._stop.wait(self.poll_interval)
+
+    def start(self):
+        db = self.session_factory()
+        try:
+            requeue_stale(db)
+        finally:
+            db.close()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="email-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.http.close()
+
+
+if __name__ == "__main__":
+    # Run the dispatcher outside the API process: python -m app.services.email_outbox
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    dispatcher = EmailDispatcher()
+    dispatcher.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        dispatcher.stop()
@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+import zlib
+
+from sqlalchemy.orm import Session
+
+EXPORT_BATCH_SIZE = 500
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def stream_rows(db: Session, stmt, batch_size: int = EXPORT_BATCH_SIZE):
+    """Yield result rows in batches from a server-side cursor (``yield_per``)."""
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    try:
+        yield from result.partitions()
+    finally:
+        result.close()
+
+
+def csv_chunks(batches, header: list, to_row):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for batch in batches:
+        for row in batch:
+            writer.writerow(to_row(row))
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def ndjson_chunks(batches, to_dict):
+    for batch in batches:
+        yield "".join(json.dumps(to_dict(row), default=str) + "\n" for row in batch).encode("utf-8")
+
+
+def json_chunks(batches, to_dict):
+    """A JSON array written one batch at a time, one object per line."""
+    yield b"["
+    first = True
+    for batch in batches:
+        parts = []
+        for row in batch:
+            parts.append(("\n" if first else ",\n") + json.dumps(to_dict(row), default=str))
+            first = False
+        yield "".join(parts).encode("utf-8")
+    yield b"\n]\n"
+
+
+def gzip_chunks(chunks, level: int = 6):
+    """Compress a byte stream into a gzip member as it is produced."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def encode_rows(batches, format: str, header: list, to_row, to_dict, gzip: bool = False):
+    if format == "csv":
+        chunks = csv_chunks(batches, header, to_row)
+    elif format == "ndjson":
+        chunks = ndjson_chunks(batches, to_dict)
+    else:
+        chunks = json_chunks(batches, to_dict)
+    return gzip_chunks(chunks) if gzip else chunks
+
+
+def download_headers(filename: str, format: str, gzip: bool = False):
+    """``(media_type, headers)`` for an attachment named ``filename.<format>[.gz]``."""
+    name = f"{filename}.{format}" + (".gz" if gzip else "")
+    media_type = "application/gzip" if gzip else MEDIA_TYPES[format]
+    return media_type, {"Content-Disposition": f"attachment; filename={name}"}
@@ -0,0 +1,58 @@
+"""Fast JSON encoding for the paths FastAPI doesn't already optimize.
+
+Routes with a ``response_model`` are validated and dumped straight to JSON
+bytes by pydantic-core. Responses built by hand (exception handlers) used the
+stdlib ``json``; they go through ``dumps`` here, which uses orjson when it is
+installed. ``trusted_response`` lets a listing whose rows the route loaded
+itself skip the validate-then-dump pass entirely.
+"""
+import json
+from datetime import date, datetime
+from functools import lru_cache
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps(obj) -> bytes:
+    """Compact JSON bytes; datetimes as ISO 8601, other unknown types via ``str``."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def _field_names(schema) -> tuple:
+    return tuple(schema.model_fields)
+
+
+def trusted_response(schema, objects, response: Response = None) -> Response:
+    """``objects`` encoded with the fields of the flat ``schema``, without validation.
+
+    Only for ORM rows the route just loaded, whose columns already have the
+    schema's types; returning a ``Response`` bypasses the route's
+    ``response_model`` pass. Headers set on the injected ``response`` (ETag,
+    pagination cursors) are carried over.
+    """
+    fields = _field_names(schema)
+    body = dumps([{name: getattr(obj, name) for name in fields} for obj in objects])
+    fast = Response(content=body, media_type="application/json")
+    if response is not None:
+        fast.headers.raw.extend(response.headers.raw)
+    return fast
@@ -0,0 +1,127 @@
+"""Every apprentice's summary for a mentor in a fixed number of queries.
+
+One query per section (profile + stats, latest assessment, open drafts,
+unread notes), each grouped or windowed over all of the mentor's
+apprentices, so the cost does not grow with N round trips.
+"""
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.apprentice_stats import ApprenticeStats
+from app.models.assessment import Assessment
+from app.models.assessment_answer import AssessmentAnswer
+from app.models.assessment_draft import AssessmentDraft
+from app.models.mentor_note import MentorNote
+from app.models.user import User
+from app.services.apprentice_stats import overall_score
+
+
+def _latest_per_apprentice(columns, partition, order_by, where):
+    """Rows ranked first within each apprentice, plus the apprentice's row count."""
+    ranked = select(
+        *columns,
+        func.row_number().over(partition_by=partition, order_by=order_by).label("rank"),
+        func.count().over(partition_by=partition).label("total"),
+    ).where(*where).subquery()
+    return select(ranked).where(ranked.c.rank == 1)
+
+
+def latest_assessments(db: Session, apprentice_ids) -> dict:
+    stmt = _latest_per_apprentice(
+        [
+            Assessment.id, Assessment.apprentice_id, Assessment.template_id, Assessment.scoring_status,
+            Assessment.scores, Assessment.recommendation, Assessment.created_at,
+        ],
+        Assessment.apprentice_id,
+        (Assessment.created_at.desc(), Assessment.id.desc()),
+        [Assessment.apprentice_id.in_(apprentice_ids)],
+    )
+    latest = {}
+    for row in db.execute(stmt):
+        score = overall_score(row.scores)
+        latest[row.apprentice_id] = {
+            "id": row.id,
+            "template_id": row.template_id,
+            "scoring_status": row.scoring_status,
+            "overall_score": round(score, 2) if score is not None else None,
+            "recommendation": row.recommendation,
+            "created_at": row.created_at,
+        }
+    return latest
+
+
+def open_drafts(db: Session, apprentice_ids) -> dict:
+    """apprentice_id -> (most recently edited open draft, number of open drafts)."""
+    answered = select(func.count()).where(
+        AssessmentAnswer.assessment_id == AssessmentDraft.id, AssessmentAnswer.answer_text != ""
+    ).correlate(AssessmentDraft).scalar_subquery()
+    stmt = _latest_per_apprentice(
+        [
+            AssessmentDraft.id, AssessmentDraft.apprentice_id, AssessmentDraft.template_id,
+            answered.label("answered_count"), AssessmentDraft.updated_at,
+        ],
+        AssessmentDraft.apprentice_id,
+        (AssessmentDraft.updated_at.desc(), AssessmentDraft.id.desc()),
+        [AssessmentDraft.apprentice_id.in_(apprentice_ids), AssessmentDraft.is_submitted == False],
+    )
+    drafts = {}
+    for row in db.execute(stmt):
+        draft = {
+            "id": row.id,
+            "template_id": row.template_id,
+            "answered_count": row.answered_count,
+            "updated_at": row.updated_at,
+        }
+        drafts[row.apprentice_id] = (draft, row.total)
+    return drafts
+
+
+def unread_note_counts(db: Session, mentor_id: str, apprentice_ids) -> dict:
+    rows = db.execute(
+        select(Assessment.apprentice_id, func.count(MentorNote.id))
+        .join(MentorNote, MentorNote.assessment_id == Assessment.id)
+        .where(
+            Assessment.apprentice_id.in_(apprentice_ids),
+            MentorNote.mentor_id == mentor_id,
+            MentorNote.is_private == False,
+            MentorNote.read_at.is_(None),
+        )
+        .group_by(Assessment.apprentice_id)
+    ).all()
+    return dict(rows)
+
+
+def build_dashboard(db: Session, mentor_id: str, apprentice_ids) -> list:
+    apprentice_ids = sorted(apprentice_ids)
+    if not apprentice_ids:
+        return []
+
+    profiles = db.execute(
+        select(User, ApprenticeStats)
+        .outerjoin(ApprenticeStats, ApprenticeStats.apprentice_id == User.id)
+        .where(User.id.in_(apprentice_ids))
+        .order_by(User.name, User.id)
+    ).all()
+    latest = latest_assessments(db, apprentice_ids)
+    drafts = open_drafts(db, apprentice_ids)
+    unread = unread_note_counts(db, mentor_id, apprentice_ids)
+
+    dashboard = []
+    for apprentice, stats in profiles:
+        draft, draft_count = drafts.get(apprentice.id, (None, 0))
+        dashboard.append({
+            "id": apprentice.id,
+            "name": apprentice.name,
+            "email": apprentice.email,
+            "total_assessments": stats.submission_count if stats else 0,
+            "average_score": stats.average_score if stats else None,
+            "last_submission": stats.last_submission_at if stats else None,
+            "category_scores": {
+                category: entry["score"] for category, entry in stats.category_scores.items()
+            } if stats else {},
+            "latest_assessment": latest.get(apprentice.id),
+            "open_draft": draft,
+            "open_draft_count": draft_count,
+            "unread_notes": unread.get(apprentice.id, 0),
+        })
+    return dashboard
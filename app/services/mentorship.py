@@ -0,0 +1,93 @@
+import os
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.db import get_db, get_async_db
+from app.exceptions import ForbiddenException
+from app.models.mentor_apprentice import MentorApprentice
+from app.models.user import User
+from app.services import queries
+from app.services.auth import require_mentor, require_mentor_async
+from app.services.cache import TTLCache
+
+# mentor_id -> frozenset of apprentice ids; assign/accept flows call invalidate_mentor().
+# The cache is per process: invalidate_mentor() only clears the worker that created the
+# link, so other workers can miss a new apprentice for up to MENTOR_LINK_CACHE_TTL seconds.
+_apprentice_ids_cache = TTLCache(
+    maxsize=int(os.getenv("MENTOR_LINK_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("MENTOR_LINK_CACHE_TTL", "30")),
+)
+
+
+def invalidate_mentor(mentor_id: str):
+    _apprentice_ids_cache.pop(mentor_id)
+
+
+def get_apprentice_ids(db: Session, mentor_id: str) -> frozenset:
+    apprentice_ids = _apprentice_ids_cache.get(mentor_id)
+    if apprentice_ids is None:
+        apprentice_ids = frozenset(db.scalars(queries.mentor_apprentice_ids(mentor_id)).all())
+        _apprentice_ids_cache.set(mentor_id, apprentice_ids)
+    return apprentice_ids
+
+
+async def get_apprentice_ids_async(db: AsyncSession, mentor_id: str) -> frozenset:
+    apprentice_ids = _apprentice_ids_cache.get(mentor_id)
+    if apprentice_ids is None:
+        result = await db.execute(queries.mentor_apprentice_ids(mentor_id))
+        apprentice_ids = frozenset(result.scalars().all())
+        _apprentice_ids_cache.set(mentor_id, apprentice_ids)
+    return apprentice_ids
+
+
+def is_mentor_of(db: Session, mentor_id: str, apprentice_id: str) -> bool:
+    return apprentice_id in get_apprentice_ids(db, mentor_id)
+
+
+def filter_authorized(db: Session, mentor_id: str, apprentice_ids=None) -> frozenset:
+    """Batch check for list endpoints: the subset of ``apprentice_ids`` this mentor may see.
+
+    Without ``apprentice_ids`` every apprentice of the mentor is returned.
+    """
+    authorized = get_apprentice_ids(db, mentor_id)
+    if apprentice_ids is None:
+        return authorized
+    return authorized.intersection(apprentice_ids)
+
+
+def ensure_mentor_of(
+    db: Session,
+    mentor_id: str,
+    apprentice_id: str,
+    detail: str = "Not authorized to view this apprentice",
+):
+    if not is_mentor_of(db, mentor_id, apprentice_id):
+        raise ForbiddenException(detail)
+
+
+async def get_mentor_apprentice_ids(
+    current_user: User = Depends(require_mentor_async),
+    db: AsyncSession = Depends(get_async_db),
+) -> frozenset:
+    return await get_apprentice_ids_async(db, current_user.id)
+
+
+def require_mentor_of_apprentice(
+    apprentice_id: str,
+    current_user: User = Depends(require_mentor),
+    db: Session = Depends(get_db),
+) -> User:
+    """Route dependency for paths with an ``{apprentice_id}`` owned by the calling mentor."""
+    ensure_mentor_of(db, current_user.id, apprentice_id)
+    return current_user
+
+
+async def require_mentor_of_apprentice_async(
+    apprentice_id: str,
+    current_user: User = Depends(require_mentor_async),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """``require_mentor_of_apprentice`` for async routes."""
+    if apprentice_id not in await get_apprentice_ids_async(db, current_user.id):
+        raise ForbiddenException("Not authorized to view this apprentice")
+    return current_user
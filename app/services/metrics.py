@@ -0,0 +1,159 @@
+"""Prometheus metrics, served at ``GET /metrics``.
+
+``MetricsMiddleware`` records request counts and latency per route template
+(``/mentor/my-apprentices/{apprentice_id}``, not the raw path), plus how many
+DB queries each request ran and how long they took. The ``observe_route``
+app dependency names the route and counts the request as in flight.
+Scoring and email workers record OpenAI call and SendGrid send latency.
+
+With several uvicorn/gunicorn workers, set PROMETHEUS_MULTIPROC_DIR to an
+empty directory (wiped before the server starts); every worker writes its
+samples there and ``/metrics`` aggregates them, whichever worker answers.
+"""
+import os
+import time
+from contextvars import ContextVar
+
+from fastapi import Request, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+UNMATCHED = "<unmatched>"
+
+REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template and status.", ["method", "route", "status"]
+)
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "Time to serve a request, including streamed bodies.", ["method", "route"]
+)
+IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "Requests being served.", ["method", "route"], multiprocess_mode="livesum"
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "Database statements executed per request.", ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250),
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds", "Time spent in database statements per request.", ["method", "route"]
+)
+AI_SCORING_SECONDS = Histogram(
+    "ai_scoring_call_seconds", "OpenAI scoring call latency per attempt.", ["outcome"],
+    buckets=(0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120),
+)
+EMAIL_SEND_SECONDS = Histogram(
+    "email_send_seconds", "SendGrid send latency.", ["outcome"]
+)
+
+# [statement count, seconds] for the request being served
+_request_db = ContextVar("request_db", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["metrics_query_start"].pop()
+    stats = _request_db.get()
+    if stats is not None:
+        stats[0] += 1
+        stats[1] += time.perf_counter() - started
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    starts = context.connection.info.get("metrics_query_start") if context.connection is not None else None
+    if starts:
+        starts.pop()
+
+
+SCOPE_KEY = "trooth.metrics"
+
+
+def route_template(scope) -> str:
+    """The matched route's full path template, e.g. ``/mentor/my-apprentices/{apprentice_id}``.
+
+    The route in the scope may belong to an included router and carry only
+    its own path; the prefix is whatever precedes it in the request path.
+    """
+    route = scope.get("route")
+    local = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if local is None:
+        return UNMATCHED
+    path = scope.get("path", "")
+    try:
+        rendered = local.format(**{name: str(value) for name, value in scope.get("path_params", {}).items()})
+    except (KeyError, IndexError, ValueError):
+        return local
+    return path[:-len(rendered)] + local if path.endswith(rendered) else local
+
+
+async def observe_route(request: Request):
+    """App-wide dependency: labels the request once routing has picked its route."""
+    state = request.scope.get(SCOPE_KEY)
+    if state is not None and state["route"] is None:
+        state["route"] = route_template(request.scope)
+        IN_PROGRESS.labels(request.method, state["route"]).inc()
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        state = scope[SCOPE_KEY] = {"route": None}
+        status = 500
+        db_stats = [0, 0.0]
+        token = _request_db.set(db_stats)
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = state["route"] or UNMATCHED
+            REQUEST_SECONDS.labels(method, route).observe(time.perf_counter() - start)
+            REQUESTS.labels(method, route, str(status)).inc()
+            REQUEST_DB_QUERIES.labels(method, route).observe(db_stats[0])
+            REQUEST_DB_SECONDS.labels(method, route).observe(db_stats[1])
+            if state["route"] is not None:
+                IN_PROGRESS.labels(method, route).dec()
+            _request_db.reset(token)
+
+
+def metrics_response() -> Response:
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+def mark_worker_dead(pid: int = None):
+    """Drop an exiting worker's live gauges from the multiprocess directory."""
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid or os.getpid())
@@ -0,0 +1,315 @@
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+
+import openai
+from openai import AsyncOpenAI
+
+from app.services.metrics import AI_SCORING_SECONDS
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+)
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class QueueTimeoutError(TimeoutError):
+    """The deadline ran out while waiting for a local concurrency slot.
+
+    OpenAI was never called, so this says nothing about the upstream and
+    does not count towards the circuit breaker.
+    """
+
+
+class CircuitBreaker:
+    """Fails fast after ``failure_threshold`` consecutive upstream failures.
+
+    Once open, calls are rejected until ``reset_timeout`` seconds have passed;
+    then a single trial call is let through and its outcome closes or re-opens
+    the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release(self):
+        """End a call without a verdict (e.g. cancelled) so the next call can be the trial."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning("OpenAI circuit opened after %d failures", self._failures)
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+
+class ClientStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.calls = 0
+        self.failures = 0
+        self.retries = 0
+        self.rejected = 0
+        self.queue_timeouts = 0
+        self.latency_seconds_total = 0.0
+        self.latency_seconds_max = 0.0
+
+    def started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, latency: float, failed: bool):
+        with self._lock:
+            self.in_flight -= 1
+            self.calls += 1
+            self.failures += int(failed)
+            self.latency_seconds_total += latency
+            self.latency_seconds_max = max(self.latency_seconds_max, latency)
+
+    def incr(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "calls": self.calls,
+                "failures": self.failures,
+                "retries": self.retries,
+                "rejected": self.rejected,
+                "queue_timeouts": self.queue_timeouts,
+                "latency_seconds_total": round(self.latency_seconds_total, 6),
+                "latency_seconds_max": round(self.latency_seconds_max, 6),
+            }
+
+
+class ScoringClient:
+    """Async OpenAI chat client shared by every caller in the process.
+
+    All requests run on one background event loop, so the concurrency limit
+    is global no matter whether the caller is a worker thread
+    (``complete_sync``) or a coroutine (``complete``). ``timeout`` is the
+    deadline for a whole call including retries; 429, 5xx, timeouts and
+    connection errors are retried with full-jitter backoff.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: str = None,
+        timeout: float = 60.0,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        retry_base_delay: float = 0.5,
+        retry_max_delay: float = 8.0,
+        breaker: CircuitBreaker = None,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.breaker = breaker or CircuitBreaker()
+        self.stats = ClientStats()
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name="openai-client", daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _api(self) -> AsyncOpenAI:
+        # Created on the client's loop so the underlying httpx pool stays on one loop
+        if self._client is None:
+            self._client = AsyncOpenAI(
+                api_key=self.api_key or os.getenv("OPENAI_API_KEY"),
+                base_url=self.base_url,
+                max_retries=0,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    def backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+
+    async def _attempt(self, api: AsyncOpenAI, deadline: float, **kwargs) -> str:
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            raise QueueTimeoutError("Deadline exceeded waiting for an OpenAI slot") from None
+        try:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise QueueTimeoutError("Deadline exceeded waiting for an OpenAI slot")
+            self.stats.started()
+            start = time.perf_counter()
+            failed = True
+            try:
+                response = await asyncio.wait_for(
+                    api.chat.completions.create(timeout=remaining, **kwargs), remaining
+                )
+                failed = False
+            finally:
+                elapsed = time.perf_counter() - start
+                self.stats.finished(elapsed, failed)
+                AI_SCORING_SECONDS.labels("error" if failed else "ok").observe(elapsed)
+        finally:
+            self._semaphore.release()
+        return response.choices[0].message.content
+
+    async def _complete(self, **kwargs) -> str:
+        api = self._api()
+        deadline = time.monotonic() + self.timeout
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                self.stats.incr("rejected")
+                raise CircuitOpenError("OpenAI circuit is open; failing fast")
+            settled = False
+            try:
+                content = await self._attempt(api, deadline, **kwargs)
+            except QueueTimeoutError:
+                # Local congestion, not an upstream failure
+                self.breaker.release()
+                settled = True
+                self.stats.incr("queue_timeouts")
+                raise
+            except (*_RETRYABLE_ERRORS, TimeoutError, asyncio.TimeoutError) as e:
+                self.breaker.record_failure()
+                settled = True
+                delay = self.backoff_delay(attempt)
+                if attempt >= self.max_retries or time.monotonic() + delay >= deadline:
+                    if isinstance(e, (openai.APITimeoutError, asyncio.TimeoutError)):
+                        raise TimeoutError("OpenAI request deadline exceeded") from e
+                    raise
+                attempt += 1
+                self.stats.incr("retries")
+                logger.info("Retrying OpenAI call in %.2fs after: %s", delay, e)
+                await asyncio.sleep(delay)
+            except openai.APIStatusError:
+                # Upstream answered (e.g. 400); that is not an outage
+                self.breaker.record_success()
+                settled = True
+                raise
+            except Exception:
+                # Unexpected errors, e.g. a response without choices
+                self.breaker.record_failure()
+                settled = True
+                raise
+            else:
+                self.breaker.record_success()
+                settled = True
+                return content
+            finally:
+                # Cancelled mid-call: a half-open trial must not stay in flight forever
+                if not settled:
+                    self.breaker.release()
+
+    async def complete(self, messages: list, model: str, temperature: float) -> str:
+        """Return the message content of a chat completion."""
+        loop = self._ensure_loop()
+        coro = self._complete(model=model, messages=messages, temperature=temperature)
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def complete_sync(self, messages: list, model: str, temperature: float) -> str:
+        """Blocking variant of :meth:`complete` for worker threads."""
+        loop = self._ensure_loop()
+        coro = self._complete(model=model, messages=messages, temperature=temperature)
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.close(), loop).result()
+            self._client = None
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        loop.close()
+
+
+def client_from_env() -> ScoringClient:
+    return ScoringClient(
+        base_url=os.getenv("OPENAI_BASE_URL") or None,
+        timeout=float(os.getenv("OPENAI_TIMEOUT", "60")),
+        max_concurrency=int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")),
+        max_retries=int(os.getenv("OPENAI_MAX_RETRIES", "3")),
+        breaker=CircuitBreaker(
+            failure_threshold=int(os.getenv("OPENAI_BREAKER_THRESHOLD", "5")),
+            reset_timeout=float(os.getenv("OPENAI_BREAKER_RESET_SECONDS", "30")),
+        ),
+    )
+
+
+def openai_client_stats(client: ScoringClient) -> dict:
+    stats = client.stats.snapshot()
+    stats.update(circuit=client.breaker.state, max_concurrency=client.max_concurrency)
+    return stats
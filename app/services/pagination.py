@@ -0,0 +1,95 @@
+import base64
+import json
+import os
+from datetime import datetime
+
+from fastapi import Query, Request, Response
+from sqlalchemy import DateTime, and_, or_
+
+from app.exceptions import ValidationException
+
+DEFAULT_LIMIT = int(os.getenv("PAGE_SIZE_DEFAULT", "50"))
+MAX_LIMIT = int(os.getenv("PAGE_SIZE_MAX", "200"))
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: list) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor does not match this listing")
+        return [
+            datetime.fromisoformat(v) if isinstance(col.type, DateTime) and v is not None else v
+            for col, v in zip(columns, values)
+        ]
+    except (ValueError, TypeError) as e:
+        raise ValidationException(f"Invalid cursor: {e}")
+
+
+def keyset_after(columns: list, values: list, descending: bool = True):
+    """Rows strictly after ``values`` in (columns...) order, as an OR of prefix matches.
+
+    Spelled out instead of a row-value comparison so it works on every
+    backend and each branch can use the (columns...) index.
+    """
+    clauses = []
+    for i, column in enumerate(columns):
+        equal = [columns[j] == values[j] for j in range(i)]
+        beyond = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal, beyond))
+    return or_(*clauses)
+
+
+class Page:
+    """Route dependency for keyset pagination: ``page: Page = Depends()``.
+
+    Lists stay plain JSON arrays; the cursor for the following page is
+    returned in the ``X-Next-Cursor`` header (and a ``Link: rel="next"``),
+    and is absent on the last page.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        response: Response,
+        cursor: str = Query(default=None, description="Opaque cursor from X-Next-Cursor"),
+        limit: int = Query(default=DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    ):
+        self.request = request
+        self.response = response
+        self.cursor = cursor
+        self.limit = limit
+        self.columns = []
+
+    def apply(self, stmt, *columns, descending: bool = True):
+        """Order ``stmt`` by ``columns`` (last one unique), seek past the cursor and bound it.
+
+        The columns must be NOT NULL: a NULL never compares past the cursor,
+        so such rows would be skipped or repeated between pages.
+        """
+        nullable = [c.key for c in columns if getattr(getattr(c, "expression", c), "nullable", False)]
+        if nullable:
+            raise ValueError(f"Cursor columns must be NOT NULL: {', '.join(nullable)}")
+        self.columns = list(columns)
+        if self.cursor:
+            stmt = stmt.where(keyset_after(self.columns, decode_cursor(self.cursor, self.columns), descending))
+        order = [c.desc() if descending else c.asc() for c in self.columns]
+        return stmt.order_by(*order).limit(self.limit + 1)
+
+    def finish(self, rows: list) -> list:
+        """Trim the look-ahead row and publish the next cursor."""
+        rows = list(rows)
+        if len(rows) <= self.limit:
+            return rows
+        rows = rows[:self.limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, c.key) for c in self.columns])
+        next_url = self.request.url.include_query_params(cursor=next_cursor, limit=self.limit)
+        self.response.headers["X-Next-Cursor"] = next_cursor
+        self.response.headers["Link"] = f'<{next_url}>; rel="next"'
+        return rows
@@ -0,0 +1,96 @@
+"""Statements behind the hot read paths.
+
+Routes build their queries here so tests/test_indexes.py can check the
+query plan of exactly what is executed, including the keyset predicate
+``Page.apply`` adds.
+"""
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.models.apprentice_invitation import ApprenticeInvitation
+from app.models.assessment import Assessment
+from app.models.assessment_draft import AssessmentDraft
+from app.models.assessment_score_history import AssessmentScoreHistory
+from app.models.assessment_template_question import AssessmentTemplateQuestion
+from app.models.category import Category
+from app.models.mentor_apprentice import MentorApprentice
+from app.models.mentor_note import MentorNote
+from app.models.question import Question
+
+
+def mentor_apprentice_ids(mentor_id: str):
+    return select(MentorApprentice.apprentice_id).where(MentorApprentice.mentor_id == mentor_id)
+
+
+def in_progress_draft(apprentice_id: str):
+    return select(AssessmentDraft).where(
+        AssessmentDraft.apprentice_id == apprentice_id,
+        AssessmentDraft.is_submitted == False,
+    )
+
+
+def submitted_drafts(apprentice_ids, start_date: datetime = None, end_date: datetime = None):
+    """Submitted drafts of ``apprentice_ids`` (a single id or a collection)."""
+    if isinstance(apprentice_ids, str):
+        owner = AssessmentDraft.apprentice_id == apprentice_ids
+    else:
+        owner = AssessmentDraft.apprentice_id.in_(apprentice_ids)
+    stmt = select(AssessmentDraft).where(owner, AssessmentDraft.is_submitted == True)
+    if start_date:
+        stmt = stmt.where(AssessmentDraft.updated_at >= start_date)
+    if end_date:
+        stmt = stmt.where(AssessmentDraft.updated_at <= end_date)
+    return stmt
+
+
+def apprentice_assessments(
+    apprentice_id: str, category: str = None, start_date: datetime = None, end_date: datetime = None
+):
+    stmt = select(Assessment).where(Assessment.apprentice_id == apprentice_id)
+    if category:
+        stmt = stmt.where(Assessment.category == category)
+    if start_date:
+        stmt = stmt.where(Assessment.created_at >= start_date)
+    if end_date:
+        stmt = stmt.where(Assessment.created_at <= end_date)
+    return stmt
+
+
+def assessment_score_history(assessment_id: str):
+    return select(AssessmentScoreHistory).where(AssessmentScoreHistory.assessment_id == assessment_id)
+
+
+def apprentice_score_history(apprentice_id: str):
+    return select(AssessmentScoreHistory).where(AssessmentScoreHistory.apprentice_id == apprentice_id)
+
+
+def assessment_notes(assessment_id: str, shared_only: bool = False):
+    stmt = select(MentorNote).where(MentorNote.assessment_id == assessment_id)
+    if shared_only:
+        stmt = stmt.where(MentorNote.is_private == False)
+    return stmt
+
+
+def pending_invitation(apprentice_email: str, mentor_id: str, now: datetime):
+    return select(ApprenticeInvitation).where(
+        ApprenticeInvitation.apprentice_email == apprentice_email,
+        ApprenticeInvitation.mentor_id == mentor_id,
+        ApprenticeInvitation.accepted == False,
+        ApprenticeInvitation.expires_at > now,
+    )
+
+
+def template_question_rows(template_id: str):
+    """A template's questions in display order, with their category names."""
+    return (
+        select(
+            AssessmentTemplateQuestion.order,
+            Question.id, Question.text, Question.category_id,
+            Category.name.label("category"),
+        )
+        .join(Question, AssessmentTemplateQuestion.question_id == Question.id)
+        .outerjoin(Category, Question.category_id == Category.id)
+        .where(AssessmentTemplateQuestion.template_id == template_id)
+        .order_by(AssessmentTemplateQuestion.order, Question.id)
+    )
@@ -0,0 +1,268 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.db import SessionLocal
+from app.models.assessment import Assessment
+from app.models.assessment_score_history import AssessmentScoreHistory
+from app.models.rescore_job import RescoreJob
+from app.services import ai_scoring, apprentice_stats
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+PAUSED = "paused"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+BATCH_SIZE = int(os.getenv("RESCORE_BATCH_SIZE", "100"))
+STALE_SECONDS = float(os.getenv("RESCORE_STALE_SECONDS", "300"))
+
+
+def scope_filter(scope: str, scope_id: str = None) -> list:
+    if scope == "apprentice":
+        return [Assessment.apprentice_id == scope_id]
+    if scope == "template":
+        return [Assessment.template_id == scope_id]
+    if scope == "all":
+        return []
+    raise ValueError(f"Unknown rescore scope: {scope}")
+
+
+def create_rescore_job(
+    db: Session,
+    scope: str,
+    scope_id: str = None,
+    concurrency: int = 4,
+    target_per_minute: float = None,
+    triggered_by_user_id: str = None,
+) -> RescoreJob:
+    if scope != "all" and not scope_id:
+        raise ValueError(f"scope_id is required for scope '{scope}'")
+    total = db.execute(
+        select(func.count()).select_from(Assessment).where(*scope_filter(scope, scope_id))
+    ).scalar()
+    job = RescoreJob(
+        scope=scope,
+        scope_id=scope_id if scope != "all" else None,
+        status=QUEUED,
+        total=total,
+        concurrency=concurrency,
+        target_per_minute=target_per_minute,
+        model_used=ai_scoring.MODEL,
+        triggered_by_user_id=triggered_by_user_id,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def can_resume(job: RescoreJob) -> bool:
+    """Paused and failed jobs resume; so do running jobs whose runner stopped reporting."""
+    if job.status in (QUEUED, PAUSED, FAILED):
+        return True
+    if job.status == RUNNING:
+        return job.updated_at < datetime.utcnow() - timedelta(seconds=STALE_SECONDS)
+    return False
+
+
+class Throttle:
+    """Paces batches so a run never goes faster than ``per_minute`` assessments."""
+
+    def __init__(self, per_minute: float = None, clock=time.monotonic, sleep=time.sleep):
+        self.per_minute = per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._start = clock()
+        self._done = 0
+
+    def wait(self, count: int):
+        self._done += count
+        if not self.per_minute:
+            return
+        delay = self._start + self._done * 60 / self.per_minute - self._clock()
+        if delay > 0:
+            self._sleep(delay)
+
+
+def _score_row(session_factory, row):
+    # One session per call: rows are scored on pool threads, and the session
+    # lets score_assessment share the DB-backed per-answer cache
+    db = session_factory()
+    try:
+        score_data = ai_scoring.score_assessment(row.answers or {}, db=db)
+        scores, _, recommendation = ai_scoring.summarize_scores(score_data)
+        if not scores:
+            raise ValueError("Model returned no scores")
+        return row, score_data, scores, recommendation, None
+    except Exception as e:
+        logger.warning("Rescoring assessment %s failed: %s", row.id, e)
+        return row, None, None, None, e
+    finally:
+        # Commit whatever the cache stored, even when some answers failed
+        db.commit()
+        db.close()
+
+
+def _write_batch(db: Session, job: RescoreJob, outcomes: list, retry: bool = False):
+    """Bulk-insert history rows, update current scores and advance the checkpoint in one commit.
+
+    Failed assessments are kept in ``job.failed_ids``. A ``retry`` batch
+    re-runs those ids and leaves ``processed`` and the checkpoint alone.
+    """
+    scored = [o for o in outcomes if o[4] is None]
+    if scored:
+        db.execute(insert(AssessmentScoreHistory), [
+            {
+                "assessment_id": row.id,
+                "apprentice_id": row.apprentice_id,
+                "score_data": score_data,
+                "model_used": job.model_used,
+                "triggered_by": "system",
+                "triggered_by_user_id": job.triggered_by_user_id,
+                "notes": f"Rescore job {job.id}",
+            }
+            for row, score_data, _, _, _ in scored
+        ])
+        # Core executemany: ORM bulk UPDATE trips over Assessment.latest_score's hybrid
+        assessments = Assessment.__table__
+        db.connection().execute(
+            update(assessments)
+            .where(assessments.c.id == bindparam("assessment_id"))
+            .values(scores=bindparam("scores"), recommendation=bindparam("recommendation"), scoring_status="scored"),
+            [
+                {"assessment_id": row.id, "scores": scores, "recommendation": recommendation}
+                for row, _, scores, recommendation, _ in scored
+            ],
+        )
+        apprentice_stats.record_scores(db, [(row, row.scores, scores) for row, _, scores, _, _ in scored])
+    errors = [o[4] for o in outcomes if o[4] is not None]
+    failed_ids = set(job.failed_ids or [])
+    failed_ids -= {o[0].id for o in scored}
+    failed_ids |= {o[0].id for o in outcomes if o[4] is not None}
+    job.failed_ids = sorted(failed_ids)
+    job.failed = len(failed_ids)
+    if errors:
+        job.last_error = str(errors[-1])
+    if not retry:
+        job.processed += len(outcomes)
+        job.checkpoint_id = outcomes[-1][0].id
+    job.updated_at = datetime.utcnow()
+    db.commit()
+
+
+def run_rescore_job(
+    job_id: str,
+    session_factory=SessionLocal,
+    batch_size: int = None,
+    sleep=time.sleep,
+) -> RescoreJob:
+    """Rescore every assessment in the job's scope after its checkpoint.
+
+    Assessments are streamed in id order through a server-side cursor and
+    scored ``job.concurrency`` at a time. Each batch is written in one
+    transaction together with the new checkpoint, so a crashed, paused or
+    failed job resumes exactly where it stopped. A batch in which every
+    assessment fails (e.g. OpenAI is down) fails the job without moving the
+    checkpoint. Assessments that failed in otherwise good batches are
+    retried first when the job runs again.
+    """
+    batch_size = batch_size or BATCH_SIZE
+    db = session_factory()
+    reader = session_factory()
+    try:
+        job = db.get(RescoreJob, job_id)
+        run_started = datetime.utcnow()
+        job.status = RUNNING
+        job.started_at = run_started
+        job.finished_at = None
+        job.processed_at_start = job.processed
+        job.last_error = None
+        db.commit()
+
+        columns = select(
+            Assessment.id, Assessment.apprentice_id, Assessment.created_at, Assessment.answers, Assessment.scores
+        ).order_by(Assessment.id)
+        stmt = columns.where(*scope_filter(job.scope, job.scope_id)).execution_options(yield_per=batch_size)
+        if job.checkpoint_id:
+            stmt = stmt.where(Assessment.id > job.checkpoint_id)
+
+        throttle = Throttle(job.target_per_minute, sleep=sleep)
+        score_row = partial(_score_row, session_factory)
+        with ThreadPoolExecutor(max_workers=job.concurrency, thread_name_prefix="rescore") as pool:
+            retry_ids = list(job.failed_ids or [])
+            for start in range(0, len(retry_ids), batch_size):
+                batch = reader.execute(columns.where(Assessment.id.in_(retry_ids[start:start + batch_size]))).all()
+                if batch:
+                    _write_batch(db, job, list(pool.map(score_row, batch)), retry=True)
+                    throttle.wait(len(batch))
+
+            for batch in reader.execute(stmt).partitions():
+                db.refresh(job)
+                # Paused, or resumed by a newer runner that now owns the job
+                if job.status != RUNNING or job.started_at != run_started:
+                    logger.info("Rescore job %s stopped at %s (%s)", job.id, job.checkpoint_id, job.status)
+                    return job
+
+                outcomes = list(pool.map(score_row, batch))
+                if all(o[4] is not None for o in outcomes):
+                    job.status = FAILED
+                    job.last_error = str(outcomes[-1][4])
+                    job.finished_at = datetime.utcnow()
+                    db.commit()
+                    return job
+
+                _write_batch(db, job, outcomes)
+                logger.info(
+                    "Rescore job %s: %d/%d assessments (%s failed)",
+                    job.id, job.processed, job.total, job.failed,
+                )
+                throttle.wait(len(outcomes))
+
+        job.status = SUCCEEDED
+        job.finished_at = datetime.utcnow()
+        db.commit()
+        return job
+    except Exception as e:
+        logger.exception("Rescore job %s crashed", job_id)
+        db.rollback()
+        job = db.get(RescoreJob, job_id)
+        if job is not None:
+            job.status = FAILED
+            job.last_error = str(e)
+            job.finished_at = datetime.utcnow()
+            db.commit()
+        return job
+    finally:
+        reader.close()
+        # Hand back a loaded, detached snapshot of the final job state
+        job = db.get(RescoreJob, job_id, populate_existing=True)
+        if job is not None:
+            db.expunge(job)
+        db.close()
+
+
+def start_in_background(job_id: str) -> threading.Thread:
+    thread = threading.Thread(
+        target=run_rescore_job, args=(job_id,), name=f"rescore-{job_id[:8]}", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    # Run or resume a job outside the API process: python -m app.services.rescoring <job_id>
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    finished = run_rescore_job(sys.argv[1])
+    print(f"{finished.id}: {finished.status} ({finished.processed}/{finished.total}, {finished.failed} failed)")
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.scoring_cache import ScoringCacheEntry
+from app.services.cache import TTLCache
+
+_memory = TTLCache(maxsize=int(os.getenv("SCORING_CACHE_SIZE", "1024")))
+# Keys whose DB row had last_used_at refreshed recently. Memory hits refresh it at
+# most once per interval, so evict() doesn't prune the hottest entries first.
+_touched = TTLCache(
+    maxsize=int(os.getenv("SCORING_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("SCORING_CACHE_TOUCH_INTERVAL", "3600")),
+)
+_stats_lock = threading.Lock()
+_stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+
+def _count(name: str, n: int = 1):
+    with _stats_lock:
+        _stats[name] += n
+
+
+def scoring_cache_stats() -> dict:
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["memory_entries"] = len(_memory)
+    return stats
+
+
+def normalize_text(value) -> str:
+    """Whitespace differences must not change the cache key."""
+    return " ".join(str(value or "").split())
+
+
+def answer_key(question_id: str, answer, model: str, prompt_version: str, temperature: float) -> str:
+    """Key for one scored answer: (question_id, answer hash, prompt version, model settings)."""
+    blob = json.dumps(
+        {
+            "input": {"question_id": str(question_id).strip(), "answer": normalize_text(answer)},
+            "model": model,
+            "prompt": prompt_version,
+            "temperature": temperature,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def get_cached(db: Session, key: str):
+    result = _memory.get(key)
+    if result is not None:
+        _count("memory_hits")
+        if db is not None and _touched.get(key) is None:
+            db.execute(
+                update(ScoringCacheEntry)
+                .where(ScoringCacheEntry.key == key)
+                .values(last_used_at=datetime.utcnow())
+            )
+            _touched.set(key, True)
+        return result
+    if db is not None:
+        result = db.execute(
+            select(ScoringCacheEntry.result).where(ScoringCacheEntry.key == key)
+        ).scalar()
+        if result is not None:
+            db.execute(
+                update(ScoringCacheEntry)
+                .where(ScoringCacheEntry.key == key)
+                .values(hit_count=ScoringCacheEntry.hit_count + 1, last_used_at=datetime.utcnow())
+            )
+            _memory.set(key, result)
+            _touched.set(key, True)
+            _count("db_hits")
+            return result
+    _count("misses")
+    return None
+
+
+def store(db: Session, key: str, result: dict, model: str, prompt_version: str):
+    """Remember ``result``; the DB row is flushed in a savepoint and committed by the caller."""
+    _memory.set(key, result)
+    _count("stores")
+    if db is None:
+        return
+    _touched.set(key, True)
+    try:
+        with db.begin_nested():
+            db.add(ScoringCacheEntry(key=key, model=model, prompt_version=prompt_version, result=result))
+    except IntegrityError:
+        # Another worker stored the same key first; its result is equivalent.
+        pass
+
+
+def evict(db: Session, max_age_days: int = None, max_rows: int = None) -> int:
+    """Drop entries unused for ``max_age_days`` and trim the table to ``max_rows`` (LRU)."""
+    max_age_days = max_age_days or int(os.getenv("SCORING_CACHE_MAX_AGE_DAYS", "90"))
+    max_rows = max_rows or int(os.getenv("SCORING_CACHE_MAX_ROWS", "100000"))
+
+    cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+    removed = db.execute(
+        delete(ScoringCacheEntry).where(ScoringCacheEntry.last_used_at < cutoff)
+    ).rowcount
+
+    keep = select(ScoringCacheEntry.key).order_by(ScoringCacheEntry.last_used_at.desc()).limit(max_rows)
+    removed += db.execute(
+        delete(ScoringCacheEntry).where(ScoringCacheEntry.key.not_in(keep))
+    ).rowcount
+    db.commit()
+    _count("evictions", removed)
+    return removed
+
+
+def clear_memory():
+    _memory.clear()
+    _touched.clear()
@@ -0,0 +1,287 @@
+import logging
+import os
+import random
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.db import SessionLocal
+from app.models.assessment import Assessment
+from app.models.assessment_template import AssessmentTemplate
+from app.models.mentor_apprentice import MentorApprentice
+from app.models.notification import Notification
+from app.models.scoring_job import ScoringJob
+from app.models.user import User
+from app.services import ai_scoring, apprentice_stats, scoring_cache
+from app.services.email import queue_assessment_email
+from app.services.score_history import save_score_history
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+BACKOFF_BASE_SECONDS = float(os.getenv("SCORING_BACKOFF_BASE", "5"))
+BACKOFF_MAX_SECONDS = float(os.getenv("SCORING_BACKOFF_MAX", "600"))
+STALE_JOB_SECONDS = float(os.getenv("SCORING_STALE_JOB_SECONDS", "900"))
+STALE_CHECK_INTERVAL_SECONDS = float(os.getenv("SCORING_STALE_CHECK_INTERVAL", "60"))
+CACHE_EVICTION_INTERVAL_SECONDS = float(os.getenv("SCORING_CACHE_EVICTION_INTERVAL", "3600"))
+
+STALE_JOB_ERROR = "Worker stopped responding"
+
+
+def enqueue_scoring(
+    db: Session,
+    assessment_id: str,
+    triggered_by: str = "system",
+    triggered_by_user_id: str = None,
+) -> ScoringJob:
+    """Add a scoring job to the session; it is committed with the caller's transaction."""
+    job = ScoringJob(
+        assessment_id=assessment_id,
+        status=QUEUED,
+        triggered_by=triggered_by,
+        triggered_by_user_id=triggered_by_user_id,
+        run_after=datetime.utcnow(),
+    )
+    db.add(job)
+    return job
+
+
+def backoff_delay(attempt: int) -> float:
+    delay = min(BACKOFF_BASE_SECONDS * (2 ** max(attempt - 1, 0)), BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def claim_job(db: Session, worker_id: str):
+    """Claim the oldest runnable job, or return None.
+
+    FOR UPDATE SKIP LOCKED keeps concurrent workers off the same row on
+    Postgres; the conditional UPDATE makes the claim safe on SQLite, which
+    ignores row locks.
+    """
+    now = datetime.utcnow()
+    job_id = db.execute(
+        select(ScoringJob.id)
+        .where(ScoringJob.status == QUEUED, ScoringJob.run_after <= now)
+        .order_by(ScoringJob.run_after)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    ).scalar()
+    if job_id is None:
+        db.rollback()
+        return None
+
+    claimed = db.execute(
+        update(ScoringJob)
+        .where(ScoringJob.id == job_id, ScoringJob.status == QUEUED)
+        .values(
+            status=RUNNING,
+            locked_by=worker_id,
+            locked_at=now,
+            attempts=ScoringJob.attempts + 1,
+            updated_at=now,
+        )
+    ).rowcount
+    db.commit()
+    if not claimed:
+        return None
+    return db.get(ScoringJob, job_id)
+
+
+def requeue_stale_jobs(db: Session, older_than_seconds: float = STALE_JOB_SECONDS) -> int:
+    """Return jobs whose worker died mid-run to the queue.
+
+    A job that has used up its attempts is failed instead, so one that kills
+    its worker every time (OOM, hang) can't be requeued forever.
+    """
+    now = datetime.utcnow()
+    stale = (ScoringJob.status == RUNNING, ScoringJob.locked_at < now - timedelta(seconds=older_than_seconds))
+    exhausted = ScoringJob.attempts >= ScoringJob.max_attempts
+    failed_ids = db.execute(select(ScoringJob.assessment_id).where(*stale, exhausted)).scalars().all()
+    count = 0
+    if failed_ids:
+        count += db.execute(
+            update(ScoringJob)
+            .where(*stale, exhausted)
+            .values(status=FAILED, locked_by=None, locked_at=None, last_error=STALE_JOB_ERROR, updated_at=now)
+        ).rowcount
+        db.execute(
+            update(Assessment).where(Assessment.id.in_(failed_ids)).values(scoring_status="failed")
+        )
+        logger.warning("Failed %d scoring jobs whose worker died on every attempt", count)
+    count += db.execute(
+        update(ScoringJob)
+        .where(*stale, ~exhausted)
+        .values(status=QUEUED, locked_by=None, locked_at=None, updated_at=now)
+    ).rowcount
+    db.commit()
+    return count
+
+
+def _notify_scored(db: Session, assessment: Assessment, score_data: dict, overall, recommendation):
+    db.add(Notification(
+        user_id=assessment.apprentice_id,
+        message="Your assessment has been scored.",
+        link=f"/apprentice/my-assessment/{assessment.id}",
+    ))
+
+    link = db.query(MentorApprentice).filter_by(apprentice_id=assessment.apprentice_id).first()
+    mentor = db.query(User).filter_by(id=link.mentor_id).first() if link else None
+    apprentice = db.query(User).filter_by(id=assessment.apprentice_id).first()
+    if mentor and apprentice:
+        template = db.get(AssessmentTemplate, assessment.template_id) if assessment.template_id else None
+        queue_assessment_email(
+            db,
+            to_email=mentor.email,
+            apprentice_name=apprentice.name,
+            assessment_title=template.name if template else "Assessment",
+            score=overall,
+            feedback_summary=recommendation,
+            details=score_data,
+            dedupe_key=f"assessment-results:{assessment.id}",
+        )
+
+
+def _retry_or_fail(db: Session, job: ScoringJob, assessment: Assessment, error: Exception):
+    logger.warning("Scoring job %s attempt %s failed: %s", job.id, job.attempts, error)
+    job.last_error = str(error)
+    job.locked_by = None
+    job.locked_at = None
+    if job.attempts >= job.max_attempts:
+        job.status = FAILED
+        assessment.scoring_status = "failed"
+    else:
+        job.status = QUEUED
+        job.run_after = datetime.utcnow() + timedelta(seconds=backoff_delay(job.attempts))
+    db.commit()
+
+
+def run_job(db: Session, job: ScoringJob):
+    assessment = db.get(Assessment, job.assessment_id)
+    if assessment is None:
+        # Deleted since it was queued; there is nothing to score or retry
+        job.status = FAILED
+        job.last_error = "Assessment no longer exists"
+        job.locked_by = None
+        job.locked_at = None
+        db.commit()
+        return
+    try:
+        score_data = ai_scoring.score_assessment(assessment.answers, db=db)
+        scores, overall, recommendation = ai_scoring.summarize_scores(score_data)
+    except Exception as e:
+        _retry_or_fail(db, job, assessment, e)
+        return
+    # Keep the per-answer cache rows even if recording the result fails, so a retry reuses them
+    db.commit()
+
+    try:
+        apprentice_stats.record_scores(db, [(assessment, assessment.scores, scores)])
+        assessment.scores = scores
+        assessment.recommendation = recommendation
+        assessment.scoring_status = "scored"
+        job.status = SUCCEEDED
+        job.last_error = None
+        _notify_scored(db, assessment, score_data, overall, recommendation)
+        # save_score_history commits the assessment, job and notification with the history row
+        save_score_history(
+            db,
+            assessment_id=assessment.id,
+            apprentice_id=assessment.apprentice_id,
+            score_data=score_data,
+            triggered_by=job.triggered_by,
+            triggered_by_user_id=job.triggered_by_user_id,
+            model_used=ai_scoring.MODEL,
+        )
+    except Exception as e:
+        db.rollback()
+        _retry_or_fail(db, job, assessment, e)
+
+
+class ScoringWorkerPool:
+    """Threads that drain scoring_jobs with bounded concurrency."""
+
+    def __init__(self, session_factory=SessionLocal, concurrency: int = None, poll_interval: float = 1.0):
+        self.session_factory = session_factory
+        self.concurrency = concurrency or int(os.getenv("SCORING_WORKERS", "2"))
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads = []
+        self._last_run = {}
+        self._maintenance_lock = threading.Lock()
+
+    def run_once(self, worker_id: str) -> bool:
+        """Claim and run a single job; returns False when the queue is empty."""
+        db = self.session_factory()
+        try:
+            job = claim_job(db, worker_id)
+            if job is None:
+                return False
+            run_job(db, job)
+            return True
+        finally:
+            db.close()
+
+    def _run_if_due(self, task, interval: float):
+        with self._maintenance_lock:
+            if time.monotonic() - self._last_run.get(task, 0.0) < interval:
+                return
+            self._last_run[task] = time.monotonic()
+        db = self.session_factory()
+        try:
+            task(db)
+        finally:
+            db.close()
+
+    def maintain(self):
+        """Periodic upkeep between jobs: requeue jobs of dead workers, evict old cache rows."""
+        self._run_if_due(requeue_stale_jobs, STALE_CHECK_INTERVAL_SECONDS)
+        self._run_if_due(scoring_cache.evict, CACHE_EVICTION_INTERVAL_SECONDS)
+
+    def _loop(self, worker_id: str):
+        while not self._stop.is_set():
+            try:
+                # Checked every pass so a busy queue still requeues jobs of dead workers
+                self.maintain()
+                if self.run_once(worker_id):
+                    continue
+            except Exception:
+                logger.exception("Scoring worker %s crashed on a job", worker_id)
+            self._stop.wait(self.poll_interval)
+
+    def start(self):
+        db = self.session_factory()
+        try:
+            requeue_stale_jobs(db)
+        finally:
+            db.close()
+        host = socket.gethostname()
+        for i in range(self.concurrency):
+            worker_id = f"{host}:{os.getpid()}:{i}"
+            thread = threading.Thread(target=self._loop, args=(worker_id,), name=f"scoring-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+
+if __name__ == "__main__":
+    # Run the scoring workers outside the API process: python -m app.services.scoring_queue
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    pool = ScoringWorkerPool()
+    pool.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pool.stop()
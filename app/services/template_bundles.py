@@ -0,0 +1,144 @@
+"""Immutable, versioned template bundles for apprentices.
+
+Publishing a template snapshots its ordered questions (with texts and
+categories) into ``template_bundles`` under a new version number and
+bumps ``assessment_templates.version``. A (template_id, version) bundle
+never changes, so every process can cache it forever; the only thing that
+goes stale is "which version is current", which is re-read from the
+template row after ``TEMPLATE_VERSION_TTL`` seconds (the version column is
+the invalidation signal shared by every worker) and dropped immediately in
+the publishing process.
+"""
+import hashlib
+import json
+import os
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.assessment_template import AssessmentTemplate
+from app.models.template_bundle import TemplateBundle
+from app.services import queries
+from app.services.cache import TTLCache
+
+# (template_id, version) -> {"payload", "body", "etag"}; immutable, so LRU only
+_bundles = TTLCache(maxsize=int(os.getenv("TEMPLATE_BUNDLE_CACHE_SIZE", "256")))
+# template_id -> current published version
+_current_versions = TTLCache(
+    maxsize=int(os.getenv("TEMPLATE_BUNDLE_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("TEMPLATE_VERSION_TTL", "30")),
+)
+
+
+def invalidate_template(template_id: str):
+    _current_versions.pop(template_id)
+
+
+def _encode(payload: dict) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def build_bundle(db: Session, template: AssessmentTemplate, version: int) -> dict:
+    rows = db.execute(queries.template_question_rows(template.id)).all()
+
+    categories = {}
+    for row in rows:
+        if row.category_id and row.category_id not in categories:
+            categories[row.category_id] = {"id": row.category_id, "name": row.category}
+    return {
+        "template_id": template.id,
+        "version": version,
+        "name": template.name,
+        "description": template.description,
+        "categories": list(categories.values()),
+        "questions": [
+            {
+                "id": row.id,
+                "text": row.text,
+                "category_id": row.category_id,
+                "category": row.category,
+                "order": row.order,
+            }
+            for row in rows
+        ],
+    }
+
+
+def _entry(payload: dict, etag: str = None) -> dict:
+    body = _encode(payload)
+    return {
+        "payload": payload,
+        "body": body,
+        "etag": etag or '"%s"' % hashlib.sha256(body).hexdigest()[:32],
+        # Completeness checks against the version's questions without rebuilding the set
+        "required": frozenset(question["id"] for question in payload["questions"]),
+    }
+
+
+def is_complete(bundle: dict, answers: dict) -> bool:
+    """Whether ``answers`` covers every question in ``bundle``; O(len(answers)), no queries."""
+    required = bundle["required"]
+    return bool(answers) and sum(1 for question_id in answers if question_id in required) == len(required)
+
+
+def unknown_questions(bundle: dict, answers) -> list:
+    """Question ids in ``answers`` that are not part of ``bundle``'s version."""
+    required = bundle["required"]
+    return sorted(question_id for question_id in answers if question_id not in required)
+
+
+def publish_template(db: Session, template: AssessmentTemplate) -> TemplateBundle:
+    """Snapshot the template's current questions as the next version and mark it published."""
+    version = (template.version or 0) + 1
+    payload = build_bundle(db, template, version)
+    entry = _entry(payload)
+    bundle = TemplateBundle(template_id=template.id, version=version, etag=entry["etag"], payload=payload)
+    db.add(bundle)
+    template.version = version
+    template.is_published = True
+    db.commit()
+    _bundles.set((template.id, version), entry)
+    invalidate_template(template.id)
+    return bundle
+
+
+def current_version(db: Session, template_id: str):
+    """The template's published version, or None if it is not published."""
+    version = _current_versions.get(template_id)
+    if version is not None:
+        return version
+    template = db.get(AssessmentTemplate, template_id)
+    if template is None or not template.is_published:
+        return None
+    if not template.version:
+        # Published before bundles existed and missed the backfill; snapshot it on first use.
+        # publish_template commits, so it runs in its own session: the caller's staged
+        # writes must not be committed with it.
+        with Session(bind=db.get_bind()) as snapshot_db:
+            try:
+                publish_template(snapshot_db, snapshot_db.get(AssessmentTemplate, template_id))
+            except IntegrityError:
+                # Another worker snapshotted it first; use theirs
+                snapshot_db.rollback()
+            version = snapshot_db.get(AssessmentTemplate, template_id, populate_existing=True).version
+        _current_versions.set(template_id, version)
+        return version
+    _current_versions.set(template_id, template.version)
+    return template.version
+
+
+def get_bundle(db: Session, template_id: str, version: int = None):
+    """``{"payload", "body", "etag", "required"}`` for a version (default: current), or None."""
+    if version is None:
+        version = current_version(db, template_id)
+        if version is None:
+            return None
+    entry = _bundles.get((template_id, version))
+    if entry is not None:
+        return entry
+    bundle = db.get(TemplateBundle, (template_id, version))
+    if bundle is None:
+        return None
+    entry = _entry(bundle.payload, bundle.etag)
+    _bundles.set((template_id, version), entry)
+    return entry
@@ -0,0 +1,208 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+import urllib.request
+
+import firebase_admin
+from firebase_admin import auth as firebase_auth
+from jose import jwt
+
+from app.services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_CERTS_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+)
+ISSUER_PREFIX = "https://securetoken.google.com/"
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class InvalidTokenError(ValueError):
+    pass
+
+
+def fetch_public_keys(url: str = GOOGLE_CERTS_URL, timeout: float = 5.0):
+    """Download the signing certificates; returns ``(certs_by_kid, max_age_seconds)``."""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        certs = json.loads(response.read().decode("utf-8"))
+        cache_control = response.headers.get("Cache-Control", "")
+    match = _MAX_AGE_RE.search(cache_control)
+    max_age = int(match.group(1)) if match else 0
+    return certs, max_age
+
+
+class PublicKeyStore:
+    """Holds the Google signing certificates in memory and refreshes them ahead of expiry."""
+
+    def __init__(
+        self,
+        url: str = GOOGLE_CERTS_URL,
+        fetch=fetch_public_keys,
+        refresh_margin: float = 300,
+        min_refresh_interval: float = 30,
+    ):
+        self.url = url
+        self._fetch = fetch
+        self.refresh_margin = refresh_margin
+        self.min_refresh_interval = min_refresh_interval
+        self._certs = {}
+        self._expires_at = 0.0
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def refresh(self):
+        certs, max_age = self._fetch(self.url)
+        now = time.time()
+        with self._lock:
+            self._certs = dict(certs)
+            self._expires_at = now + max_age
+            self._last_refresh = now
+        logger.info("Loaded %d Firebase signing keys (max-age=%ss)", len(certs), max_age)
+
+    def get(self, kid: str):
+        with self._lock:
+            cert = self._certs.get(kid)
+            now = time.time()
+            needs_refresh = cert is None or now >= self._expires_at
+            may_refetch = now - self._last_refresh >= self.min_refresh_interval
+            if needs_refresh and may_refetch:
+                self._last_refresh = now
+        # Unknown kids usually mean Google rotated keys; refetch, but never hammer the endpoint.
+        if needs_refresh and may_refetch:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning("Failed to refresh Firebase signing keys: %s", e)
+            with self._lock:
+                cert = self._certs.get(kid)
+        return cert
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="firebase-key-refresh", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+                delay = self._expires_at - time.time() - self.refresh_margin
+            except Exception as e:
+                logger.warning("Failed to refresh Firebase signing keys: %s", e)
+                delay = self.min_refresh_interval
+            self._stop.wait(max(delay, self.min_refresh_interval))
+
+
+class FirebaseTokenVerifier:
+    """Verifies Firebase ID tokens locally and caches the claims until the token expires."""
+
+    def __init__(
+        self,
+        project_id: str,
+        key_store: PublicKeyStore = None,
+        cache_size: int = 10000,
+        clock_skew_seconds: int = 0,
+    ):
+        self.project_id = project_id
+        self.key_store = key_store or PublicKeyStore()
+        self.clock_skew_seconds = clock_skew_seconds
+        self.cache = TTLCache(maxsize=cache_size, clock=time.time)
+
+    def verify(self, token: str) -> dict:
+        if not token or not isinstance(token, str):
+            raise InvalidTokenError("Token must be a non-empty string")
+
+        claims = self.cache.get(token)
+        if claims is None:
+            claims = self._verify(token)
+            self.cache.set(token, claims, expires_at=claims["exp"])
+        return dict(claims)
+
+    def _verify(self, token: str) -> dict:
+        try:
+            header = jwt.get_unverified_header(token)
+        except Exception as e:
+            raise InvalidTokenError(f"Malformed token: {e}")
+
+        if header.get("alg") != "RS256":
+            raise InvalidTokenError("Token has incorrect algorithm")
+        kid = header.get("kid")
+        if not kid:
+            raise InvalidTokenError('Token has no "kid" claim')
+
+        cert = self.key_store.get(kid)
+        if cert is None:
+            raise InvalidTokenError("Token signed by an unknown key")
+
+        try:
+            claims = jwt.decode(
+                token,
+                cert,
+                algorithms=["RS256"],
+                audience=self.project_id,
+                issuer=ISSUER_PREFIX + self.project_id,
+                options={"leeway": self.clock_skew_seconds},
+            )
+        except Exception as e:
+            raise InvalidTokenError(str(e))
+
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise InvalidTokenError('Token has an invalid "sub" claim')
+        now = time.time() + self.clock_skew_seconds
+        if claims.get("iat", 0) > now or claims.get("auth_time", 0) > now:
+            raise InvalidTokenError("Token was issued in the future")
+
+        claims["uid"] = subject
+        return claims
+
+
+_verifier = None
+_verifier_lock = threading.Lock()
+
+
+def _resolve_project_id():
+    project_id = os.getenv("FIREBASE_PROJECT_ID") or os.getenv("GOOGLE_CLOUD_PROJECT")
+    if project_id:
+        return project_id
+    try:
+        return firebase_admin.get_app().project_id
+    except ValueError:
+        return None
+
+
+def get_token_verifier():
+    """Return the process-wide verifier, or ``None`` when no Firebase project is configured."""
+    global _verifier
+    if _verifier is None:
+        with _verifier_lock:
+            if _verifier is None:
+                project_id = _resolve_project_id()
+                if not project_id:
+                    return None
+                _verifier = FirebaseTokenVerifier(
+                    project_id,
+                    cache_size=int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000")),
+                )
+                _verifier.key_store.start()
+    return _verifier
+
+
+def verify_id_token(token: str) -> dict:
+    verifier = get_token_verifier()
+    if verifier is None:
+        return firebase_auth.verify_id_token(token)
+    return verifier.verify(token)
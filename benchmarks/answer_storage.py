@@ -0,0 +1,97 @@
+"""Compare JSON-blob and per-row draft answer storage.
+
+Seeds an in-memory SQLite database (or ``--database-url``) with drafts, then
+times the two hot paths both ways:
+
+- autosave: change one answer on a draft (rewrite the whole JSON blob vs
+  upsert one ``assessment_answers`` row);
+- per-question read: every answer to one question (scan and parse every
+  draft's JSON vs the ``question_id`` index).
+
+Usage: python -m benchmarks.answer_storage [--drafts 2000] [--questions 40] [--repeat 200]
+"""
+import argparse
+import json
+import random
+import time
+import uuid
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.models import AssessmentAnswer, AssessmentDraft, AssessmentTemplate, Question, User
+from app.services.draft_answers import answers_for_question, save_answers
+
+
+def seed(db, drafts: int, questions: int):
+    user = User(id=str(uuid.uuid4()), name="Bench", email=f"bench+{uuid.uuid4().hex[:8]}@example.com", role="apprentice")
+    template = AssessmentTemplate(id=str(uuid.uuid4()), name="Bench")
+    question_ids = [str(uuid.uuid4()) for _ in range(questions)]
+    db.add_all([user, template, *(Question(id=q, text=f"Question {i}") for i, q in enumerate(question_ids))])
+    draft_ids = [str(uuid.uuid4()) for _ in range(drafts)]
+    blob = {q: "An answer of a typical length, a sentence or two." for q in question_ids}
+    db.execute(AssessmentDraft.__table__.insert(), [
+        {"id": d, "apprentice_id": user.id, "template_id": template.id, "answers": blob, "revision": 1}
+        for d in draft_ids
+    ])
+    db.execute(AssessmentAnswer.__table__.insert(), [
+        {"id": str(uuid.uuid4()), "assessment_id": d, "question_id": q, "answer_text": text}
+        for d in draft_ids for q, text in blob.items()
+    ])
+    db.commit()
+    return draft_ids, question_ids
+
+
+def timed(label: str, repeat: int, fn):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<32} {elapsed * 1000:9.3f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--drafts", type=int, default=2000)
+    parser.add_argument("--questions", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    draft_ids, question_ids = seed(db, args.drafts, args.questions)
+    drafts_table = AssessmentDraft.__table__
+
+    # Both autosaves load the draft and commit a revision-checked UPDATE, as the routes do
+    def json_autosave():
+        draft = db.get(AssessmentDraft, random.choice(draft_ids))
+        draft.legacy_answers = {**draft.legacy_answers, random.choice(question_ids): uuid.uuid4().hex}
+        db.commit()
+
+    def row_autosave():
+        draft = db.get(AssessmentDraft, random.choice(draft_ids))
+        save_answers(db, draft, {random.choice(question_ids): uuid.uuid4().hex})
+        db.commit()
+
+    def json_question_read():
+        question_id = random.choice(question_ids)
+        rows = db.execute(select(drafts_table.c.id, drafts_table.c.answers)).all()
+        return [(draft_id, blob[question_id]) for draft_id, blob in rows if question_id in (blob or {})]
+
+    def row_question_read():
+        return answers_for_question(db, random.choice(question_ids))
+
+    print(f"{args.drafts} drafts x {args.questions} questions on {engine.dialect.name}")
+    timed("autosave, JSON blob", args.repeat, json_autosave)
+    timed("autosave, row upsert", args.repeat, row_autosave)
+    read_repeat = max(1, args.repeat // 10)
+    timed("answers to a question, JSON", read_repeat, json_question_read)
+    timed("answers to a question, rows", read_repeat, row_question_read)
+    print(f"JSON blob per draft: {len(json.dumps(db.execute(select(drafts_table.c.answers)).scalars().first()))} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Per-endpoint response serialization cost, before and after the fast paths.
+
+Builds in-memory ORM rows shaped like each listing and times only the step
+from "route returned rows" to "JSON bytes":
+
+- stdlib: validate, dump to Python, ``json.dumps`` (FastAPI before it dumped
+  response models in pydantic-core);
+- orjson class: validate, dump to Python, ``orjson.dumps`` (an app-wide
+  ``ORJSONResponse``, which turns FastAPI's own fast path off);
+- response_model: validate, ``dump_json`` in pydantic-core (FastAPI today);
+- trusted: ``fast_json.trusted_response`` (no validation), where used.
+
+Usage: python -m benchmarks.response_serialization [--rows 200] [--questions 40] [--repeat 20]
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.models import AssessmentDraft, AssessmentScoreHistory
+from app.models.assessment import Assessment
+from app.schemas.assessment import AssessmentOut
+from app.schemas.assessment_draft import AssessmentDraftOut
+from app.schemas.assessment_score_history import AssessmentScoreHistoryOut
+from app.services import fast_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def score_history_rows(rows: int, questions: int):
+    score_data = {
+        f"q{i}": {"score": 7, "category": "Prayer", "feedback": "A paragraph of model feedback. " * 6}
+        for i in range(questions)
+    }
+    return [
+        AssessmentScoreHistory(
+            id=str(uuid.uuid4()), assessment_id=str(uuid.uuid4()), apprentice_id="apprentice",
+            score_data=score_data, model_used="gpt-4", triggered_by="system", scored_at=datetime.utcnow(),
+        )
+        for _ in range(rows)
+    ]
+
+
+def assessment_rows(rows: int, questions: int):
+    answers = {f"q{i}": "An answer of a typical length, a sentence or two." for i in range(questions)}
+    return [
+        Assessment(
+            id=str(uuid.uuid4()), apprentice_id="apprentice", answers=answers,
+            scores={f"q{i}": 7 for i in range(questions)}, recommendation="Keep going", created_at=datetime.utcnow(),
+        )
+        for _ in range(rows)
+    ]
+
+
+def draft_rows(rows: int, questions: int):
+    answers = {f"q{i}": "An answer of a typical length, a sentence or two." for i in range(questions)}
+    return [
+        AssessmentDraft(id=str(uuid.uuid4()), apprentice_id="apprentice", template_id="template", answers=answers,
+                        is_submitted=True, revision=1)
+        for _ in range(rows)
+    ]
+
+
+def strategies(schema, trusted: bool):
+    adapter = TypeAdapter(List[schema])
+
+    def validated(rows):
+        return adapter.validate_python(rows, from_attributes=True)
+
+    result = {
+        "stdlib": lambda rows: json.dumps(adapter.dump_python(validated(rows), mode="json")).encode(),
+        "response_model": lambda rows: adapter.dump_json(validated(rows)),
+    }
+    if orjson is not None:
+        result["orjson class"] = lambda rows: orjson.dumps(adapter.dump_python(validated(rows), mode="json"))
+    if trusted:
+        result["trusted"] = lambda rows: fast_json.trusted_response(schema, rows).body
+    return result
+
+
+def timed(fn, rows, repeat: int) -> float:
+    fn(rows)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(rows)
+    return (time.perf_counter() - start) / repeat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--questions", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    endpoints = [
+        ("GET /users/{id}/score-history", AssessmentScoreHistoryOut, score_history_rows, True),
+        ("GET /apprentice/my-submitted-assessments", AssessmentOut, assessment_rows, False),
+        ("GET /mentor/submitted-drafts", AssessmentDraftOut, draft_rows, False),
+    ]
+    print(f"{args.rows} rows per page, {args.questions} questions")
+    for name, schema, build, trusted in endpoints:
+        rows = build(args.rows, args.questions)
+        print(name)
+        for label, fn in strategies(schema, trusted).items():
+            print(f"  {label:<16} {timed(fn, rows, args.repeat) * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
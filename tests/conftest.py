@@ -3,8 +3,10 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
 from app.main import app
-from app.db import Base, get_db
+from app.db import Base, get_db, get_async_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserSchema
 from app.models.mentor_apprentice import MentorApprentice
@@ -16,10 +18,15 @@ from uuid import uuid4
 
 os.environ["ENV"] = "test"
 
-# Use SQLite in-memory for test DB
-TEST_DATABASE_URL = "sqlite+pysqlite:///:memory:"
-engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+# Use SQLite in-memory for test DB. The shared-cache URI lets the aiosqlite
+# engine see the same database as the sync engine.
+TEST_DATABASE_URL = "sqlite+pysqlite:///file:trooth_test?mode=memory&cache=shared&uri=true"
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///file:trooth_test?mode=memory&cache=shared&uri=true"
+# StaticPool shares the one in-memory database with the threadpool running sync routes
+engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
 # Dependency override
 def override_get_db():
@@ -29,7 +36,12 @@ def override_get_db():
     finally:
         db.close()
 
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_db():
@@ -122,11 +134,9 @@ def mentor_apprentice_link(db_session, mentor_user, apprentice_user):
     db_session.commit()
     return link
 
-from app.db import SessionLocal
-
 @pytest.fixture
 def db_session():
-    db = SessionLocal()
+    db = TestingSessionLocal()
     try:
         yield db
     finally:
@@ -151,3 +161,19 @@ def mock_mentor(monkeypatch):
 
     monkeypatch.setattr("app.services.auth.get_current_user", mock_get_current_user)
     return mentor_id
+
+@pytest.fixture
+def auth_headers(monkeypatch):
+    """Authenticate requests as a real DB user by stubbing Firebase token verification."""
+    from app.services import auth as auth_service
+
+    claims_by_token = {}
+    monkeypatch.setattr(auth_service, "verify_id_token", lambda token: dict(claims_by_token[token]))
+
+    def _headers_for(user):
+        token = f"token-{user.id}"
+        claims_by_token[token] = {"uid": user.id, "email": user.email}
+        auth_service.invalidate_user(user.id)
+        return {"Authorization": f"Bearer {token}"}
+
+    return _headers_for
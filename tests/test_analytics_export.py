@@ -0,0 +1,105 @@
+import io
+from uuid import uuid4
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from app.models import AssessmentScoreHistory, AssessmentTemplate, Category, Question, User
+from app.models.assessment import Assessment
+from app.services import analytics_export
+
+
+@pytest.fixture
+def scored_history(db_session):
+    apprentice = User(id=str(uuid4()), name="Apprentice", email=f"a+{uuid4().hex[:8]}@example.com", role="apprentice")
+    template = AssessmentTemplate(id=str(uuid4()), name="Foundations")
+    category = Category(id=str(uuid4()), name=f"Prayer {uuid4().hex[:6]}")
+    question = Question(id=str(uuid4()), text="How often do you pray?", category_id=category.id)
+    db_session.add_all([apprentice, template, category, question])
+    assessments = []
+    for i in range(3):
+        assessment = Assessment(
+            id=str(uuid4()),
+            apprentice_id=apprentice.id,
+            template_id=template.id,
+            answers={question.id: "Daily", "q2": "Weekly"},
+            scores={question.id: 7 + i, "q2": 4},
+        )
+        assessments.append(assessment)
+        db_session.add(assessment)
+        db_session.add(AssessmentScoreHistory(
+            assessment_id=assessment.id,
+            apprentice_id=apprentice.id,
+            score_data={
+                question.id: {"score": 7 + i, "feedback": "ok", "recommendation": "keep going"},
+                "q2": {"score": 4, "feedback": "ok", "recommendation": "read more"},
+            },
+            model_used="gpt-4",
+            triggered_by="system",
+        ))
+    db_session.commit()
+    return template, question, category
+
+
+def _read_parquet(chunks):
+    return pq.read_table(io.BytesIO(b"".join(chunks)))
+
+
+def test_history_is_flattened_per_question(db_session, scored_history):
+    template, question, category = scored_history
+    table = _read_parquet(analytics_export.stream_export(db_session, template_id=template.id))
+
+    assert table.num_rows == 6
+    assert table.schema.field("score").type == pa.int16()
+    assert table.schema.field("scored_at").type == pa.timestamp("us")
+    rows = table.to_pylist()
+    prayer = [r for r in rows if r["question_id"] == question.id]
+    assert sorted(r["score"] for r in prayer) == [7, 8, 9]
+    assert {r["category"] for r in prayer} == {category.name}
+    assert {r["question_text"] for r in prayer} == {"How often do you pray?"}
+    assert {r["model_used"] for r in rows} == {"gpt-4"}
+    assert {r["template_id"] for r in rows} == {template.id}
+
+
+def test_one_row_group_per_db_batch(db_session, scored_history):
+    template, _, _ = scored_history
+    chunks = list(analytics_export.stream_export(db_session, template_id=template.id, batch_size=1))
+    assert len(chunks) > 1
+    parquet_file = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+    assert parquet_file.num_row_groups == 3
+
+
+def test_arrow_stream_of_current_scores(db_session, scored_history):
+    template, _, _ = scored_history
+    data = b"".join(analytics_export.stream_export(
+        db_session, format="arrow", source="assessments", template_id=template.id
+    ))
+    table = pa.ipc.open_stream(data).read_all()
+    assert table.num_rows == 6
+    assert set(table.column("source").to_pylist()) == {"assessments"}
+    assert set(table.column("model_used").to_pylist()) == {None}
+
+
+def test_cli_writes_parquet_file(db_session, scored_history, tmp_path, monkeypatch):
+    template, _, _ = scored_history
+    monkeypatch.setattr("app.db.SessionLocal", lambda: db_session)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+    out = tmp_path / "scores.parquet"
+
+    rows = analytics_export.main(["--out", str(out), "--template-id", template.id])
+    assert rows == 6
+    assert pq.read_table(out).num_rows == 6
+
+
+def test_admin_endpoint_streams_parquet(client, auth_headers, db_session, scored_history):
+    template, _, _ = scored_history
+    admin = User(id=str(uuid4()), name="Admin", email=f"admin+{uuid4().hex[:8]}@example.com", role="admin")
+    db_session.add(admin)
+    db_session.commit()
+
+    response = client.get(f"/admin/analytics/scores?template_id={template.id}", headers=auth_headers(admin))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert pq.read_table(io.BytesIO(response.content)).num_rows == 6
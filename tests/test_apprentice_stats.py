@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.models import ApprenticeStats, Category, MentorApprentice, Question, User
+from app.models.assessment import Assessment
+from app.services import apprentice_stats
+
+
+@pytest.fixture
+def scored_apprentice(db_session, mentor_user):
+    apprentice = User(id=str(uuid4()), name="Apprentice", email=f"a+{uuid4().hex[:8]}@example.com", role="apprentice")
+    prayer = Category(id=str(uuid4()), name=f"Prayer {uuid4().hex[:6]}")
+    scripture = Category(id=str(uuid4()), name=f"Scripture {uuid4().hex[:6]}")
+    q1 = Question(id=str(uuid4()), text="How do you pray?", category_id=prayer.id)
+    q2 = Question(id=str(uuid4()), text="How do you read?", category_id=scripture.id)
+    db_session.add_all([
+        apprentice, prayer, scripture, q1, q2,
+        MentorApprentice(apprentice_id=apprentice.id, mentor_id=mentor_user.id),
+    ])
+    base = datetime(2025, 3, 1)
+    assessments = [
+        Assessment(id=str(uuid4()), apprentice_id=apprentice.id, answers={q1.id: "a"}, created_at=base),
+        Assessment(id=str(uuid4()), apprentice_id=apprentice.id, answers={q1.id: "b"}, created_at=base + timedelta(days=1)),
+    ]
+    db_session.add_all(assessments)
+    db_session.flush()
+    for assessment in assessments:
+        apprentice_stats.record_submission(db_session, assessment)
+    apprentice_stats.record_scores(db_session, [
+        (assessments[0], None, {q1.id: 4, q2.id: 8}),
+        (assessments[1], None, {q1.id: 8}),
+    ])
+    assessments[0].scores = {q1.id: 4, q2.id: 8}
+    assessments[1].scores = {q1.id: 8}
+    db_session.commit()
+    return apprentice, assessments, (prayer.name, scripture.name), (q1.id, q2.id)
+
+
+def test_incremental_stats_track_submissions_and_latest_categories(db_session, scored_apprentice):
+    apprentice, assessments, (prayer, scripture), _ = scored_apprentice
+    stats = db_session.get(ApprenticeStats, apprentice.id)
+
+    assert stats.submission_count == 2
+    assert stats.last_submission_at == assessments[1].created_at
+    # overall scores 6 and 8
+    assert stats.average_score == 7.0
+    # Prayer comes from the newer assessment; Scripture only appears in the older one
+    assert stats.category_scores[prayer]["score"] == 8
+    assert stats.category_scores[prayer]["assessment_id"] == assessments[1].id
+    assert stats.category_scores[scripture]["score"] == 8
+
+
+def test_rescore_replaces_old_score_without_recounting(db_session, scored_apprentice):
+    apprentice, assessments, (prayer, _), (q1, q2) = scored_apprentice
+
+    # Rescoring the older assessment must not override the newer one's category score
+    apprentice_stats.record_scores(db_session, [(assessments[0], assessments[0].scores, {q1: 2, q2: 2})])
+    db_session.commit()
+
+    stats = db_session.get(ApprenticeStats, apprentice.id)
+    assert stats.scored_count == 2
+    assert stats.average_score == 5.0
+    assert stats.category_scores[prayer]["score"] == 8
+
+
+def test_rebuild_reconciles_drifted_stats(db_session, scored_apprentice):
+    apprentice, _, _, _ = scored_apprentice
+    expected = db_session.get(ApprenticeStats, apprentice.id)
+    expected = (expected.submission_count, expected.scored_count, expected.score_sum, expected.category_scores)
+
+    stats = db_session.get(ApprenticeStats, apprentice.id)
+    stats.submission_count, stats.score_sum, stats.category_scores = 99, 0.0, {}
+    db_session.commit()
+
+    assert apprentice_stats.rebuild_stats(db_session, apprentice.id) == 1
+    db_session.expire_all()
+    stats = db_session.get(ApprenticeStats, apprentice.id)
+    assert (stats.submission_count, stats.scored_count, stats.score_sum, stats.category_scores) == expected
+
+
+def test_profile_is_one_query(client, db_session, mentor_user, scored_apprentice, auth_headers):
+    apprentice, assessments, (prayer, scripture), _ = scored_apprentice
+    headers = auth_headers(mentor_user)
+    # Warm the user and mentor-link caches so only the profile lookup remains
+    assert client.get(f"/mentor/my-apprentices/{apprentice.id}", headers=headers).status_code == 200
+
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get(f"/mentor/my-apprentices/{apprentice.id}", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_assessments"] == 2
+    assert body["average_score"] == 7.0
+    assert body["last_submission"].startswith("2025-03-02")
+    assert body["category_scores"] == {prayer: 8, scripture: 8}
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+
+
+def test_profile_without_stats_row(client, db_session, mentor_user, apprentice_user, mentor_apprentice_link, auth_headers):
+    response = client.get(f"/mentor/my-apprentices/{apprentice_user.id}", headers=auth_headers(mentor_user))
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["total_assessments"], body["average_score"], body["category_scores"]) == (0, None, {})
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.models import Assessment, AssessmentScoreHistory, MentorApprentice, User
+from app.services import mentorship
+
+
+@pytest.fixture
+def scored_apprentice(db_session):
+    mentor = User(id=str(uuid4()), name="Mentor", email=f"m+{uuid4().hex[:8]}@example.com", role="mentor")
+    apprentice = User(id=str(uuid4()), name="Apprentice", email=f"a+{uuid4().hex[:8]}@example.com", role="apprentice")
+    now = datetime.utcnow()
+    assessments = [
+        Assessment(
+            id=str(uuid4()),
+            apprentice_id=apprentice.id,
+            answers={"q1": f"answer {i}"},
+            scores={"q1": 5 + i},
+            created_at=now - timedelta(days=i),
+        )
+        for i in range(2)
+    ]
+    history = AssessmentScoreHistory(
+        assessment_id=assessments[0].id,
+        apprentice_id=apprentice.id,
+        score_data={"q1": {"score": 5, "feedback": "ok", "recommendation": "pray"}},
+        triggered_by="system",
+        scored_at=now,
+    )
+    db_session.add_all([mentor, apprentice, *assessments, history])
+    db_session.add(MentorApprentice(mentor_id=mentor.id, apprentice_id=apprentice.id))
+    db_session.commit()
+    mentorship.invalidate_mentor(mentor.id)
+    return mentor, apprentice, assessments
+
+
+def test_my_submitted_assessments_async(client, auth_headers, scored_apprentice):
+    _, apprentice, assessments = scored_apprentice
+
+    response = client.get("/apprentice/my-submitted-assessments", headers=auth_headers(apprentice))
+    assert response.status_code == 200
+    data = response.json()
+    assert [a["id"] for a in data] == [a.id for a in assessments]
+    assert data[0]["latest_score"]["triggered_by"] == "system"
+
+
+def test_mentor_async_reads(client, auth_headers, scored_apprentice):
+    mentor, apprentice, assessments = scored_apprentice
+    headers = auth_headers(mentor)
+
+    apprentices = client.get("/my-apprentices", headers=headers).json()
+    assert [a["id"] for a in apprentices] == [apprentice.id]
+
+    response = client.get(
+        f"/apprentice/{apprentice.id}/submitted-assessments",
+        params={"limit": 1},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert [a["id"] for a in response.json()] == [assessments[0].id]
+
+
+def test_score_history_async(client, auth_headers, scored_apprentice):
+    mentor, apprentice, assessments = scored_apprentice
+    headers = auth_headers(mentor)
+
+    by_assessment = client.get(f"/assessments/{assessments[0].id}/history", headers=headers)
+    assert by_assessment.status_code == 200
+    assert by_assessment.json()[0]["score_data"]["q1"]["score"] == 5
+
+    by_apprentice = client.get(f"/users/{apprentice.id}/score-history", headers=headers)
+    assert by_apprentice.status_code == 200
+    assert len(by_apprentice.json()) == 1
+
+    missing = client.get(f"/assessments/{assessments[1].id}/history", headers=headers)
+    assert missing.status_code == 404
+
+
+def test_async_routes_never_open_a_sync_session(client, auth_headers, scored_apprentice):
+    from app.db import get_db
+    from app.main import app
+
+    mentor, apprentice, assessments = scored_apprentice
+
+    def no_sync_session():
+        raise AssertionError("async route opened a sync session")
+        yield
+
+    original = app.dependency_overrides[get_db]
+    app.dependency_overrides[get_db] = no_sync_session
+    try:
+        mentor_headers = auth_headers(mentor)
+        assert client.get("/my-apprentices", headers=mentor_headers).status_code == 200
+        assert client.get(f"/apprentice/{apprentice.id}/submitted-assessments", headers=mentor_headers).status_code == 200
+        assert client.get(f"/users/{apprentice.id}/score-history", headers=mentor_headers).status_code == 200
+        assert client.get(f"/assessments/{assessments[0].id}/history", headers=mentor_headers).status_code == 200
+        assert client.get("/apprentice/my-submitted-assessments", headers=auth_headers(apprentice)).status_code == 200
+        assert client.get("/apprentice/my-submitted-assessments", headers=mentor_headers).status_code == 403
+    finally:
+        app.dependency_overrides[get_db] = original
@@ -0,0 +1,159 @@
+import gzip
+import inspect
+import zlib
+from uuid import uuid4
+
+import anyio
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+from starlette.middleware.gzip import IdentityResponder
+
+from app.models import AssessmentDraft, AssessmentTemplate
+from app.services.compression import CompressionMiddleware, compression, negotiate
+from app.services.mentorship import invalidate_mentor
+
+BIG = {"items": [{"id": i, "feedback": "Keep going, pray daily."} for i in range(200)]}
+
+
+@pytest.fixture
+def app_client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500, encodings=["gzip"])
+
+    @app.get("/big")
+    def big():
+        return BIG
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/hot")
+    @compression("off")
+    def hot():
+        return BIG
+
+    @app.get("/tiny-threshold")
+    @compression("fast", minimum_size=1)
+    def tiny_threshold():
+        return {"ok": True}
+
+    @app.get("/pre-encoded")
+    def pre_encoded():
+        return Response(gzip.compress(b"x" * 2000), media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+    return TestClient(app)
+
+
+def test_negotiate_respects_quality_values():
+    assert negotiate("gzip, br", ["zstd", "br", "gzip"]) == "br"
+    assert negotiate("br;q=0, gzip;q=0.5", ["br", "gzip"]) == "gzip"
+    assert negotiate("*", ["zstd", "gzip"]) == "zstd"
+    assert negotiate("identity", ["gzip"]) is None
+    assert negotiate("", ["gzip"]) is None
+
+
+def test_large_bodies_are_compressed_small_ones_are_not(app_client):
+    big = app_client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert big.headers["content-encoding"] == "gzip"
+    assert big.headers["vary"] == "Accept-Encoding"
+    assert int(big.headers["content-length"]) < len(big.content)
+    assert big.json() == BIG
+
+    assert "content-encoding" not in app_client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "content-encoding" not in app_client.get("/big", headers={"Accept-Encoding": "identity"}).headers
+
+
+def test_route_level_overrides(app_client):
+    assert "content-encoding" not in app_client.get("/hot", headers={"Accept-Encoding": "gzip"}).headers
+    assert app_client.get("/tiny-threshold", headers={"Accept-Encoding": "gzip"}).headers["content-encoding"] == "gzip"
+    with pytest.raises(ValueError):
+        compression("maximum")
+
+
+def test_encoded_bodies_pass_through(app_client):
+    response = app_client.get("/pre-encoded", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == b"x" * 2000
+
+
+def test_streams_are_compressed_chunk_by_chunk():
+    produced, sent = [], []
+
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/x-ndjson")]})
+        for i in range(3):
+            produced.append(i)
+            await send({"type": "http.response.body", "body": b'{"n": %d}\n' % i * 200, "more_body": i < 2})
+
+    async def send(message):
+        # Every chunk reaches the client before the next one is produced
+        sent.append((len(produced), message))
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    anyio.run(CompressionMiddleware(streaming_app, minimum_size=10, encodings=["gzip"]), scope, None, send)
+
+    start, bodies = sent[0][1], sent[1:]
+    assert (b"content-encoding", b"gzip") in start["headers"]
+    assert not any(name == b"content-length" for name, _ in start["headers"])
+    assert [produced_before for produced_before, _ in bodies] == [1, 2, 3]
+    decoded = zlib.decompress(b"".join(m["body"] for _, m in bodies), 16 + zlib.MAX_WBITS)
+    assert decoded == b"".join(b'{"n": %d}\n' % i * 200 for i in range(3))
+
+
+def test_export_is_compressed_unless_already_gzipped(client, db_session, mentor_user, apprentice_user, mentor_apprentice_link, auth_headers):
+    template = AssessmentTemplate(id=str(uuid4()), name="Foundations")
+    db_session.add(template)
+    db_session.add_all([
+        AssessmentDraft(apprentice_id=apprentice_user.id, template_id=template.id, is_submitted=True)
+        for _ in range(50)
+    ])
+    db_session.commit()
+    invalidate_mentor(mentor_user.id)
+    headers = {**auth_headers(mentor_user), "Accept-Encoding": "gzip"}
+
+    with client.stream("GET", "/mentor/submitted-drafts/export?format=ndjson", headers=headers) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert len(response.read().splitlines()) == 50
+
+    with client.stream("GET", "/mentor/submitted-drafts/export?format=ndjson&gzip=true", headers=headers) as response:
+        assert "content-encoding" not in response.headers
+        assert len(gzip.decompress(response.read()).splitlines()) == 50
+
+
+def test_brotli_when_installed(app_client):
+    pytest.importorskip("brotli")
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    app.get("/big")(lambda: BIG)
+    response = TestClient(app).get("/big", headers={"Accept-Encoding": "br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.json() == BIG
+
+
+def test_zstd_when_installed():
+    zstandard = pytest.importorskip("zstandard")
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    app.get("/big")(lambda: BIG)
+    with TestClient(app).stream("GET", "/big", headers={"Accept-Encoding": "zstd, br, gzip"}) as response:
+        assert response.headers["content-encoding"] == "zstd"
+        raw = b"".join(response.iter_raw())
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(raw) == TestClient(app).get(
+        "/big", headers={"Accept-Encoding": "identity"}
+    ).content
+
+
+def test_starlette_responder_internals_are_still_there():
+    # _Responder overrides private hooks of Starlette's GZip responder; fail loudly if they move
+    params = inspect.signature(IdentityResponder.__init__).parameters
+    assert {"app", "minimum_size", "exclude_content_types"} <= set(params)
+    for hook in ("send_with_compression", "apply_compression"):
+        assert inspect.iscoroutinefunction(getattr(IdentityResponder, hook))
+    assert list(inspect.signature(IdentityResponder.apply_compression).parameters) == ["self", "body", "more_body"]
+    responder = IdentityResponder(None, 500, exclude_content_types=())
+    for attribute in ("send", "content_encoding_set", "minimum_size"):
+        assert hasattr(responder, attribute)
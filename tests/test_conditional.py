@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.models import AssessmentScoreHistory, AssessmentTemplate, Category, Question, User
+from app.models.assessment import Assessment
+
+
+@pytest.fixture
+def apprentice_with_history(db_session):
+    apprentice = User(id=str(uuid4()), name="Apprentice", email=f"a+{uuid4().hex[:8]}@example.com", role="apprentice")
+    assessment = Assessment(id=str(uuid4()), apprentice_id=apprentice.id, answers={"q1": "a"}, scores={"q1": 7})
+    history = AssessmentScoreHistory(
+        assessment_id=assessment.id, apprentice_id=apprentice.id, score_data={"q1": {"score": 7}},
+        triggered_by="system", scored_at=datetime(2025, 1, 1),
+    )
+    db_session.add_all([apprentice, assessment, history])
+    db_session.commit()
+    return apprentice, assessment
+
+
+@pytest.fixture
+def admin_headers(db_session, auth_headers):
+    admin = User(id=str(uuid4()), name="Admin", email=f"admin+{uuid4().hex[:8]}@example.com", role="admin")
+    db_session.add(admin)
+    db_session.commit()
+    return auth_headers(admin)
+
+
+def test_submitted_assessments_revalidate(client, db_session, apprentice_with_history, auth_headers):
+    apprentice, _ = apprentice_with_history
+    headers = auth_headers(apprentice)
+
+    first = client.get("/apprentice/my-submitted-assessments", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert "last-modified" in first.headers
+
+    cached = client.get("/apprentice/my-submitted-assessments", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    since = client.get(
+        "/apprentice/my-submitted-assessments",
+        headers={**headers, "If-Modified-Since": first.headers["last-modified"]},
+    )
+    assert since.status_code == 304
+
+    # Each page validates separately
+    paged = client.get("/apprentice/my-submitted-assessments?limit=1", headers={**headers, "If-None-Match": etag})
+    assert paged.status_code == 200
+
+    db_session.add(Assessment(id=str(uuid4()), apprentice_id=apprentice.id, answers={"q1": "b"}))
+    db_session.commit()
+    changed = client.get("/apprentice/my-submitted-assessments", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()) == 2
+
+
+def test_rescoring_changes_assessment_version(client, db_session, apprentice_with_history, auth_headers):
+    apprentice, assessment = apprentice_with_history
+    headers = auth_headers(apprentice)
+    etag = client.get("/apprentice/my-submitted-assessments", headers=headers).headers["etag"]
+
+    assessment.scores = {"q1": 9}
+    db_session.commit()
+
+    response = client.get("/apprentice/my-submitted-assessments", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_score_history_revalidates(client, db_session, apprentice_with_history, mentor_user, auth_headers):
+    apprentice, assessment = apprentice_with_history
+    headers = auth_headers(mentor_user)
+    url = f"/users/{apprentice.id}/score-history"
+
+    etag = client.get(url, headers=headers).headers["etag"]
+    assert client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 304
+    assert client.get(f"/users/{uuid4()}/score-history", headers=headers).status_code == 404
+
+    db_session.add(AssessmentScoreHistory(
+        assessment_id=assessment.id, apprentice_id=apprentice.id, score_data={"q1": {"score": 8}},
+        triggered_by="mentor", scored_at=datetime(2025, 1, 2),
+    ))
+    db_session.commit()
+    assert client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 200
+
+
+def test_not_modified_skips_loading_questions(client, db_session):
+    category = Category(id=str(uuid4()), name=f"Cat {uuid4().hex[:6]}")
+    db_session.add_all([category, Question(id=str(uuid4()), text="Why?", category_id=category.id)])
+    db_session.commit()
+    etag = client.get("/question/questions").headers["etag"]
+
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get("/question/questions", headers={"If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert "count" in statements[0].lower()
+
+    db_session.add(Question(id=str(uuid4()), text="How?", category_id=category.id))
+    db_session.commit()
+    assert client.get("/question/questions", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_template_view_revalidates_after_adding_question(client, db_session, admin_headers):
+    category = Category(id=str(uuid4()), name=f"Cat {uuid4().hex[:6]}")
+    question = Question(id=str(uuid4()), text="Why?", category_id=category.id)
+    template = AssessmentTemplate(id=str(uuid4()), name="Foundations", updated_at=datetime.utcnow() - timedelta(minutes=1))
+    db_session.add_all([category, question, template])
+    db_session.commit()
+    url = f"/admin/templates/{template.id}"
+
+    etag = client.get(url, headers=admin_headers).headers["etag"]
+    assert client.get(url, headers={**admin_headers, "If-None-Match": etag}).status_code == 304
+
+    added = client.post(f"{url}/questions", json={"question_id": question.id, "order": 1}, headers=admin_headers)
+    assert added.status_code == 200
+    response = client.get(url, headers={**admin_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert [q["question_id"] for q in response.json()["questions"]] == [question.id]
@@ -0,0 +1,81 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db import InstrumentedAsyncQueuePool, InstrumentedQueuePool, engine_options, pool_stats
+from app.models.user import User
+
+
+def test_engine_options_from_environment(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "12")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "3")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "600")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+
+    options = engine_options("postgresql+psycopg2://u:p@localhost/db")
+    assert options["pool_size"] == 12
+    assert options["max_overflow"] == 3
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is False
+    assert "connect_args" not in options
+    assert engine_options("sqlite:///:memory:") == {}
+
+
+def test_pgbouncer_mode_disables_prepared_statements(monkeypatch):
+    monkeypatch.setenv("DB_PGBOUNCER", "1")
+    assert engine_options("postgresql+psycopg://u:p@h/db")["connect_args"] == {"prepare_threshold": None}
+    assert engine_options("postgresql+asyncpg://u:p@h/db")["connect_args"]["statement_cache_size"] == 0
+
+
+def test_pool_stats_record_checkouts_and_timeouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    with engine.connect() as conn:
+        conn.execute(text("select 1"))
+        assert pool_stats(engine)["checked_out"] == 1
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    stats = pool_stats(engine)
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["wait_seconds_max"] >= 0.05
+
+
+def test_async_pool_is_instrumented(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedAsyncQueuePool)
+
+    async def query():
+        async with engine.connect() as conn:
+            await conn.execute(text("select 1"))
+        stats = pool_stats(engine)
+        await engine.dispose()
+        return stats
+
+    stats = asyncio.run(query())
+    assert stats["pool_class"] == "InstrumentedAsyncQueuePool"
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 1
+
+
+def test_pool_health_endpoint_is_admin_only(client, db_session, auth_headers):
+    admin = User(id=str(uuid4()), name="Admin", email=f"admin+{uuid4().hex[:8]}@example.com", role="admin")
+    mentor = User(id=str(uuid4()), name="Mentor", email=f"mentor+{uuid4().hex[:8]}@example.com", role="mentor")
+    db_session.add_all([admin, mentor])
+    db_session.commit()
+
+    assert client.get("/health/db-pool").status_code in (401, 403)
+    assert client.get("/health/db-pool", headers=auth_headers(mentor)).status_code == 403
+    response = client.get("/health/db-pool", headers=auth_headers(admin))
+    assert response.status_code == 200
+    assert set(response.json()) == {"sync", "async"}
+    assert "pool_class" in response.json()["async"]
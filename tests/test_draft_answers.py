@@ -0,0 +1,137 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import IntegrityError
+
+from app.models import AssessmentAnswer, AssessmentDraft, AssessmentTemplate, AssessmentTemplateQuestion, Category, Question
+from app.services.draft_answers import answers_for_drafts, answers_for_question
+from app.services.template_bundles import publish_template
+
+URL = "/assessment-drafts/assessment-drafts"
+
+
+@pytest.fixture
+def published_template(db_session):
+    category = Category(id=str(uuid4()), name=f"Prayer {uuid4().hex[:6]}")
+    questions = [Question(id=str(uuid4()), text=f"Question {i}", category_id=category.id) for i in range(3)]
+    template = AssessmentTemplate(id=str(uuid4()), name="Foundations")
+    db_session.add_all([category, template, *questions])
+    for order, question in enumerate(questions):
+        db_session.add(AssessmentTemplateQuestion(template_id=template.id, question_id=question.id, order=order))
+    db_session.commit()
+    publish_template(db_session, template)
+    return template, [q.id for q in questions]
+
+
+def _rows(db_session, draft_id):
+    db_session.expire_all()
+    return {
+        row.question_id: row.answer_text
+        for row in db_session.scalars(select(AssessmentAnswer).where(AssessmentAnswer.assessment_id == draft_id))
+    }
+
+
+def _statements(db_session, fn):
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, statement, parameters, *args: statements.append((statement, parameters))
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return result, statements
+
+
+def test_saves_upsert_answer_rows(client, db_session, published_template, apprentice_user, auth_headers):
+    template, (q1, q2, q3) = published_template
+    headers = auth_headers(apprentice_user)
+
+    first = client.post(URL, headers=headers, json={
+        "template_id": template.id, "answers": {q1: "Daily", q2: "Weekly"}, "last_question_id": q2,
+    })
+    assert first.status_code == 200
+    assert first.json()["answers"] == {q1: "Daily", q2: "Weekly"}
+    draft_id = first.json()["id"]
+
+    second = client.post(URL, headers=headers, json={
+        "template_id": template.id, "answers": {q1: "Twice a day", q3: "Often"}, "last_question_id": q3,
+    })
+    assert second.json()["id"] == draft_id
+    assert second.json()["revision"] == first.json()["revision"] + 1
+    assert _rows(db_session, draft_id) == {q1: "Twice a day", q3: "Often"}
+    # The old JSON column is no longer written
+    assert db_session.get(AssessmentDraft, draft_id).legacy_answers is None
+
+
+def test_patch_upserts_only_the_changed_answer(client, db_session, published_template, apprentice_user, auth_headers):
+    template, (q1, q2, _) = published_template
+    headers = auth_headers(apprentice_user)
+    saved = client.post(URL, headers=headers, json={
+        "template_id": template.id, "answers": {q1: "Daily", q2: "Weekly"}, "last_question_id": q2,
+    }).json()
+
+    response, statements = _statements(db_session, lambda: client.patch(f"{URL}/{saved['id']}", headers=headers, json={
+        "revision": saved["revision"], "patch": [{"op": "replace", "path": f"/answers/{q2}", "value": "Monthly"}],
+    }))
+    assert response.status_code == 200
+    writes = [(s, p) for s, p in statements if s.startswith(("INSERT INTO assessment_answers", "DELETE FROM assessment_answers"))]
+    assert len(writes) == 1
+    statement, parameters = writes[0]
+    assert "ON CONFLICT" in statement and "Monthly" in parameters
+    assert _rows(db_session, saved["id"]) == {q1: "Daily", q2: "Monthly"}
+
+
+def test_draft_answers_are_unique_per_question(db_session, apprentice_user, published_template):
+    template, (q1, _, _) = published_template
+    draft = AssessmentDraft(apprentice_id=apprentice_user.id, template_id=template.id, answers={q1: "Daily"})
+    db_session.add(draft)
+    db_session.commit()
+
+    db_session.add(AssessmentAnswer(assessment_id=draft.id, question_id=q1, answer_text="Again"))
+    with pytest.raises(IntegrityError):
+        db_session.commit()
+    db_session.rollback()
+
+
+def test_per_question_reads_use_the_index(db_session, apprentice_user, mentor_user, published_template):
+    template, (q1, q2, _) = published_template
+    drafts = [
+        AssessmentDraft(apprentice_id=apprentice_user.id, template_id=template.id, answers={q1: "Daily", q2: "Weekly"}),
+        AssessmentDraft(apprentice_id=mentor_user.id, template_id=template.id, answers={q1: "Never"}),
+    ]
+    db_session.add_all(drafts)
+    db_session.commit()
+
+    assert sorted(row.answer_text for row in answers_for_question(db_session, q1)) == ["Daily", "Never"]
+    assert answers_for_drafts(db_session, [drafts[1].id]) == {drafts[1].id: {q1: "Never"}}
+
+    plan = db_session.execute(text(
+        "EXPLAIN QUERY PLAN SELECT answer_text FROM assessment_answers WHERE question_id = :q"
+    ), {"q": q1}).all()
+    assert any("ix_assessment_answers_question" in row[-1] for row in plan)
+
+
+def test_answers_to_unknown_questions_are_rejected(client, db_session, published_template, apprentice_user, auth_headers):
+    template, (q1, q2, _) = published_template
+    headers = auth_headers(apprentice_user)
+    unknown = str(uuid4())
+
+    rejected = client.post(URL, headers=headers, json={
+        "template_id": template.id, "answers": {q1: "Daily", unknown: "?"}, "last_question_id": q1,
+    })
+    assert rejected.status_code == 422
+    assert rejected.json()["detail"]["question_ids"] == [unknown]
+
+    saved = client.post(URL, headers=headers, json={
+        "template_id": template.id, "answers": {q1: "Daily"}, "last_question_id": q1,
+    }).json()
+    assert client.patch(URL, headers=headers, json={"answers": {unknown: "?"}}).status_code == 422
+    patched = client.patch(f"{URL}/{saved['id']}", headers=headers, json={
+        "revision": saved["revision"],
+        "patch": [{"op": "add", "path": f"/answers/{q2}", "value": "Weekly"},
+                  {"op": "add", "path": f"/answers/{unknown}", "value": "?"}],
+    })
+    assert patched.status_code == 422
+    assert _rows(db_session, saved["id"]) == {q1: "Daily"}
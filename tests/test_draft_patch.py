@@ -0,0 +1,123 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.exceptions import ValidationException
+from app.models import AssessmentDraft, AssessmentTemplate
+from app.schemas.assessment_draft import DraftPatchOp
+from app.services.draft_patch import apply_patch
+
+
+@pytest.fixture
+def open_draft(db_session, apprentice_user):
+    template = AssessmentTemplate(id=str(uuid4()), name="Foundations")
+    draft = AssessmentDraft(
+        id=str(uuid4()), apprentice_id=apprentice_user.id, template_id=template.id,
+        answers={"q1": "I pray daily", "q2": "Sometimes"},
+    )
+    db_session.add_all([template, draft])
+    db_session.commit()
+    return draft
+
+
+def _url(draft):
+    return f"/assessment-drafts/assessment-drafts/{draft.id}"
+
+
+def test_apply_patch_ops():
+    ops = [
+        DraftPatchOp(op="replace", path="/answers/q1", value="Twice a day"),
+        DraftPatchOp(op="remove", path="/answers/q2"),
+        DraftPatchOp(op="add", path="/answers/a~1b", value="new"),
+        DraftPatchOp(op="replace", path="/last_question_id", value="a/b"),
+    ]
+    original = {"q1": "Daily", "q2": "Weekly"}
+    answers, last = apply_patch(original, "q2", ops)
+    assert answers == {"q1": "Twice a day", "a/b": "new"}
+    assert last == "a/b"
+    assert original == {"q1": "Daily", "q2": "Weekly"}
+
+
+@pytest.mark.parametrize("op", [
+    DraftPatchOp(op="replace", path="/answers/missing", value="x"),
+    DraftPatchOp(op="remove", path="/answers/missing"),
+    DraftPatchOp(op="add", path="/answers/q1"),
+    DraftPatchOp(op="add", path="/score", value="10"),
+    DraftPatchOp(op="add", path="/answers/", value="x"),
+])
+def test_apply_patch_rejects_invalid_ops(op):
+    with pytest.raises(ValidationException):
+        apply_patch({"q1": "a"}, None, [op])
+
+
+def test_patch_sends_only_the_delta(client, db_session, open_draft, apprentice_user, auth_headers):
+    headers = auth_headers(apprentice_user)
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, statement, parameters, *args: statements.append((statement, parameters))
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.patch(_url(open_draft), headers=headers, json={
+            "revision": open_draft.revision,
+            "patch": [{"op": "replace", "path": "/answers/q2", "value": "Every week"}],
+        })
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["revision"] == open_draft.revision + 1
+    assert body["answered_count"] == 2
+    assert "answers" not in body
+    # The UPDATE is guarded by the revision the client edited
+    update_sql = [s for s, _ in statements if s.startswith("UPDATE assessment_drafts")]
+    assert len(update_sql) == 1 and "revision = ?" in update_sql[0].split("WHERE")[1]
+
+    db_session.expire_all()
+    assert db_session.get(AssessmentDraft, open_draft.id).answers == {"q1": "I pray daily", "q2": "Every week"}
+
+
+def test_stale_revision_conflicts(client, db_session, open_draft, apprentice_user, auth_headers):
+    headers = auth_headers(apprentice_user)
+    revision = open_draft.revision
+    first = client.patch(_url(open_draft), headers=headers, json={
+        "revision": revision, "patch": [{"op": "add", "path": "/answers/q3", "value": "From phone"}],
+    })
+    assert first.status_code == 200
+
+    second = client.patch(_url(open_draft), headers=headers, json={
+        "revision": revision, "patch": [{"op": "add", "path": "/answers/q3", "value": "From laptop"}],
+    })
+    assert second.status_code == 409
+    assert second.json()["detail"]["revision"] == revision + 1
+
+    full = client.patch("/assessment-drafts/assessment-drafts", headers=headers, json={
+        "answers": {"q1": "x"}, "last_question_id": None, "revision": revision,
+    })
+    assert full.status_code == 409
+
+    db_session.expire_all()
+    assert db_session.get(AssessmentDraft, open_draft.id).answers["q3"] == "From phone"
+
+
+def test_concurrent_write_is_detected_at_commit(db_session, open_draft):
+    other = sessionmaker(bind=db_session.get_bind())()
+    try:
+        mine = db_session.get(AssessmentDraft, open_draft.id)
+        theirs = other.get(AssessmentDraft, open_draft.id)
+        theirs.answers = {"q1": "From laptop"}
+        other.commit()
+
+        mine.answers = {"q1": "From phone"}
+        with pytest.raises(StaleDataError):
+            db_session.commit()
+    finally:
+        other.close()
+
+
+def test_patch_requires_own_open_draft(client, db_session, open_draft, mentor_user, auth_headers):
+    response = client.patch(_url(open_draft), headers=auth_headers(mentor_user), json={"revision": 1, "patch": []})
+    assert response.status_code == 403
@@ -1,19 +1,8 @@
-import pytest
-from unittest.mock import patch
 from app.services import email
 
 
-@pytest.fixture
-def mock_sendgrid_client():
-    with patch("app.services.email.SendGridAPIClient") as mock_client:
-        instance = mock_client.return_value
-        instance.send.return_value.status_code = 202
-        yield instance
-
-
-def test_send_assessment_email_success(mock_sendgrid_client):
-    status = email.send_assessment_email(
-        to_email="mentor@example.com",
+def test_render_assessment_email():
+    subject, html_content = email.render_assessment_email(
         apprentice_name="John Doe",
         assessment_title="Spiritual Growth",
         score=85,
@@ -31,14 +20,13 @@ def test_send_assessment_email_success(mock_sendgrid_client):
             }
         }
     )
-    assert status == 202
-    mock_sendgrid_client.send.assert_called_once()
+    assert subject == "Assessment Results for John Doe: Spiritual Growth"
+    assert "<h4>Faith</h4>" in html_content
+    assert "Challenge them to take on a leadership role." in html_content
 
 
-def test_send_invitation_email_success(mock_sendgrid_client):
-    email.send_invitation_email(
-        to_email="apprentice@example.com",
-        apprentice_name="Jane Smith",
-        token="mocktoken123"
-    )
-    mock_sendgrid_client.send.assert_called_once()
+def test_render_invitation_email():
+    subject, body = email.render_invitation_email(apprentice_name="Jane Smith", token="mocktoken123")
+    assert "invited" in subject
+    assert "Hello Jane Smith" in body
+    assert "https://trooth-app.com/accept-invite/mocktoken123" in body
@@ -0,0 +1,148 @@
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import EmailOutbox, User
+from app.services import email as email_service
+from app.services.email_outbox import EmailDispatcher
+
+
+@pytest.fixture
+def sendgrid_sink():
+    """Local stand-in for SendGrid's /v3/mail/send.
+
+    Pops one status per request from ``state["statuses"]`` (202 once empty).
+    """
+    state = {"statuses": [], "requests": [], "connections": set()}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            state["requests"].append({
+                "path": self.path,
+                "auth": self.headers.get("Authorization"),
+                "json": json.loads(body),
+            })
+            state["connections"].add(self.client_address)
+            status = state["statuses"].pop(0) if state["statuses"] else 202
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", state
+    server.shutdown()
+
+
+@pytest.fixture
+def dispatcher(db_session, sendgrid_sink):
+    db_session.query(EmailOutbox).delete()
+    db_session.commit()
+    base_url, _ = sendgrid_sink
+    dispatcher = EmailDispatcher(
+        session_factory=sessionmaker(bind=db_session.get_bind(), autoflush=False),
+        api_key="SG.test",
+        base_url=base_url,
+        batch_size=10,
+    )
+    yield dispatcher
+    dispatcher.http.close()
+
+
+def _queue_invites(db_session, count):
+    for i in range(count):
+        email_service.queue_invitation_email(db_session, f"a{i}@example.com", f"Apprentice {i}", token=uuid4().hex)
+    db_session.commit()
+
+
+def test_invite_writes_outbox_row_in_the_same_transaction(client, db_session, sendgrid_sink):
+    _, state = sendgrid_sink
+    mentor = User(id=str(uuid4()), name="Mentor", email=f"m+{uuid4().hex[:8]}@example.com", role="mentor")
+    db_session.add(mentor)
+    db_session.commit()
+
+    response = client.post("/invitations/invite-apprentice", json={
+        "mentor_id": mentor.id,
+        "apprentice_email": "new@example.com",
+        "apprentice_name": "New Apprentice",
+    })
+    assert response.status_code == 200
+    queued = db_session.query(EmailOutbox).filter_by(to_email="new@example.com").one()
+    assert queued.kind == "invitation"
+    assert queued.status == "pending"
+    assert queued.dedupe_key.startswith("invitation:")
+    assert state["requests"] == []
+
+
+def test_dispatcher_sends_a_batch_over_one_connection(dispatcher, db_session, sendgrid_sink):
+    _, state = sendgrid_sink
+    _queue_invites(db_session, 3)
+
+    assert dispatcher.dispatch_once() == 3
+    assert dispatcher.dispatch_once() == 0
+
+    assert len(state["requests"]) == 3
+    assert len(state["connections"]) == 1
+    first = state["requests"][0]
+    assert first["path"] == "/v3/mail/send"
+    assert first["auth"] == "Bearer SG.test"
+    assert first["json"]["content"][0]["type"] == "text/plain"
+    db_session.expire_all()
+    assert {m.status for m in db_session.query(EmailOutbox).all()} == {"sent"}
+
+
+def test_dedupe_key_queues_once(db_session):
+    token = uuid4().hex
+    first = email_service.queue_invitation_email(db_session, "a@example.com", "A", token=token)
+    db_session.commit()
+    second = email_service.queue_invitation_email(db_session, "a@example.com", "A", token=token)
+    db_session.commit()
+    assert first.id == second.id
+    assert db_session.query(EmailOutbox).filter_by(dedupe_key=f"invitation:{token}").count() == 1
+
+
+def test_transient_failures_retry_with_backoff(dispatcher, db_session, sendgrid_sink):
+    _, state = sendgrid_sink
+    state["statuses"] = [503]
+    _queue_invites(db_session, 1)
+
+    assert dispatcher.dispatch_once() == 1
+    db_session.expire_all()
+    message = db_session.query(EmailOutbox).one()
+    assert message.status == "pending"
+    assert message.attempts == 1
+    assert message.last_error == "SendGrid returned 503"
+    assert message.next_attempt_at > datetime.utcnow()
+    assert dispatcher.dispatch_once() == 0
+
+    message.next_attempt_at = datetime.utcnow()
+    db_session.commit()
+    assert dispatcher.dispatch_once() == 1
+    db_session.expire_all()
+    assert message.status == "sent"
+
+
+def test_rejected_and_exhausted_messages_are_dead_lettered(dispatcher, db_session, sendgrid_sink):
+    _, state = sendgrid_sink
+    state["statuses"] = [400, 500]
+    _queue_invites(db_session, 2)
+    db_session.query(EmailOutbox).update({"max_attempts": 1})
+    db_session.commit()
+
+    assert dispatcher.dispatch_once() == 2
+    db_session.expire_all()
+    messages = db_session.query(EmailOutbox).all()
+    assert {m.status for m in messages} == {"dead"}
+    assert {m.last_error.split(":")[0] for m in messages} == {"SendGrid returned 400", "SendGrid returned 500"}
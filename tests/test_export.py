@@ -0,0 +1,103 @@
+import csv
+import gzip
+import io
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.models import AssessmentAnswer, AssessmentDraft, AssessmentTemplate, MentorApprentice, User
+from app.services import export
+from app.services.mentorship import invalidate_mentor
+
+ROWS = 1200
+
+
+@pytest.fixture
+def mentor_with_submissions(db_session):
+    mentor = User(id=str(uuid4()), name="Mentor", email=f"m+{uuid4().hex[:8]}@example.com", role="mentor")
+    apprentice = User(id=str(uuid4()), name="Apprentice", email=f"a+{uuid4().hex[:8]}@example.com", role="apprentice")
+    template = AssessmentTemplate(id=str(uuid4()), name="Foundations")
+    db_session.add_all([mentor, apprentice, template])
+    db_session.add(MentorApprentice(mentor_id=mentor.id, apprentice_id=apprentice.id))
+    drafts = [
+        AssessmentDraft(id=str(uuid4()), apprentice_id=apprentice.id, template_id=template.id, is_submitted=True)
+        for _ in range(ROWS)
+    ]
+    db_session.bulk_save_objects(drafts)
+    db_session.bulk_save_objects([
+        AssessmentAnswer(id=str(uuid4()), assessment_id=draft.id, question_id="q1", answer_text=f"answer {i}")
+        for i, draft in enumerate(drafts)
+    ])
+    db_session.commit()
+    invalidate_mentor(mentor.id)
+    return mentor, apprentice
+
+
+def test_csv_export_streams_every_row(client, auth_headers, mentor_with_submissions):
+    mentor, apprentice = mentor_with_submissions
+    with client.stream("GET", "/mentor/submitted-drafts/export", headers=auth_headers(mentor)) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "submitted_drafts.csv" in response.headers["content-disposition"]
+        body = response.read()
+
+    rows = list(csv.reader(io.StringIO(body.decode())))
+    assert rows[0][0] == "id"
+    assert len(rows) == ROWS + 1
+    assert rows[1][1] == apprentice.id
+    assert json.loads(rows[1][6])["q1"].startswith("answer")
+
+
+def test_ndjson_and_json_exports(client, auth_headers, mentor_with_submissions):
+    mentor, apprentice = mentor_with_submissions
+    headers = auth_headers(mentor)
+
+    ndjson = client.get("/mentor/submitted-drafts/export?format=ndjson", headers=headers)
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    lines = ndjson.text.splitlines()
+    assert len(lines) == ROWS
+    assert json.loads(lines[0])["apprentice_email"] == apprentice.email
+
+    as_json = client.get(f"/mentor/submitted-drafts/export?format=json&apprentice_id={apprentice.id}", headers=headers)
+    assert len(as_json.json()) == ROWS
+
+
+def test_gzip_export(client, auth_headers, mentor_with_submissions):
+    mentor, _ = mentor_with_submissions
+    response = client.get("/mentor/submitted-drafts/export?format=ndjson&gzip=true", headers=auth_headers(mentor))
+    assert response.headers["content-type"] == "application/gzip"
+    assert "submitted_drafts.ndjson.gz" in response.headers["content-disposition"]
+    assert len(gzip.decompress(response.content).splitlines()) == ROWS
+
+
+def test_export_is_not_shadowed_by_draft_lookup(client, auth_headers, db_session):
+    mentor = User(id=str(uuid4()), name="Mentor", email=f"m+{uuid4().hex[:8]}@example.com", role="mentor")
+    db_session.add(mentor)
+    db_session.commit()
+    response = client.get("/mentor/submitted-drafts/export", headers=auth_headers(mentor))
+    assert response.status_code == 200
+    assert response.text.strip() == "id,apprentice_id,apprentice_name,apprentice_email,last_question_id,updated_at,answers"
+
+
+def test_rows_are_read_in_cursor_batches(db_session, mentor_with_submissions):
+    _, apprentice = mentor_with_submissions
+    stmt = select(AssessmentDraft.id).where(AssessmentDraft.apprentice_id == apprentice.id)
+    batches = export.stream_rows(db_session, stmt, batch_size=100)
+    assert [len(batch) for batch in batches] == [100] * (ROWS // 100)
+
+
+def test_encoders_consume_batches_lazily():
+    consumed = []
+
+    def batches():
+        for i in range(3):
+            consumed.append(i)
+            yield [{"n": i}]
+
+    chunks = export.ndjson_chunks(batches(), lambda row: row)
+    assert next(chunks) == b'{"n": 0}\n'
+    assert consumed == [0]
+    assert b"".join(export.json_chunks(iter([]), dict)) == b"[\n]\n"
+    assert json.loads(b"".join(export.json_chunks(iter([[{"a": 1}], [{"a": 2}]]), dict))) == [{"a": 1}, {"a": 2}]
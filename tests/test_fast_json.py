@@ -0,0 +1,57 @@
+import json
+from datetime import datetime
+from typing import List
+from uuid import uuid4
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.models import AssessmentScoreHistory, User
+from app.models.assessment import Assessment
+from app.schemas.assessment_score_history import AssessmentScoreHistoryOut
+from app.services import fast_json
+
+
+@pytest.fixture
+def scored_apprentice(db_session):
+    apprentice = User(id=str(uuid4()), name="Apprentice", email=f"a+{uuid4().hex[:8]}@example.com", role="apprentice")
+    assessment = Assessment(id=str(uuid4()), apprentice_id=apprentice.id, answers={"q1": "a"})
+    history = [
+        AssessmentScoreHistory(
+            assessment_id=assessment.id, apprentice_id=apprentice.id, triggered_by="system",
+            score_data={"q1": {"score": i, "feedback": "Keep going ✓"}}, scored_at=datetime(2025, 1, i + 1, 9, 30, 0, 250),
+        )
+        for i in range(3)
+    ]
+    db_session.add_all([apprentice, assessment, *history])
+    db_session.commit()
+    return apprentice
+
+
+def test_trusted_score_history_matches_response_model(client, db_session, scored_apprentice, mentor_user, auth_headers):
+    response = client.get(f"/users/{scored_apprentice.id}/score-history?limit=2", headers=auth_headers(mentor_user))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    # Headers from the Conditional and Page dependencies survive the direct Response
+    assert response.headers["etag"].startswith('W/"')
+    assert "x-next-cursor" in response.headers
+
+    rows = db_session.query(AssessmentScoreHistory).filter_by(apprentice_id=scored_apprentice.id)\
+        .order_by(AssessmentScoreHistory.scored_at.desc()).limit(2).all()
+    adapter = TypeAdapter(List[AssessmentScoreHistoryOut])
+    validated = json.loads(adapter.dump_json(adapter.validate_python(rows, from_attributes=True)))
+    assert response.json() == validated
+
+
+def test_dumps_without_orjson_matches(monkeypatch):
+    payload = {"at": datetime(2025, 1, 1, 9, 30), "n": 1, "text": "ünïcode"}
+    fast = fast_json.dumps(payload)
+    monkeypatch.setattr(fast_json, "orjson", None)
+    assert fast_json.dumps(payload) == fast
+    assert json.loads(fast) == {"at": "2025-01-01T09:30:00", "n": 1, "text": "ünïcode"}
+
+
+def test_error_responses_use_fast_encoder(client, auth_headers, apprentice_user):
+    response = client.get(f"/users/{uuid4()}/score-history", headers=auth_headers(apprentice_user))
+    assert response.status_code == 403
+    assert response.json()["detail"]
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from app.models.assessment import Assessment
+from app.models.assessment_draft import AssessmentDraft
+from app.models.assessment_score_history import AssessmentScoreHistory
+from app.models.mentor_note import MentorNote
+from app.services import queries
+from app.services.pagination import Page, encode_cursor
+
+NOW = datetime(2025, 1, 1)
+
+
+def paged(stmt, *columns):
+    """``stmt`` as a route issues it for a follow-up page: keyset predicate, order and limit."""
+    page = Page(request=None, response=None, cursor=encode_cursor([NOW, "id"]), limit=50)
+    return page.apply(stmt, *columns)
+
+
+DRAFT_KEY = (AssessmentDraft.created_at, AssessmentDraft.id)
+ASSESSMENT_KEY = (Assessment.created_at, Assessment.id)
+HISTORY_KEY = (AssessmentScoreHistory.scored_at, AssessmentScoreHistory.id)
+NOTE_KEY = (MentorNote.created_at, MentorNote.id)
+
+# (index, statement, the listing comes straight off the index without a sort step)
+HOT_QUERIES = {
+    "in-progress draft": (
+        "ix_assessment_drafts_apprentice_submitted", queries.in_progress_draft("a"), True,
+    ),
+    "apprentice submitted drafts": (
+        "ix_assessment_drafts_submitted_created", paged(queries.submitted_drafts("a"), *DRAFT_KEY), True,
+    ),
+    # The mentor listing filters on apprentice_id IN (...): one index seek per
+    # apprentice, then only the matching rows are sorted
+    "mentor submitted drafts": (
+        "ix_assessment_drafts_submitted_created",
+        paged(queries.submitted_drafts(frozenset({"a", "b", "c"}), end_date=NOW), *DRAFT_KEY),
+        False,
+    ),
+    "apprentice assessments": (
+        "ix_assessments_apprentice_created", paged(queries.apprentice_assessments("a"), *ASSESSMENT_KEY), True,
+    ),
+    "assessment score history": (
+        "ix_score_history_assessment_scored", paged(queries.assessment_score_history("x"), *HISTORY_KEY), True,
+    ),
+    "apprentice score history": (
+        "ix_score_history_apprentice_scored", paged(queries.apprentice_score_history("a"), *HISTORY_KEY), True,
+    ),
+    "mentor's apprentice ids": (
+        "ix_mentor_apprentice_mentor_id", queries.mentor_apprentice_ids("m"), True,
+    ),
+    "assessment notes": (
+        "ix_mentor_notes_assessment_created", paged(queries.assessment_notes("x"), *NOTE_KEY), True,
+    ),
+    "shared assessment notes": (
+        "ix_mentor_notes_assessment_created", paged(queries.assessment_notes("x", shared_only=True), *NOTE_KEY), True,
+    ),
+    "pending invitation": (
+        "ix_apprentice_invitations_pending", queries.pending_invitation("a@example.com", "m", NOW), True,
+    ),
+    # Built once per publish; only ties on "order" are sorted by question id
+    "template questions": (
+        "ix_template_questions_template_order", queries.template_question_rows("t"), False,
+    ),
+}
+
+
+def _query_plan(db_session, stmt) -> str:
+    engine = db_session.get_bind()
+    compiled = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+@pytest.mark.parametrize("index_name, stmt, presorted", HOT_QUERIES.values(), ids=list(HOT_QUERIES))
+def test_hot_query_uses_index(db_session, index_name, stmt, presorted):
+    plan = _query_plan(db_session, stmt)
+    assert index_name in plan, plan
+    if presorted:
+        assert "TEMP B-TREE" not in plan, plan
+
+
+def test_partial_draft_index_skips_in_progress_drafts(db_session):
+    assert "ix_assessment_drafts_submitted_created" not in _query_plan(db_session, queries.in_progress_draft("a"))
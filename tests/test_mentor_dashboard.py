@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.models import AssessmentDraft, AssessmentTemplate, MentorApprentice, MentorNote, User
+from app.models.assessment import Assessment
+from app.services import apprentice_stats
+from app.services.mentorship import invalidate_mentor
+
+
+def _add_apprentice(db_session, mentor, name, assessments=0):
+    apprentice = User(id=str(uuid4()), name=name, email=f"{uuid4().hex[:8]}@example.com", role="apprentice")
+    db_session.add_all([apprentice, MentorApprentice(apprentice_id=apprentice.id, mentor_id=mentor.id)])
+    base = datetime(2025, 5, 1)
+    created = []
+    for i in range(assessments):
+        assessment = Assessment(
+            id=str(uuid4()), apprentice_id=apprentice.id, answers={"q1": "a"},
+            scores={"q1": 4 + i}, scoring_status="scored", created_at=base + timedelta(days=i),
+        )
+        db_session.add(assessment)
+        created.append(assessment)
+    db_session.commit()
+    return apprentice, created
+
+
+@pytest.fixture
+def dashboard_mentor(db_session, mentor_user):
+    template = AssessmentTemplate(id=str(uuid4()), name="Foundations")
+    db_session.add(template)
+    busy, assessments = _add_apprentice(db_session, mentor_user, "Ada", assessments=3)
+    quiet, _ = _add_apprentice(db_session, mentor_user, "Ben")
+    db_session.add_all([
+        AssessmentDraft(apprentice_id=busy.id, template_id=template.id, answers={"q1": "x", "q2": ""},
+                        updated_at=datetime(2025, 6, 2)),
+        AssessmentDraft(apprentice_id=busy.id, template_id=template.id, answers={}, updated_at=datetime(2025, 6, 1)),
+        AssessmentDraft(apprentice_id=busy.id, template_id=template.id, answers={"q1": "y"}, is_submitted=True),
+        MentorNote(assessment_id=assessments[0].id, mentor_id=mentor_user.id, content="Shared", is_private=False),
+        MentorNote(assessment_id=assessments[1].id, mentor_id=mentor_user.id, content="Shared", is_private=False),
+        MentorNote(assessment_id=assessments[1].id, mentor_id=mentor_user.id, content="Private", is_private=True),
+        MentorNote(assessment_id=assessments[2].id, mentor_id=mentor_user.id, content="Seen", is_private=False,
+                   read_at=datetime(2025, 6, 3)),
+    ])
+    db_session.commit()
+    apprentice_stats.rebuild_stats(db_session)
+    return mentor_user, busy, quiet, assessments
+
+
+def _count_selects(db_session, fn):
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return result, len([s for s in statements if s.lstrip().upper().startswith("SELECT")])
+
+
+def test_dashboard_summarises_every_apprentice(client, dashboard_mentor, auth_headers):
+    mentor, busy, quiet, assessments = dashboard_mentor
+
+    response = client.get("/mentor/dashboard", headers=auth_headers(mentor))
+
+    assert response.status_code == 200
+    ada, ben = response.json()["apprentices"]
+    assert (ada["id"], ben["id"]) == (busy.id, quiet.id)
+    assert ada["total_assessments"] == 3
+    assert ada["average_score"] == 5.0
+    assert ada["latest_assessment"]["id"] == assessments[-1].id
+    assert ada["latest_assessment"]["overall_score"] == 6.0
+    assert ada["open_draft_count"] == 2
+    assert ada["open_draft"]["answered_count"] == 1
+    assert ada["unread_notes"] == 2
+    assert ben == {
+        "id": quiet.id, "name": "Ben", "email": quiet.email,
+        "total_assessments": 0, "average_score": None, "last_submission": None, "category_scores": {},
+        "latest_assessment": None, "open_draft": None, "open_draft_count": 0, "unread_notes": 0,
+    }
+
+
+def test_dashboard_query_count_does_not_grow_with_apprentices(client, db_session, dashboard_mentor, auth_headers):
+    mentor = dashboard_mentor[0]
+    headers = auth_headers(mentor)
+    # Warm the auth and mentor-link caches
+    client.get("/mentor/dashboard", headers=headers)
+    _, before = _count_selects(db_session, lambda: client.get("/mentor/dashboard", headers=headers))
+
+    for i in range(5):
+        _add_apprentice(db_session, mentor, f"Extra {i}", assessments=2)
+    invalidate_mentor(mentor.id)
+    client.get("/mentor/dashboard", headers=headers)
+    response, after = _count_selects(db_session, lambda: client.get("/mentor/dashboard", headers=headers))
+
+    assert len(response.json()["apprentices"]) == 7
+    assert before == after == 4
+
+
+def test_dashboard_etag_revalidates(client, db_session, dashboard_mentor, auth_headers):
+    mentor, busy, _, assessments = dashboard_mentor
+    headers = auth_headers(mentor)
+
+    first = client.get("/mentor/dashboard", headers=headers)
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    unchanged = client.get("/mentor/dashboard", headers={**headers, "If-None-Match": f"W/{etag}"})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["etag"] == etag
+
+    # The apprentice reads their notes, so the dashboard changes
+    client.get(f"/apprentice/my-assessment/{assessments[1].id}/notes", headers=auth_headers(busy))
+    changed = client.get("/mentor/dashboard", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["apprentices"][0]["unread_notes"] == 1
+
+
+def test_apprentice_notes_hide_private_and_mark_read(client, db_session, dashboard_mentor, auth_headers):
+    _, busy, _, assessments = dashboard_mentor
+    url = f"/apprentice/my-assessment/{assessments[1].id}/notes"
+
+    first = client.get(url, headers=auth_headers(busy)).json()
+    assert [n["content"] for n in first] == ["Shared"]
+    assert first[0]["read_at"] is None
+
+    again = client.get(url, headers=auth_headers(busy)).json()
+    assert again[0]["read_at"] is not None
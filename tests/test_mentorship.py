@@ -0,0 +1,81 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.models.user import User
+from app.models.mentor_apprentice import MentorApprentice
+from app.services import mentorship
+
+
+def _user(db_session, role):
+    user = User(
+        id=str(uuid4()),
+        name=f"{role.title()} {uuid4().hex[:4]}",
+        email=f"{role}+{uuid4().hex[:8]}@example.com",
+        role=role,
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def link_queries():
+    # Sync and async routes share the cache; count queries on either engine
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM mentor_apprentice" in statement:
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(Engine, "before_cursor_execute", _record)
+
+
+def test_apprentice_set_is_loaded_once(client, db_session, auth_headers, link_queries):
+    mentor = _user(db_session, "mentor")
+    apprentice = _user(db_session, "apprentice")
+    stranger = _user(db_session, "apprentice")
+    db_session.add(MentorApprentice(mentor_id=mentor.id, apprentice_id=apprentice.id))
+    db_session.commit()
+    mentorship.invalidate_mentor(mentor.id)
+    headers = auth_headers(mentor)
+
+    response = client.get("/my-apprentices", headers=headers)
+    assert response.status_code == 200
+    assert [a["id"] for a in response.json()] == [apprentice.id]
+
+    assert client.get(f"/apprentice/{apprentice.id}/draft", headers=headers).status_code == 404
+    assert client.get(f"/apprentice/{stranger.id}/draft", headers=headers).status_code == 403
+    assert len(link_queries) == 1
+
+
+def test_assign_apprentice_invalidates_set(client, db_session):
+    mentor = _user(db_session, "mentor")
+    apprentice = _user(db_session, "apprentice")
+    assert not mentorship.is_mentor_of(db_session, mentor.id, apprentice.id)
+
+    response = client.post(
+        "/users/assign-apprentice",
+        params={"mentor_id": mentor.id, "apprentice_id": apprentice.id},
+    )
+    assert response.status_code == 200
+    assert mentorship.is_mentor_of(db_session, mentor.id, apprentice.id)
+
+
+
+def test_filter_authorized_batch(db_session):
+    mentor = _user(db_session, "mentor")
+    linked = [_user(db_session, "apprentice") for _ in range(2)]
+    other = _user(db_session, "apprentice")
+    for apprentice in linked:
+        db_session.add(MentorApprentice(mentor_id=mentor.id, apprentice_id=apprentice.id))
+    db_session.commit()
+    mentorship.invalidate_mentor(mentor.id)
+
+    ids = [a.id for a in linked] + [other.id]
+    assert mentorship.filter_authorized(db_session, mentor.id, ids) == {a.id for a in linked}
+    assert mentorship.filter_authorized(db_session, mentor.id) == {a.id for a in linked}
@@ -0,0 +1,87 @@
+import subprocess
+import sys
+
+import httpx
+from prometheus_client import REGISTRY
+
+from app.models import EmailOutbox
+from app.services.email_outbox import EmailDispatcher
+from app.services.metrics import UNMATCHED, route_template
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_requests_are_labelled_by_route_template(client, mentor_user, auth_headers):
+    route = "/mentor/my-apprentices/{apprentice_id}"
+    before = _sample("http_requests_total", method="GET", route=route, status="403")
+    queries_before = _sample("http_request_db_queries_sum", method="GET", route=route)
+
+    # Not this mentor's apprentice
+    response = client.get("/mentor/my-apprentices/not-a-real-id", headers=auth_headers(mentor_user))
+    assert response.status_code == 403
+
+    assert _sample("http_requests_total", method="GET", route=route, status="403") == before + 1
+    assert _sample("http_request_db_queries_sum", method="GET", route=route) > queries_before
+    assert _sample("http_requests_in_progress", method="GET", route=route) == 0
+    assert _sample("http_request_duration_seconds_count", method="GET", route=route) >= 1
+
+
+def test_unrouted_requests_share_one_label(client):
+    before = _sample("http_requests_total", method="GET", route=UNMATCHED, status="404")
+    client.get("/no/such/path/123")
+    assert _sample("http_requests_total", method="GET", route=UNMATCHED, status="404") == before + 1
+
+
+def test_route_template_restores_router_prefix():
+    class Route:
+        path_format = "/my-apprentices/{apprentice_id}"
+
+    scope = {"route": Route(), "path": "/mentor/my-apprentices/abc", "path_params": {"apprentice_id": "abc"}}
+    assert route_template(scope) == "/mentor/my-apprentices/{apprentice_id}"
+    assert route_template({"path": "/x"}) == UNMATCHED
+
+
+def test_metrics_endpoint(client):
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "http_request_duration_seconds_bucket" in response.text
+
+
+def test_email_send_latency_is_recorded():
+    statuses = iter([202, 500, 400])
+    transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses)))
+    dispatcher = EmailDispatcher(http_client=httpx.Client(transport=transport, base_url="https://sendgrid.test"))
+    message = EmailOutbox(to_email="a@example.com", subject="Hi", kind="invitation", html_content="<p>Hi</p>")
+    before = {outcome: _sample("email_send_seconds_count", outcome=outcome) for outcome in ("sent", "retry", "rejected")}
+
+    dispatcher.deliver(message)
+    for _ in range(2):
+        try:
+            dispatcher.deliver(message)
+        except Exception:
+            pass
+
+    for outcome in ("sent", "retry", "rejected"):
+        assert _sample("email_send_seconds_count", outcome=outcome) == before[outcome] + 1
+
+
+WORKER = """
+from app.services.metrics import REQUESTS
+REQUESTS.labels("GET", "/health/db-pool", "200").inc()
+"""
+
+SCRAPE = """
+from app.services.metrics import metrics_response
+print(metrics_response().body.decode())
+"""
+
+
+def test_multiprocess_workers_are_aggregated(tmp_path):
+    env = {"PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "OPENAI_API_KEY": "x", "ENV": "test", "PATH": ""}
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", WORKER], env=env, check=True)
+    scraped = subprocess.run([sys.executable, "-c", SCRAPE], env=env, check=True, capture_output=True, text=True).stdout
+    assert 'http_requests_total{method="GET",route="/health/db-pool",status="200"} 2.0' in scraped
@@ -0,0 +1,230 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import openai
+import pytest
+
+from app.services.openai_client import CircuitBreaker, CircuitOpenError, QueueTimeoutError, ScoringClient
+
+MESSAGES = [{"role": "user", "content": "q1: I pray"}]
+
+
+@pytest.fixture
+def fake_openai():
+    """Local stand-in for the chat completions endpoint.
+
+    ``state["statuses"]`` is consumed one status per request (200 once empty);
+    ``state["delay"]`` makes every request sleep before answering.
+    """
+    state = {"statuses": [], "delay": 0.0, "requests": 0, "active": 0, "max_active": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            with lock:
+                state["requests"] += 1
+                state["active"] += 1
+                state["max_active"] = max(state["max_active"], state["active"])
+                status = state["statuses"].pop(0) if state["statuses"] else 200
+            time.sleep(state["delay"])
+            if status == 200:
+                body = {
+                    "id": "chatcmpl-test",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": "gpt-4",
+                    "choices": [{
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": '{"q1": {"score": 7}}'},
+                    }],
+                }
+            else:
+                body = {"error": {"message": "upstream trouble", "type": "server_error"}}
+            payload = json.dumps(body).encode()
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1", state
+    server.shutdown()
+
+
+@pytest.fixture
+def make_client(fake_openai):
+    base_url, _ = fake_openai
+    clients = []
+
+    def _make(**kwargs):
+        kwargs.setdefault("retry_base_delay", 0.01)
+        client = ScoringClient(api_key="test", base_url=base_url, **kwargs)
+        clients.append(client)
+        return client
+
+    yield _make
+    for client in clients:
+        client.close()
+
+
+def test_complete_sync_returns_content_and_records_latency(make_client):
+    client = make_client()
+    content = client.complete_sync(MESSAGES, model="gpt-4", temperature=0.7)
+    assert json.loads(content) == {"q1": {"score": 7}}
+
+    stats = client.stats.snapshot()
+    assert stats["calls"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["latency_seconds_max"] > 0
+
+
+def test_complete_from_a_coroutine(make_client):
+    client = make_client()
+    content = asyncio.run(client.complete(MESSAGES, model="gpt-4", temperature=0.7))
+    assert "q1" in content
+
+
+def test_rate_limits_and_server_errors_are_retried(make_client, fake_openai):
+    _, state = fake_openai
+    state["statuses"] = [429, 503]
+    client = make_client(max_retries=3)
+
+    assert "q1" in client.complete_sync(MESSAGES, model="gpt-4", temperature=0.7)
+    assert state["requests"] == 3
+    assert client.stats.retries == 2
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_client_errors_are_not_retried(make_client, fake_openai):
+    _, state = fake_openai
+    state["statuses"] = [400]
+    client = make_client()
+
+    with pytest.raises(openai.BadRequestError):
+        client.complete_sync(MESSAGES, model="gpt-4", temperature=0.7)
+    assert state["requests"] == 1
+
+
+def test_concurrency_is_capped_across_threads(make_client, fake_openai):
+    _, state = fake_openai
+    state["delay"] = 0.1
+    client = make_client(max_concurrency=2)
+
+    threads = [
+        threading.Thread(target=client.complete_sync, args=(MESSAGES,), kwargs={"model": "gpt-4", "temperature": 0.7})
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert state["requests"] == 6
+    assert state["max_active"] <= 2
+
+
+def test_deadline_bounds_the_whole_call(make_client, fake_openai):
+    _, state = fake_openai
+    state["delay"] = 1.0
+    client = make_client(timeout=0.2)
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        client.complete_sync(MESSAGES, model="gpt-4", temperature=0.7)
+    assert time.monotonic() - start < 0.9
+    assert client.stats.snapshot()["in_flight"] == 0
+
+
+def test_waiting_for_a_slot_does_not_open_the_circuit(make_client, fake_openai):
+    _, state = fake_openai
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    client = make_client(timeout=0.1, max_concurrency=1, breaker=breaker)
+
+    async def queued_behind_a_busy_slot():
+        client._api()
+        await client._semaphore.acquire()
+        try:
+            await client._complete(model="gpt-4", messages=MESSAGES)
+        finally:
+            client._semaphore.release()
+
+    start = time.monotonic()
+    with pytest.raises(QueueTimeoutError):
+        asyncio.run(queued_behind_a_busy_slot())
+    assert time.monotonic() - start < 0.5
+    assert state["requests"] == 0
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert client.stats.snapshot()["queue_timeouts"] == 1
+
+
+def test_circuit_opens_and_fails_fast(make_client, fake_openai):
+    _, state = fake_openai
+    state["statuses"] = [500, 500]
+    client = make_client(max_retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+
+    for _ in range(2):
+        with pytest.raises(openai.InternalServerError):
+            client.complete_sync(MESSAGES, model="gpt-4", temperature=0.7)
+    with pytest.raises(CircuitOpenError):
+        client.complete_sync(MESSAGES, model="gpt-4", temperature=0.7)
+
+    assert state["requests"] == 2
+    assert client.stats.rejected == 1
+
+
+def test_breaker_half_open_trial_closes_circuit():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now[0] = 11
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_trial_is_settled_however_it_ends(make_client):
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    client = make_client(max_retries=0, breaker=breaker)
+
+    async def attempt_raising(exc):
+        async def _attempt(api, deadline, **kwargs):
+            raise exc
+        client._attempt = _attempt
+        await client._complete(model="gpt-4", messages=MESSAGES)
+
+    # Cancelled trial: no verdict, the next call may try again
+    breaker.record_failure()
+    now[0] = 11
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(attempt_raising(asyncio.CancelledError()))
+    assert breaker.allow()
+    breaker.record_failure()
+
+    # Malformed response: counts as a failure and re-opens the circuit
+    now[0] = 22
+    with pytest.raises(IndexError):
+        asyncio.run(attempt_raising(IndexError("no choices")))
+    assert breaker.state == CircuitBreaker.OPEN
+    now[0] = 33
+    assert breaker.allow()
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.models import AssessmentScoreHistory, Category, User
+from app.models.assessment import Assessment
+from app.services.pagination import MAX_LIMIT, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def apprentice_with_assessments(db_session):
+    apprentice = User(id=str(uuid4()), name="Apprentice", email=f"a+{uuid4().hex[:8]}@example.com", role="apprentice")
+    db_session.add(apprentice)
+    base = datetime(2025, 1, 1)
+    # Two rows share each timestamp so the id tie-breaker is exercised
+    assessments = [
+        Assessment(
+            id=str(uuid4()),
+            apprentice_id=apprentice.id,
+            answers={"q1": "a"},
+            created_at=base + timedelta(days=i // 2),
+        )
+        for i in range(7)
+    ]
+    db_session.add_all(assessments)
+    db_session.commit()
+    expected = sorted(assessments, key=lambda a: (a.created_at, a.id), reverse=True)
+    return apprentice, [a.id for a in expected]
+
+
+def _walk(client, url, headers, limit):
+    ids, pages = [], 0
+    next_url = f"{url}?limit={limit}"
+    while next_url:
+        response = client.get(next_url, headers=headers)
+        assert response.status_code == 200
+        ids.extend(item["id"] for item in response.json())
+        pages += 1
+        cursor = response.headers.get("x-next-cursor")
+        next_url = f"{url}?limit={limit}&cursor={cursor}" if cursor else None
+    return ids, pages
+
+
+def test_walks_every_page_in_order_without_duplicates(client, auth_headers, apprentice_with_assessments):
+    apprentice, expected = apprentice_with_assessments
+    ids, pages = _walk(client, "/apprentice/my-submitted-assessments", auth_headers(apprentice), limit=3)
+    assert ids == expected
+    assert pages == 3
+
+
+def test_link_header_points_at_next_page(client, auth_headers, apprentice_with_assessments):
+    apprentice, _ = apprentice_with_assessments
+    response = client.get("/apprentice/my-submitted-assessments?limit=5", headers=auth_headers(apprentice))
+    assert 'rel="next"' in response.headers["link"]
+    assert response.headers["x-next-cursor"] in response.headers["link"]
+
+    last = client.get("/apprentice/my-submitted-assessments?limit=50", headers=auth_headers(apprentice))
+    assert "x-next-cursor" not in last.headers
+
+
+def test_deep_pages_seek_instead_of_offset(client, db_session):
+    db_session.add_all([Category(name=f"cat-{uuid4().hex[:8]}") for _ in range(5)])
+    db_session.commit()
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM categories" in statement:
+            statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        _, pages = _walk(client, "/question/categories", {}, limit=2)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    assert len(statements) == pages > 1
+    assert all("categories.id > " in s for s in statements[1:])
+
+
+def test_limits_are_bounded_and_cursors_validated(client, auth_headers, apprentice_with_assessments):
+    apprentice, _ = apprentice_with_assessments
+    headers = auth_headers(apprentice)
+    assert client.get(f"/apprentice/my-submitted-assessments?limit={MAX_LIMIT + 1}", headers=headers).status_code == 422
+    assert client.get("/apprentice/my-submitted-assessments?cursor=not-a-cursor", headers=headers).status_code == 422
+
+
+def test_score_history_pages(client, auth_headers, db_session, apprentice_with_assessments):
+    apprentice, assessment_ids = apprentice_with_assessments
+    mentor = User(id=str(uuid4()), name="Mentor", email=f"m+{uuid4().hex[:8]}@example.com", role="mentor")
+    db_session.add(mentor)
+    db_session.add_all([
+        AssessmentScoreHistory(
+            assessment_id=assessment_ids[0],
+            apprentice_id=apprentice.id,
+            score_data={"q1": {"score": i}},
+            triggered_by="system",
+            scored_at=datetime(2025, 2, 1) + timedelta(hours=i),
+        )
+        for i in range(5)
+    ])
+    db_session.commit()
+
+    ids, pages = _walk(client, f"/users/{apprentice.id}/score-history", auth_headers(mentor), limit=2)
+    assert len(set(ids)) == 5
+    assert pages == 3
+
+
+def test_catalog_lists_page_by_id(client, db_session):
+    names = [f"cat-{uuid4().hex[:8]}" for _ in range(3)]
+    db_session.add_all([Category(name=name) for name in names])
+    db_session.commit()
+    total = db_session.query(Category).count()
+
+    ids, _ = _walk(client, "/question/categories", {}, limit=2)
+    assert ids == sorted(ids)
+    assert len(ids) == total
+
+
+def test_cursor_round_trips_datetimes():
+    when = datetime(2025, 3, 4, 5, 6, 7, 891011)
+    cursor = encode_cursor([when, "abc"])
+    assert decode_cursor(cursor, [Assessment.created_at, Assessment.id]) == [when, "abc"]
+
+
+def test_nullable_cursor_columns_are_rejected():
+    from sqlalchemy import select
+
+    from app.models.notification import Notification
+    from app.services.pagination import Page
+
+    page = Page(request=None, response=None, cursor=None, limit=10)
+    with pytest.raises(ValueError, match="created_at"):
+        page.apply(select(Notification), Notification.created_at, Notification.id)
+    # Every paginated listing's sort key is NOT NULL
+    page.apply(select(Assessment), Assessment.created_at, Assessment.id)
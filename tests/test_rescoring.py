@@ -0,0 +1,171 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import AssessmentScoreHistory, AssessmentTemplate, RescoreJob, User
+from app.models.assessment import Assessment
+from app.services import rescoring
+
+
+@pytest.fixture
+def template_assessments(db_session):
+    apprentice = User(id=str(uuid4()), name="Apprentice", email=f"a+{uuid4().hex[:8]}@example.com", role="apprentice")
+    template = AssessmentTemplate(id=str(uuid4()), name="Foundations")
+    assessments = [
+        Assessment(
+            id=f"{template.id}-{i}",
+            apprentice_id=apprentice.id,
+            template_id=template.id,
+            answers={"q1": f"answer {i}"},
+            scores={"q1": 1},
+        )
+        for i in range(5)
+    ]
+    db_session.add_all([apprentice, template, *assessments])
+    db_session.commit()
+    return template, [a.id for a in assessments]
+
+
+@pytest.fixture
+def session_factory(db_session):
+    return sessionmaker(bind=db_session.get_bind(), autoflush=False)
+
+
+def _score_ok(answers, **kw):
+    return {"q1": {"score": 9, "feedback": "Grown", "recommendation": "Disciple others"}}
+
+
+def test_rescore_template_writes_system_history_in_batches(db_session, template_assessments, session_factory, monkeypatch):
+    template, ids = template_assessments
+    monkeypatch.setattr(rescoring.ai_scoring, "score_assessment", _score_ok)
+    job = rescoring.create_rescore_job(db_session, "template", template.id, concurrency=2)
+    assert job.total == 5
+
+    finished = rescoring.run_rescore_job(job.id, session_factory=session_factory, batch_size=2)
+
+    assert finished.status == "succeeded"
+    assert (finished.processed, finished.failed) == (5, 0)
+    assert finished.checkpoint_id == ids[-1]
+    assert finished.percent_complete == 100.0
+    db_session.expire_all()
+    history = db_session.query(AssessmentScoreHistory).filter(AssessmentScoreHistory.assessment_id.in_(ids)).all()
+    assert len(history) == 5
+    assert {h.triggered_by for h in history} == {"system"}
+    assert db_session.get(Assessment, ids[0]).scores == {"q1": 9}
+
+
+def test_failed_batch_keeps_checkpoint_and_resume_finishes(db_session, template_assessments, session_factory, monkeypatch):
+    template, ids = template_assessments
+
+    def _upstream_down_after_first_batch(answers, **kw):
+        if answers["q1"] not in ("answer 0", "answer 1"):
+            raise RuntimeError("OpenAI circuit is open")
+        return _score_ok(answers)
+
+    monkeypatch.setattr(rescoring.ai_scoring, "score_assessment", _upstream_down_after_first_batch)
+    job = rescoring.create_rescore_job(db_session, "template", template.id)
+    failed = rescoring.run_rescore_job(job.id, session_factory=session_factory, batch_size=2)
+    assert failed.status == "failed"
+    assert failed.processed == 2
+    assert failed.checkpoint_id == ids[1]
+    assert rescoring.can_resume(failed)
+
+    monkeypatch.setattr(rescoring.ai_scoring, "score_assessment", _score_ok)
+    resumed = rescoring.run_rescore_job(job.id, session_factory=session_factory, batch_size=2)
+    assert resumed.status == "succeeded"
+    assert resumed.processed == 5
+    db_session.expire_all()
+    assert db_session.query(AssessmentScoreHistory).filter(AssessmentScoreHistory.assessment_id.in_(ids)).count() == 5
+
+
+def test_partial_failures_are_counted_and_skipped(db_session, template_assessments, session_factory, monkeypatch):
+    template, ids = template_assessments
+
+    def _one_bad_answer(answers, **kw):
+        if answers["q1"] == "answer 3":
+            return {}
+        return _score_ok(answers)
+
+    monkeypatch.setattr(rescoring.ai_scoring, "score_assessment", _one_bad_answer)
+    job = rescoring.create_rescore_job(db_session, "template", template.id)
+    finished = rescoring.run_rescore_job(job.id, session_factory=session_factory, batch_size=2)
+
+    assert finished.status == "succeeded"
+    assert (finished.processed, finished.failed) == (5, 1)
+    assert finished.failed_ids == [ids[3]]
+    assert finished.last_error == "Model returned no scores"
+    db_session.expire_all()
+    assert db_session.get(Assessment, ids[3]).scores == {"q1": 1}
+
+    # Resuming retries only the failed assessment
+    scored = []
+    monkeypatch.setattr(rescoring.ai_scoring, "score_assessment", lambda answers, **kw: scored.append(answers) or _score_ok(answers))
+    retried = rescoring.run_rescore_job(job.id, session_factory=session_factory, batch_size=2)
+    assert retried.status == "succeeded"
+    assert (retried.processed, retried.failed, retried.failed_ids) == (5, 0, [])
+    assert scored == [{"q1": "answer 3"}]
+    db_session.expire_all()
+    assert db_session.get(Assessment, ids[3]).scores == {"q1": 9}
+
+
+def test_rows_are_scored_with_a_session_for_the_db_cache(db_session, template_assessments, session_factory, monkeypatch):
+    template, _ = template_assessments
+    sessions = []
+    monkeypatch.setattr(
+        rescoring.ai_scoring, "score_assessment",
+        lambda answers, db=None, **kw: sessions.append(db) or _score_ok(answers),
+    )
+    job = rescoring.create_rescore_job(db_session, "template", template.id)
+    rescoring.run_rescore_job(job.id, session_factory=session_factory, batch_size=2)
+    assert len(sessions) == 5 and all(s is not None for s in sessions)
+
+
+def test_throttle_paces_to_target_rate():
+    now = [0.0]
+    slept = []
+
+    def _sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    throttle = rescoring.Throttle(per_minute=60, clock=lambda: now[0], sleep=_sleep)
+    throttle.wait(10)
+    assert slept == [10.0]
+    now[0] += 5
+    throttle.wait(10)
+    assert slept == [10.0, 5.0]
+
+
+def test_admin_rescore_endpoints(client, auth_headers, db_session, template_assessments, monkeypatch):
+    template, _ = template_assessments
+    admin = User(id=str(uuid4()), name="Admin", email=f"admin+{uuid4().hex[:8]}@example.com", role="admin")
+    db_session.add(admin)
+    db_session.commit()
+    started = []
+    monkeypatch.setattr(rescoring, "start_in_background", started.append)
+    headers = auth_headers(admin)
+
+    assert client.post("/admin/rescore", json={"scope": "template"}, headers=headers).status_code == 422
+    response = client.post("/admin/rescore", json={"scope": "template", "scope_id": template.id}, headers=headers)
+    assert response.status_code == 202
+    job = response.json()
+    assert job["total"] == 5 and job["status"] == "queued"
+    assert started == [job["id"]]
+
+    assert client.post(f"/admin/rescore/{job['id']}/pause", headers=headers).json()["status"] == "paused"
+    assert client.post(f"/admin/rescore/{job['id']}/resume", headers=headers).status_code == 202
+    assert started == [job["id"], job["id"]]
+
+    db_session.query(RescoreJob).filter_by(id=job["id"]).update({"status": "succeeded"})
+    db_session.commit()
+    assert client.post(f"/admin/rescore/{job['id']}/resume", headers=headers).status_code == 409
+    assert client.get(f"/admin/rescore/{job['id']}", headers=headers).json()["status"] == "succeeded"
+
+
+def test_rescore_requires_admin(client, auth_headers, db_session):
+    mentor = User(id=str(uuid4()), name="Mentor", email=f"m+{uuid4().hex[:8]}@example.com", role="mentor")
+    db_session.add(mentor)
+    db_session.commit()
+    response = client.post("/admin/rescore", json={"scope": "all"}, headers=auth_headers(mentor))
+    assert response.status_code == 403
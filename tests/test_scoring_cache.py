@@ -0,0 +1,156 @@
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.models.scoring_cache import ScoringCacheEntry
+from app.services import ai_scoring, scoring_cache
+
+
+class FakeOpenAI:
+    """Minimal stand-in for the scoring client's complete_sync."""
+
+    def __init__(self):
+        self.calls = []
+
+    def complete_sync(self, messages, model, temperature):
+        self.calls.append(messages)
+        lines = messages[-1]["content"].split("\n")[1:]
+        questions = [line.split(":", 1)[0] for line in lines]
+        return json.dumps({
+            q: {"score": 7, "feedback": "ok", "recommendation": "keep going"} for q in questions
+        })
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = FakeOpenAI()
+    monkeypatch.setattr(ai_scoring, "client", client)
+    scoring_cache.clear_memory()
+    yield client
+    scoring_cache.clear_memory()
+
+
+def test_rescoring_unchanged_answers_hits_memory(fake_client):
+    answers = {"q1": f"I pray daily {uuid4().hex}", "q2": "Weekly"}
+    before = scoring_cache.scoring_cache_stats()
+
+    first = ai_scoring.score_assessment(answers)
+    reordered = {"q2": "  Weekly ", "q1": answers["q1"]}
+    second = ai_scoring.score_assessment(reordered)
+
+    assert first == second
+    assert len(fake_client.calls) == 1
+    after = scoring_cache.scoring_cache_stats()
+    assert after["memory_hits"] - before["memory_hits"] == 2
+    assert after["misses"] - before["misses"] == 2
+
+
+def test_db_cache_survives_process_restart(fake_client, db_session):
+    answers = {"q1": f"Serving at church {uuid4().hex}"}
+    ai_scoring.score_assessment(answers, db=db_session)
+    db_session.commit()
+
+    scoring_cache.clear_memory()
+    ai_scoring.score_assessment(answers, db=db_session)
+    db_session.commit()
+
+    assert len(fake_client.calls) == 1
+    key = scoring_cache.answer_key(
+        "q1", answers["q1"], ai_scoring.MODEL, ai_scoring.PROMPT_VERSION, ai_scoring.TEMPERATURE,
+    )
+    assert db_session.get(ScoringCacheEntry, key).hit_count == 1
+
+
+def test_memory_hits_keep_the_db_row_fresh_for_eviction(fake_client, db_session):
+    answers = {"q1": f"Leading worship {uuid4().hex}"}
+    ai_scoring.score_assessment(answers, db=db_session)
+    key = scoring_cache.answer_key(
+        "q1", answers["q1"], ai_scoring.MODEL, ai_scoring.PROMPT_VERSION, ai_scoring.TEMPERATURE,
+    )
+    stale = datetime.utcnow() - timedelta(days=30)
+    db_session.query(ScoringCacheEntry).filter_by(key=key).update({"last_used_at": stale})
+    db_session.commit()
+
+    # Within the touch interval memory hits don't write
+    ai_scoring.score_assessment(answers, db=db_session)
+    db_session.commit()
+    db_session.expire_all()
+    assert db_session.get(ScoringCacheEntry, key).last_used_at == stale
+
+    scoring_cache._touched.clear()
+    ai_scoring.score_assessment(answers, db=db_session)
+    db_session.commit()
+    db_session.expire_all()
+    assert db_session.get(ScoringCacheEntry, key).last_used_at > stale
+    assert len(fake_client.calls) == 1
+
+
+def test_prompt_version_and_bypass_miss_the_cache(fake_client, monkeypatch):
+    answers = {"q1": f"Fasting {uuid4().hex}"}
+    ai_scoring.score_assessment(answers)
+    monkeypatch.setattr(ai_scoring, "PROMPT_VERSION", "next")
+    ai_scoring.score_assessment(answers)
+    ai_scoring.score_assessment(answers, use_cache=False)
+    assert len(fake_client.calls) == 3
+
+
+def test_only_changed_answers_are_sent_for_scoring(fake_client):
+    tag = uuid4().hex
+    answers = {"q1": f"Prayer {tag}", "q2": f"Scripture {tag}", "q3": f"Service {tag}"}
+    ai_scoring.score_assessment(answers)
+
+    edited = dict(answers, q2=f"Scripture reading every morning {tag}")
+    result = ai_scoring.score_assessment(edited)
+
+    assert list(result) == ["q1", "q2", "q3"]
+    assert len(fake_client.calls) == 2
+    resent = fake_client.calls[-1][-1]["content"]
+    assert "q2:" in resent
+    assert "q1:" not in resent and "q3:" not in resent
+
+
+def test_unscored_answers_are_not_cached(fake_client, monkeypatch):
+    answers = {"q1": f"Giving {uuid4().hex}"}
+    monkeypatch.setattr(ai_scoring, "_request_scores", lambda answers: {})
+    with pytest.raises(ai_scoring.IncompleteScoresError):
+        ai_scoring.score_assessment(answers)
+    monkeypatch.undo()
+    monkeypatch.setattr(ai_scoring, "client", fake_client)
+    assert "q1" in ai_scoring.score_assessment(answers)
+    assert len(fake_client.calls) == 1
+
+
+def test_evict_drops_stale_and_trims_to_max_rows(db_session):
+    db_session.query(ScoringCacheEntry).delete()
+    now = datetime.utcnow()
+    prefix = uuid4().hex[:8]
+    db_session.add_all([
+        ScoringCacheEntry(key=f"{prefix}-old", model="gpt-4", prompt_version="v", result={}, last_used_at=now - timedelta(days=400)),
+        *[
+            ScoringCacheEntry(key=f"{prefix}-{i}", model="gpt-4", prompt_version="v", result={}, last_used_at=now - timedelta(minutes=i))
+            for i in range(3)
+        ],
+    ])
+    db_session.commit()
+
+    scoring_cache.evict(db_session, max_age_days=365, max_rows=2)
+    remaining = {k for (k,) in db_session.query(ScoringCacheEntry.key).all()}
+    assert remaining == {f"{prefix}-0", f"{prefix}-1"}
+
+
+def test_partial_results_raise_and_keep_the_scored_answers(fake_client, monkeypatch):
+    answers = {"q1": f"Prayer {uuid4().hex}", "q2": f"Service {uuid4().hex}"}
+    monkeypatch.setattr(ai_scoring, "_request_scores", lambda answers: {
+        "q1": {"score": 6, "feedback": "ok", "recommendation": "pray"},
+        "q2": {"feedback": "no score"},
+    })
+    with pytest.raises(ai_scoring.IncompleteScoresError) as excinfo:
+        ai_scoring.score_assessment(answers)
+    assert excinfo.value.missing == ["q2"]
+
+    monkeypatch.undo()
+    monkeypatch.setattr(ai_scoring, "client", fake_client)
+    assert set(ai_scoring.score_assessment(answers)) == {"q1", "q2"}
+    assert "q1:" not in fake_client.calls[-1][-1]["content"]
@@ -0,0 +1,227 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import (
+    AssessmentDraft, AssessmentScoreHistory, AssessmentTemplate, EmailOutbox, MentorApprentice,
+    Notification, ScoringJob, User,
+)
+from app.models.assessment import Assessment
+from app.services import scoring_queue
+
+SCORES = {
+    "q1": {"score": 8, "feedback": "Consistent", "recommendation": "Lead a group"},
+    "q2": {"score": 4, "feedback": "Irregular", "recommendation": "Build a reading plan"},
+}
+
+
+@pytest.fixture
+def apprentice_with_draft(db_session):
+    mentor = User(id=str(uuid4()), name="Mentor", email=f"m+{uuid4().hex[:8]}@example.com", role="mentor")
+    apprentice = User(id=str(uuid4()), name="Apprentice", email=f"a+{uuid4().hex[:8]}@example.com", role="apprentice")
+    template = AssessmentTemplate(id=str(uuid4()), name="Foundations")
+    draft = AssessmentDraft(
+        id=str(uuid4()),
+        apprentice_id=apprentice.id,
+        template_id=template.id,
+        answers={"q1": "I pray daily", "q2": "Sometimes"},
+    )
+    db_session.add_all([mentor, apprentice, template, draft])
+    db_session.add(MentorApprentice(mentor_id=mentor.id, apprentice_id=apprentice.id))
+    db_session.commit()
+    return mentor, apprentice
+
+
+@pytest.fixture
+def pool(db_session):
+    return scoring_queue.ScoringWorkerPool(
+        session_factory=sessionmaker(bind=db_session.get_bind(), autoflush=False),
+        concurrency=1,
+    )
+
+
+def _submit(client, auth_headers, apprentice):
+    response = client.post("/assessment-drafts/assessment-drafts/submit", headers=auth_headers(apprentice))
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_submit_returns_pending_and_worker_scores(client, auth_headers, apprentice_with_draft, pool, db_session, monkeypatch):
+    mentor, apprentice = apprentice_with_draft
+    calls = []
+    monkeypatch.setattr(scoring_queue.ai_scoring, "score_assessment", lambda answers, **kw: calls.append(answers) or SCORES)
+
+    body = _submit(client, auth_headers, apprentice)
+    assert body["scoring_status"] == "pending"
+    assert calls == []
+
+    status = client.get(f"/assessments/{body['id']}/scoring-status", headers=auth_headers(apprentice)).json()
+    assert status["job"]["status"] == "queued"
+
+    assert pool.run_once("test-worker") is True
+    assert pool.run_once("test-worker") is False
+
+    db_session.expire_all()
+    assessment = db_session.get(Assessment, body["id"])
+    assert assessment.scoring_status == "scored"
+    assert assessment.scores == {"q1": 8, "q2": 4}
+    assert assessment.recommendation == "Build a reading plan"
+    history = db_session.query(AssessmentScoreHistory).filter_by(assessment_id=body["id"]).all()
+    assert len(history) == 1 and history[0].triggered_by == "system"
+    assert db_session.query(Notification).filter_by(user_id=apprentice.id).count() == 1
+    queued = db_session.query(EmailOutbox).filter_by(dedupe_key=f"assessment-results:{body['id']}").one()
+    assert queued.to_email == mentor.email
+    assert queued.status == "pending"
+    assert "Foundations" in queued.subject
+
+    status = client.get(f"/assessments/{body['id']}/scoring-status", headers=auth_headers(mentor)).json()
+    assert status["scoring_status"] == "scored"
+    assert status["job"]["status"] == "succeeded"
+
+
+def test_failed_job_retries_with_backoff_then_fails(client, auth_headers, apprentice_with_draft, pool, db_session, monkeypatch):
+    _, apprentice = apprentice_with_draft
+
+    def _boom(answers, **kw):
+        raise RuntimeError("upstream timeout")
+
+    monkeypatch.setattr(scoring_queue.ai_scoring, "score_assessment", _boom)
+    body = _submit(client, auth_headers, apprentice)
+
+    assert pool.run_once("test-worker") is True
+    db_session.expire_all()
+    job = db_session.query(ScoringJob).filter_by(assessment_id=body["id"]).one()
+    assert job.status == "queued"
+    assert job.attempts == 1
+    assert job.run_after > datetime.utcnow()
+    assert pool.run_once("test-worker") is False
+
+    job.max_attempts = 2
+    job.run_after = datetime.utcnow()
+    db_session.commit()
+    assert pool.run_once("test-worker") is True
+
+    db_session.expire_all()
+    assert job.status == "failed"
+    assert job.last_error == "upstream timeout"
+    assert db_session.get(Assessment, body["id"]).scoring_status == "failed"
+    # The raw exception text stays server-side
+    status = client.get(f"/assessments/{body['id']}/scoring-status", headers=auth_headers(apprentice)).json()
+    assert status["job"]["last_error"] == "Scoring could not be completed"
+
+
+def test_a_job_is_claimed_only_once(client, auth_headers, apprentice_with_draft, pool, db_session):
+    _, apprentice = apprentice_with_draft
+    _submit(client, auth_headers, apprentice)
+
+    first = pool.session_factory()
+    second = pool.session_factory()
+    try:
+        assert scoring_queue.claim_job(first, "worker-a") is not None
+        assert scoring_queue.claim_job(second, "worker-b") is None
+    finally:
+        first.close()
+        second.close()
+
+
+def test_failure_after_scoring_rolls_back_and_retries(client, auth_headers, apprentice_with_draft, pool, db_session, monkeypatch):
+    _, apprentice = apprentice_with_draft
+    monkeypatch.setattr(scoring_queue.ai_scoring, "score_assessment", lambda answers, **kw: SCORES)
+
+    def _broken_history(db, **kw):
+        raise RuntimeError("history insert failed")
+
+    monkeypatch.setattr(scoring_queue, "save_score_history", _broken_history)
+    body = _submit(client, auth_headers, apprentice)
+    assert pool.run_once("test-worker") is True
+
+    db_session.expire_all()
+    job = db_session.query(ScoringJob).filter_by(assessment_id=body["id"]).one()
+    assert job.status == "queued"
+    assert job.locked_by is None
+    assert job.last_error == "history insert failed"
+    assessment = db_session.get(Assessment, body["id"])
+    assert assessment.scoring_status == "pending"
+    assert assessment.scores in (None, {})
+    assert db_session.query(Notification).filter_by(user_id=apprentice.id).count() == 0
+
+
+def test_worker_loop_requeues_stale_jobs(client, auth_headers, apprentice_with_draft, pool, db_session, monkeypatch):
+    _, apprentice = apprentice_with_draft
+    body = _submit(client, auth_headers, apprentice)
+    job = db_session.query(ScoringJob).filter_by(assessment_id=body["id"]).one()
+    job.status = "running"
+    job.locked_by = "dead-worker"
+    job.locked_at = datetime.utcnow() - timedelta(seconds=scoring_queue.STALE_JOB_SECONDS + 60)
+    db_session.commit()
+
+    monkeypatch.setattr(scoring_queue.scoring_cache, "evict", lambda db: 0)
+    pool.maintain()
+
+    db_session.expire_all()
+    assert job.status == "queued"
+    assert job.locked_by is None
+
+
+def test_stale_job_out_of_attempts_is_failed_not_requeued(client, auth_headers, apprentice_with_draft, db_session):
+    _, apprentice = apprentice_with_draft
+    body = _submit(client, auth_headers, apprentice)
+    job = db_session.query(ScoringJob).filter_by(assessment_id=body["id"]).one()
+    job.status = "running"
+    job.attempts = job.max_attempts
+    job.locked_by = "dead-worker"
+    job.locked_at = datetime.utcnow() - timedelta(seconds=scoring_queue.STALE_JOB_SECONDS + 60)
+    db_session.commit()
+
+    assert scoring_queue.requeue_stale_jobs(db_session) == 1
+
+    db_session.expire_all()
+    assert job.status == "failed"
+    assert job.locked_by is None
+    assert db_session.get(Assessment, body["id"]).scoring_status == "failed"
+
+
+def test_job_for_deleted_assessment_is_failed(client, auth_headers, apprentice_with_draft, pool, db_session):
+    _, apprentice = apprentice_with_draft
+    body = _submit(client, auth_headers, apprentice)
+    db_session.execute(Assessment.__table__.delete().where(Assessment.id == body["id"]))
+    db_session.commit()
+
+    while pool.run_once("test-worker"):
+        pass
+
+    db_session.expire_all()
+    job = db_session.query(ScoringJob).filter_by(assessment_id=body["id"]).one()
+    assert job.status == "failed"
+    assert job.last_error == "Assessment no longer exists"
+
+
+def test_missing_feedback_fields_do_not_fail_scoring(client, auth_headers, apprentice_with_draft, pool, db_session, monkeypatch):
+    mentor, apprentice = apprentice_with_draft
+    sparse = {"q1": {"score": 8, "feedback": "Consistent"}, "q2": {"score": 4, "recommendation": "Build a reading plan"}}
+    monkeypatch.setattr(scoring_queue.ai_scoring, "score_assessment", lambda answers, **kw: sparse)
+    body = _submit(client, auth_headers, apprentice)
+
+    while pool.run_once("test-worker"):
+        pass
+
+    db_session.expire_all()
+    assert db_session.query(ScoringJob).filter_by(assessment_id=body["id"]).one().status == "succeeded"
+    assert db_session.query(EmailOutbox).filter_by(to_email=mentor.email).count() == 1
+
+
+def test_partial_scores_are_retried_not_reported(client, auth_headers, apprentice_with_draft, pool, db_session, monkeypatch):
+    _, apprentice = apprentice_with_draft
+    monkeypatch.setattr(scoring_queue.ai_scoring, "_request_scores", lambda answers: {"q1": SCORES["q1"]})
+    scoring_queue.scoring_cache.clear_memory()
+    body = _submit(client, auth_headers, apprentice)
+    while pool.run_once("test-worker"):
+        pass
+
+    db_session.expire_all()
+    job = db_session.query(ScoringJob).filter_by(assessment_id=body["id"]).one()
+    assert job.status == "queued"
+    assert "q2" in job.last_error
+    assert db_session.get(Assessment, body["id"]).scoring_status == "pending"
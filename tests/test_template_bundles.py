@@ -0,0 +1,184 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.models import AssessmentTemplate, AssessmentTemplateQuestion, Category, Question, User
+
+
+@pytest.fixture
+def admin_headers(db_session, auth_headers):
+    admin = User(id=str(uuid4()), name="Admin", email=f"admin+{uuid4().hex[:8]}@example.com", role="admin")
+    db_session.add(admin)
+    db_session.commit()
+    return auth_headers(admin)
+
+
+@pytest.fixture
+def template_with_questions(db_session):
+    category = Category(id=str(uuid4()), name=f"Prayer {uuid4().hex[:6]}")
+    questions = [Question(id=str(uuid4()), text=f"Question {i}", category_id=category.id) for i in range(3)]
+    template = AssessmentTemplate(id=str(uuid4()), name="Foundations", description="Start here")
+    db_session.add_all([category, template, *questions])
+    # Linked out of order to check the bundle is sorted
+    for order, question in zip((2, 1), questions[:2]):
+        db_session.add(AssessmentTemplateQuestion(template_id=template.id, question_id=question.id, order=order))
+    db_session.commit()
+    return template, questions, category
+
+
+def _selects_on(db_session, table, fn):
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return result, [s for s in statements if table in s]
+
+
+def test_publish_and_serve_versioned_bundle(client, db_session, template_with_questions, admin_headers, auth_headers, apprentice_user):
+    template, questions, category = template_with_questions
+    headers = auth_headers(apprentice_user)
+    assert client.get(f"/templates/{template.id}", headers=headers).status_code == 404
+
+    published = client.post(f"/admin/templates/{template.id}/publish", headers=admin_headers)
+    assert published.status_code == 200
+    assert published.json()["version"] == 1
+
+    current = client.get(f"/templates/{template.id}", headers=headers)
+    assert current.status_code == 200
+    assert current.headers["cache-control"] == "private, no-cache"
+    assert current.headers["content-location"] == f"/templates/{template.id}/versions/1"
+    bundle = current.json()
+    assert [q["id"] for q in bundle["questions"]] == [questions[1].id, questions[0].id]
+    assert bundle["categories"] == [{"id": category.id, "name": category.name}]
+
+    versioned = client.get(f"/templates/{template.id}/versions/1", headers=headers)
+    assert versioned.headers["cache-control"] == "private, max-age=31536000, immutable"
+    assert versioned.headers["etag"] == published.json()["etag"]
+    cached = client.get(
+        f"/templates/{template.id}/versions/1", headers={**headers, "If-None-Match": versioned.headers["etag"]}
+    )
+    assert cached.status_code == 304
+
+
+def test_republish_adds_version_and_keeps_old_one(client, db_session, template_with_questions, admin_headers, auth_headers, apprentice_user):
+    template, questions, _ = template_with_questions
+    headers = auth_headers(apprentice_user)
+    client.post(f"/admin/templates/{template.id}/publish", headers=admin_headers)
+    client.post(f"/admin/templates/{template.id}/questions", json={"question_id": questions[2].id, "order": 3},
+                headers=admin_headers)
+
+    assert client.post(f"/admin/templates/{template.id}/publish", headers=admin_headers).json()["version"] == 2
+    assert len(client.get(f"/templates/{template.id}", headers=headers).json()["questions"]) == 3
+    assert len(client.get(f"/templates/{template.id}/versions/1", headers=headers).json()["questions"]) == 2
+    assert client.get(f"/templates/{template.id}/versions/3", headers=headers).status_code == 404
+
+
+def test_publish_requires_questions(client, db_session, admin_headers):
+    template = AssessmentTemplate(id=str(uuid4()), name="Empty")
+    db_session.add(template)
+    db_session.commit()
+    assert client.post(f"/admin/templates/{template.id}/publish", headers=admin_headers).status_code == 400
+
+
+def test_legacy_published_template_is_snapshotted_on_first_use(client, db_session, template_with_questions, auth_headers, apprentice_user):
+    template, _, _ = template_with_questions
+    template.is_published = True
+    db_session.commit()
+
+    response = client.get(f"/templates/{template.id}", headers=auth_headers(apprentice_user))
+    assert response.status_code == 200
+    assert response.headers["x-template-version"] == "1"
+
+
+def test_first_use_snapshot_does_not_commit_the_callers_writes(db_session, template_with_questions):
+    from app.services.template_bundles import current_version
+
+    template, _, _ = template_with_questions
+    template.is_published = True
+    db_session.commit()
+
+    staged = Category(id=str(uuid4()), name=f"Staged {uuid4().hex[:6]}")
+    db_session.add(staged)
+    assert current_version(db_session, template.id) == 1
+    db_session.rollback()
+
+    assert db_session.get(Category, staged.id) is None
+    assert db_session.get(AssessmentTemplate, template.id, populate_existing=True).version == 1
+
+
+def test_concurrent_first_reads_share_one_snapshot(client, db_session, template_with_questions, auth_headers, apprentice_user, monkeypatch):
+    from sqlalchemy.orm import sessionmaker
+
+    from app.services import template_bundles
+
+    template, _, _ = template_with_questions
+    template.is_published = True
+    db_session.commit()
+    build_bundle = template_bundles.build_bundle
+
+    def other_worker_publishes_first(db, template, version):
+        # Another worker snapshots the template between our read and our insert
+        monkeypatch.setattr(template_bundles, "build_bundle", build_bundle)
+        other = sessionmaker(bind=db_session.get_bind())()
+        try:
+            template_bundles.publish_template(other, other.get(AssessmentTemplate, template.id))
+        finally:
+            other.close()
+        return build_bundle(db, template, version)
+
+    monkeypatch.setattr(template_bundles, "build_bundle", other_worker_publishes_first)
+    response = client.get(f"/templates/{template.id}", headers=auth_headers(apprentice_user))
+    assert response.status_code == 200
+    assert response.headers["x-template-version"] == "1"
+
+
+def test_autosave_serves_pinned_bundle_from_cache(client, db_session, template_with_questions, admin_headers, auth_headers, apprentice_user):
+    template, questions, _ = template_with_questions
+    headers = auth_headers(apprentice_user)
+    client.post(f"/admin/templates/{template.id}/publish", headers=admin_headers)
+
+    started = client.post(f"/assessment-drafts/assessment-drafts/start?template_id={template.id}", headers=headers)
+    assert started.status_code == 200
+    assert started.json()["template_version"] == 1
+    assert len(started.json()["questions"]) == 2
+
+    # A newer version does not change the questions of a draft in progress
+    client.post(f"/admin/templates/{template.id}/questions", json={"question_id": questions[2].id, "order": 3},
+                headers=admin_headers)
+    client.post(f"/admin/templates/{template.id}/publish", headers=admin_headers)
+
+    payload = {"template_id": template.id, "answers": {questions[1].id: "Daily"}, "last_question_id": questions[1].id}
+    saved, bundle_queries = _selects_on(
+        db_session, "template_bundles",
+        lambda: client.post("/assessment-drafts/assessment-drafts", json=payload, headers=headers),
+    )
+    assert saved.status_code == 200
+    assert [q["id"] for q in saved.json()["questions"]] == [questions[1].id, questions[0].id]
+    assert saved.json()["is_complete"] is False
+    assert bundle_queries == []
+
+
+def test_autosave_completeness_uses_cached_required_questions(client, db_session, template_with_questions, admin_headers, auth_headers, apprentice_user):
+    template, questions, _ = template_with_questions
+    headers = auth_headers(apprentice_user)
+    client.post(f"/admin/templates/{template.id}/publish", headers=admin_headers)
+    payload = {"template_id": template.id, "answers": {questions[1].id: "Daily"}, "last_question_id": questions[1].id}
+    assert client.post("/assessment-drafts/assessment-drafts", json=payload, headers=headers).json()["is_complete"] is False
+
+    payload["answers"][questions[0].id] = "Weekly"
+    saved, question_queries = _selects_on(
+        db_session, "FROM questions",
+        lambda: client.post("/assessment-drafts/assessment-drafts", json=payload, headers=headers),
+    )
+    assert saved.json()["is_complete"] is True
+    assert question_queries == []
+    # Completing the answers doesn't submit: the draft stays open until /submit queues it for scoring
+    assert saved.json()["is_submitted"] is False
+    submitted = client.post("/assessment-drafts/assessment-drafts/submit", headers=headers)
+    assert submitted.status_code == 200
+    assert submitted.json()["scoring_status"] == "pending"
@@ -0,0 +1,145 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta, UTC
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from jose import jwt
+
+from app.services.token_verifier import (
+    FirebaseTokenVerifier,
+    InvalidTokenError,
+    PublicKeyStore,
+    fetch_public_keys,
+)
+
+PROJECT_ID = "trooth-test"
+
+
+def _make_key_and_cert():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken.test")])
+    now = datetime.now(UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    return key_pem, cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    return _make_key_and_cert()
+
+
+@pytest.fixture
+def key_server(signing_key):
+    """Local stand-in for Google's x509 key endpoint."""
+    _, cert_pem = signing_key
+    state = {"requests": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["requests"] += 1
+            body = json.dumps({"kid-1": cert_pem}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Cache-Control", "public, max-age=3600, must-revalidate")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/certs", state
+    server.shutdown()
+
+
+def _token(signing_key, kid="kid-1", **overrides):
+    key_pem, _ = signing_key
+    now = int(time.time())
+    claims = {
+        "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+        "aud": PROJECT_ID,
+        "sub": "user-123",
+        "email": "user@example.com",
+        "iat": now - 10,
+        "auth_time": now - 10,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, key_pem, algorithm="RS256", headers={"kid": kid})
+
+
+def test_fetch_public_keys_reads_max_age(key_server):
+    url, _ = key_server
+    certs, max_age = fetch_public_keys(url)
+    assert "kid-1" in certs
+    assert max_age == 3600
+
+
+def test_verify_caches_keys_and_claims(key_server, signing_key):
+    url, state = key_server
+    verifier = FirebaseTokenVerifier(PROJECT_ID, key_store=PublicKeyStore(url=url))
+    token = _token(signing_key)
+
+    claims = verifier.verify(token)
+    assert claims["uid"] == "user-123"
+    assert claims["email"] == "user@example.com"
+
+    verifier.verify(token)
+    verifier.verify(_token(signing_key, sub="user-456"))
+    assert state["requests"] == 1
+    assert verifier.cache.hits == 1
+
+
+def test_verify_rejects_bad_tokens(key_server, signing_key):
+    url, _ = key_server
+    verifier = FirebaseTokenVerifier(PROJECT_ID, key_store=PublicKeyStore(url=url))
+
+    with pytest.raises(InvalidTokenError):
+        verifier.verify(_token(signing_key, aud="other-project"))
+    with pytest.raises(InvalidTokenError):
+        verifier.verify(_token(signing_key, exp=int(time.time()) - 60))
+    with pytest.raises(InvalidTokenError):
+        verifier.verify(_token(signing_key, kid="unknown-kid"))
+
+    other_key = _make_key_and_cert()
+    with pytest.raises(InvalidTokenError):
+        verifier.verify(_token(other_key))
+
+
+def test_claims_cache_is_bounded_and_expires(signing_key):
+    _, cert_pem = signing_key
+    store = PublicKeyStore(fetch=lambda url: ({"kid-1": cert_pem}, 3600))
+    verifier = FirebaseTokenVerifier(PROJECT_ID, key_store=store, cache_size=2)
+
+    tokens = [_token(signing_key, sub=f"user-{i}") for i in range(3)]
+    for token in tokens:
+        verifier.verify(token)
+    assert len(verifier.cache) == 2
+    assert verifier.cache.get(tokens[0]) is None
+
+    short_lived = _token(signing_key, exp=int(time.time()) + 1)
+    verifier.verify(short_lived)
+    time.sleep(1.1)
+    assert verifier.cache.get(short_lived) is None
@@ -0,0 +1,82 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.user import User
+from app.services import auth as auth_service
+
+
+@pytest.fixture
+def user_queries(db_session):
+    engine = db_session.get_bind()
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def apprentice(db_session, monkeypatch):
+    user = User(
+        id=str(uuid4()),
+        name="Cached Apprentice",
+        email=f"cached+{uuid4().hex[:8]}@example.com",
+        role="apprentice",
+    )
+    db_session.add(user)
+    db_session.commit()
+    claims = {"uid": user.id, "email": user.email}
+    monkeypatch.setattr(auth_service, "verify_id_token", lambda token: dict(claims))
+    yield user
+    auth_service.invalidate_user(user.id)
+
+
+def test_current_user_is_cached_across_requests(apprentice, user_queries):
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer firebase-token"}
+
+    first = client.get("/apprentice/me", headers=headers)
+    assert first.status_code == 200
+    assert first.json()["id"] == apprentice.id
+    assert len(user_queries) == 1
+
+    second = client.get("/apprentice/me", headers=headers)
+    assert second.status_code == 200
+    assert len(user_queries) == 1
+
+
+def test_invalidate_user_forces_reload(apprentice, db_session, user_queries):
+    user_id = apprentice.id
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer firebase-token"}
+    assert client.get("/apprentice/me", headers=headers).status_code == 200
+
+    db_session.query(User).filter_by(id=user_id).update({"role": "mentor"})
+    db_session.commit()
+    assert client.get("/apprentice/me", headers=headers).status_code == 200
+
+    auth_service.invalidate_user(user_id)
+    assert client.get("/apprentice/me", headers=headers).status_code == 403
+    assert len(user_queries) == 2
+
+
+def test_demoted_admin_loses_admin_routes_despite_cached_role(db_session, auth_headers):
+    admin = User(id=str(uuid4()), name="Admin", email=f"admin+{uuid4().hex[:8]}@example.com", role="admin")
+    db_session.add(admin)
+    db_session.commit()
+    client = TestClient(app)
+    headers = auth_headers(admin)
+    assert client.get("/admin/templates", headers=headers).status_code == 200
+
+    # Demoted by another worker: this worker's cache still says admin
+    db_session.query(User).filter_by(id=admin.id).update({"role": "mentor"})
+    db_session.commit()
+    assert client.get("/admin/templates", headers=headers).status_code == 403